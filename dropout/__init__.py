@@ -0,0 +1 @@
+"""Modul pendukung Dashboard Dropout Mahasiswa (data, model, dan scoring)."""
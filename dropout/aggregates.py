@@ -0,0 +1,103 @@
+"""Ringkasan (agregat) untuk halaman Overview dan Visualisasi.
+
+Agregat dihitung sekali per versi dataset, disimpan di memori proses dan di
+``.cache/`` sehingga proses baru tidak perlu menghitung ulang groupby/korelasi.
+"""
+import pickle
+import threading
+from dataclasses import dataclass
+
+import pandas as pd
+
+from .charts import box_table
+from .config import CACHE_DIR, TARGET_COL
+from .fsutil import atomic_write
+
+# Naikkan jika isi/perhitungan agregat berubah agar cache lama di disk diabaikan
+SCHEMA_VERSION = 2
+
+STATUS_MEAN_COLS = ['Age at enrollment', 'Admission grade', 'Curricular units 1st sem (grade)']
+CATEGORICAL_FEATURES = ['Gender', 'Debtor', 'Application mode']
+BOX_FEATURES = ['Age at enrollment', 'Curricular units 1st sem (approved)', 'Tuition fees up to date']
+
+
+@dataclass(frozen=True)
+class Aggregates:
+    version: str
+    total: int
+    dropout_rate: float
+    # Jumlah mahasiswa per (Course Name, Status): kolom Course Name, Status, Count
+    course_status: pd.DataFrame
+    # Rata-rata STATUS_MEAN_COLS per Status (dibulatkan 2 desimal)
+    status_means: pd.DataFrame
+    # Korelasi tiap kolom numerik terhadap Target, terurut naik
+    target_corr: pd.Series
+    # Persentase Status per kategori fitur (format long: fitur, Status, Persentase)
+    category_status: dict
+    # Statistik box plot (kuartil/whisker) per Status untuk tiap BOX_FEATURES
+    status_boxes: dict
+
+
+def compute_aggregates(ip, version):
+    course_status = (ip.groupby(['Course Name', 'Status'], observed=True)
+                     .size().reset_index(name='Count'))
+    status_means = ip.groupby('Status', observed=True)[STATUS_MEAN_COLS].mean().round(2)
+    target_corr = ip.corr(numeric_only=True)[TARGET_COL].drop(TARGET_COL).sort_values()
+
+    category_status = {}
+    for feature in CATEGORICAL_FEATURES:
+        # Tabel kontingensi lalu persentase per kategori
+        prop_table = ip.groupby([feature, 'Status'], observed=True).size().unstack(fill_value=0)
+        prop_percent = prop_table.div(prop_table.sum(axis=1), axis=0) * 100
+        category_status[feature] = prop_percent.reset_index().melt(
+            id_vars=feature, var_name='Status', value_name='Persentase')
+
+    status_boxes = {feature: box_table(ip, feature, 'Status') for feature in BOX_FEATURES}
+
+    return Aggregates(
+        version=version,
+        total=len(ip),
+        dropout_rate=float((ip[TARGET_COL] == 0).mean() * 100),
+        course_status=course_status,
+        status_means=status_means,
+        target_corr=target_corr,
+        category_status=category_status,
+        status_boxes=status_boxes,
+    )
+
+
+def cache_path(version):
+    return CACHE_DIR / f"aggregates-v{SCHEMA_VERSION}-{version}.pkl"
+
+
+_lock = threading.Lock()
+_memory = {}
+
+
+def get_aggregates(dataset):
+    """Agregat untuk ``dataset`` (lihat ``dropout.data.Dataset``): memori -> disk -> hitung."""
+    with _lock:
+        aggregates = _memory.get(dataset.version)
+        if aggregates is not None:
+            return aggregates
+
+        path = cache_path(dataset.version)
+        try:
+            with open(path, 'rb') as f:
+                aggregates = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            aggregates = compute_aggregates(dataset.frame, dataset.version)
+
+            def dump(tmp):
+                with open(tmp, 'wb') as f:
+                    pickle.dump(aggregates, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            try:
+                atomic_write(path, dump)
+            except OSError:
+                # Cache disk hanya optimasi; filesystem read-only tetap boleh
+                pass
+
+        _memory.clear()
+        _memory[dataset.version] = aggregates
+        return aggregates
@@ -0,0 +1,256 @@
+"""Benchmark tahap-tahap utama dashboard: load, preprocessing, training, prediksi, dan render halaman.
+
+Jalankan:
+    python -m dropout.bench [--scales 1 10 100] [--repeat 3] [--output bench.json]
+    python -m dropout.bench --compare bench-lama.json [--tolerance 0.2]
+
+Setiap tahap diukur waktu (median dari ``--repeat`` kali) dan puncak memori
+(tracemalloc: alokasi Python/NumPy, diukur pada putaran pemanasan tersendiri
+agar overhead tracing tidak masuk ke waktu).
+Skala > 1 memakai data sintetis dari ``dropout.synth`` (distribusi ``data.csv``).
+Hasil disimpan sebagai JSON berikut commit git, sehingga bisa dibandingkan
+antar commit dengan ``--compare``.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .config import BASE_DIR, DATA_PATH, FEATURE_COLS, MODEL_PATH, TARGET_COL
+
+STAGES = (
+    'csv_parse', 'preprocess', 'train', 'predict_single', 'predict_bulk',
+    'aggregates', 'page_overview', 'page_visualisasi', 'page_prediksi', 'page_rekomendasi',
+)
+# SVC eksak O(n^2): tahap train dilewati untuk dataset yang lebih besar dari ini
+DEFAULT_MAX_TRAIN_ROWS = 20_000
+
+
+def scaled_csv(source, scale, output, seed=42):
+    """Tulis dataset sintetis ``scale`` kali ukuran ``source`` (lihat ``dropout.synth``)."""
+    from . import synth
+
+    with open(source, encoding='utf-8') as f:
+        rows = sum(1 for _ in f) - 1
+    return synth.write_csv(synth.fit(source), rows * scale, output, seed=seed)
+
+
+def measure(fn, repeat=3):
+    """(median detik, min detik, puncak MB) untuk ``fn()``.
+
+    Putaran tracemalloc dijalankan lebih dulu (sekaligus pemanasan import/cache
+    lazy). Dengan ``repeat=0`` waktu diambil dari putaran itu saja, untuk tahap
+    yang terlalu mahal diulang.
+    """
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        fn()
+        traced_seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    times = times or [traced_seconds]
+    return statistics.median(times), min(times), peak / 2**20
+
+
+def _plotly_payload(*figures):
+    # Streamlit mengirim figure sebagai JSON; serialisasi ikut dihitung
+    return sum(len(fig.to_json()) for fig in figures)
+
+
+def _stage_functions(ctx, max_train_rows):
+    """Dict nama tahap -> fungsi tanpa argumen; data yang dibutuhkan disiapkan di ``ctx``."""
+    import plotly.express as px
+    from sklearn.model_selection import train_test_split
+
+    from .aggregates import BOX_FEATURES, CATEGORICAL_FEATURES, compute_aggregates
+    from .cache import PredictionCache
+    from .charts import box_figure, correlation_png, histogram_figure
+    from .data import add_derived_columns, clean_dataset, parse_csv
+    from .filters import FilterIndex, cohort_summary
+    from .recommendations import recommend
+    from .scoring import score_frame
+    from .train import build_pipeline
+
+    path, frame, artifact = ctx['path'], ctx['frame'], ctx['artifact']
+    agg = compute_aggregates(frame, 'bench')
+    record = frame[FEATURE_COLS].iloc[0]
+
+    def train():
+        X_train, _, y_train, _ = train_test_split(frame[FEATURE_COLS], frame[TARGET_COL],
+                                                  stratify=frame[TARGET_COL], random_state=42)
+        build_pipeline(random_state=42).fit(X_train, y_train)
+
+    def page_overview():
+        fig = px.bar(agg.course_status, x='Course Name', y='Count', color='Status', barmode='group')
+        return _plotly_payload(fig)
+
+    def page_visualisasi():
+        correlation_png(agg.target_corr)
+        figures = [box_figure(agg.status_boxes[f]) for f in BOX_FEATURES]
+        figures.append(px.bar(agg.course_status, x='Course Name', y='Count', color='Status'))
+        figures += [px.bar(agg.category_status[f], x=f, y='Persentase', color='Status', barmode='stack')
+                    for f in CATEGORICAL_FEATURES]
+        return _plotly_payload(*figures)
+
+    def page_prediksi():
+        # Cache baru: selalu miss, seperti input form yang belum pernah dilihat
+        return PredictionCache().predict_proba(artifact, record)
+
+    def page_rekomendasi():
+        scored = frame.join(score_frame(artifact, frame))
+        scored = scored.join(recommend(scored))
+        cohort = FilterIndex(scored, ['Risk Category', 'Course Name'])
+        summary = cohort.summary({}, cohort_summary)
+        payment = summary.payment_counts
+        figures = [
+            px.pie(names=['Belum Bayar', 'Sudah Bayar'],
+                   values=payment.iloc[:, 0] if 0 in payment.columns else [0, 0]),
+            histogram_figure(summary.grade_hist),
+            px.bar(summary.scholarship_counts.reset_index(), x='Scholarship holder',
+                   y=list(summary.scholarship_counts.columns), barmode='group'),
+            box_figure(summary.age_box),
+            histogram_figure(summary.admission_hist),
+        ]
+        return _plotly_payload(*figures)
+
+    stages = {
+        'csv_parse': lambda: parse_csv(path),
+        'preprocess': lambda: add_derived_columns(clean_dataset(ctx['raw'])),
+        'train': train if len(frame) <= max_train_rows else None,
+        'predict_single': lambda: artifact.predict_proba(record.to_frame().T),
+        'predict_bulk': lambda: artifact.predict_proba(frame),
+        'aggregates': lambda: compute_aggregates(frame, 'bench'),
+        'page_overview': page_overview,
+        'page_visualisasi': page_visualisasi,
+        'page_prediksi': page_prediksi,
+        'page_rekomendasi': page_rekomendasi,
+    }
+    return stages
+
+
+def run_suite(scales=(1, 10, 100), stages=STAGES, repeat=3, max_train_rows=DEFAULT_MAX_TRAIN_ROWS,
+              data_path=DATA_PATH, model_path=MODEL_PATH, seed=42, progress=None):
+    """Jalankan semua tahap untuk tiap skala; kembalikan list dict hasil per (dataset, tahap)."""
+    from .data import add_derived_columns, clean_dataset, parse_csv
+    from .model import load_artifact
+
+    artifact = load_artifact(model_path)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in scales:
+            path = Path(data_path) if scale == 1 else scaled_csv(
+                data_path, scale, Path(tmp) / f"data-x{scale}.csv", seed)
+            raw = parse_csv(path)
+            ctx = {'path': path, 'raw': raw, 'frame': add_derived_columns(clean_dataset(raw)),
+                   'artifact': artifact}
+            functions = _stage_functions(ctx, max_train_rows)
+            for stage in stages:
+                row = {'dataset': f"x{scale}", 'rows': len(ctx['frame']), 'stage': stage}
+                fn = functions[stage]
+                if fn is None:
+                    row.update(seconds=None, min_seconds=None, peak_mb=None,
+                               note=f"dilewati: lebih dari {max_train_rows} baris")
+                else:
+                    # Training cukup sekali per skala; tahap lain diulang
+                    median, fastest, peak = measure(fn, 0 if stage == 'train' else repeat)
+                    row.update(seconds=median, min_seconds=fastest, peak_mb=peak)
+                results.append(row)
+                if progress is not None:
+                    progress(row)
+    return results
+
+
+def environment():
+    import sklearn
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=BASE_DIR, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'sklearn': sklearn.__version__,
+    }
+
+
+def compare(baseline, current, tolerance=0.2, min_delta=0.005):
+    """Tabel perbandingan waktu per (dataset, tahap) dan daftar tahap yang melambat > ``tolerance``.
+
+    Selisih di bawah ``min_delta`` detik dianggap noise (tahap beberapa milidetik).
+    """
+    before = {(r['dataset'], r['stage']): r for r in baseline['results']}
+    rows, regressions = [], []
+    for r in current['results']:
+        old = before.get((r['dataset'], r['stage']))
+        if old is None or old['seconds'] is None or r['seconds'] is None:
+            continue
+        ratio = r['seconds'] / old['seconds'] if old['seconds'] else float('inf')
+        rows.append({'dataset': r['dataset'], 'stage': r['stage'], 'before_s': old['seconds'],
+                     'after_s': r['seconds'], 'ratio': ratio})
+        if ratio > 1 + tolerance and r['seconds'] - old['seconds'] > min_delta:
+            regressions.append(f"{r['dataset']}/{r['stage']}")
+    return pd.DataFrame(rows), regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark tahap-tahap dashboard prediksi dropout.")
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100],
+                        help="Kelipatan ukuran data.csv yang diuji.")
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=list(STAGES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--max-train-rows', type=int, default=DEFAULT_MAX_TRAIN_ROWS)
+    parser.add_argument('--output', default='bench.json')
+    parser.add_argument('--compare', help="JSON hasil benchmark sebelumnya sebagai pembanding.")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="Perlambatan relatif yang masih diterima saat --compare (0.2 = 20%%).")
+    args = parser.parse_args(argv)
+
+    def progress(row):
+        if row['seconds'] is None:
+            print(f"  {row['dataset']:>5} {row['stage']:<18} {row['note']}")
+        else:
+            print(f"  {row['dataset']:>5} {row['stage']:<18} {row['seconds'] * 1000:10.1f} ms "
+                  f"{row['peak_mb']:8.1f} MB  ({row['rows']} baris)")
+
+    report = {'environment': environment(),
+              'results': run_suite(args.scales, args.stages, args.repeat, args.max_train_rows,
+                                   progress=progress)}
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    print(f"Hasil disimpan ke {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        table, regressions = compare(baseline, report, args.tolerance)
+        print(table.to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+        if regressions:
+            print(f"Melambat lebih dari {args.tolerance:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Cache LRU prediksi per input, dipakai bersama semua sesi dalam satu proses."""
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+
+def normalize_input(record, feature_cols):
+    """Key cache: nilai fitur (urut ``feature_cols``) sebagai float yang dibulatkan."""
+    return tuple(round(float(record[c]), 6) for c in feature_cols)
+
+
+class PredictionCache:
+    """LRU terbatas untuk hasil ``predict_proba`` satu record.
+
+    Key mencakup versi model; begitu artefak dengan versi lain dipakai,
+    seluruh isi cache dibuang otomatis.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.model_version = None
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def predict_proba(self, artifact, record):
+        """Probabilitas semua kelas untuk ``record`` (dict fitur), dari cache bila ada."""
+        key = normalize_input(record, artifact.feature_cols)
+        return self._lookup(artifact, key, lambda: self._predict(artifact, key))
+
+    @staticmethod
+    def _predict(artifact, key):
+        frame = pd.DataFrame([key], columns=artifact.feature_cols)
+        proba = artifact.predict_proba(frame)[0]
+        proba.flags.writeable = False
+        return proba
+
+    def _lookup(self, artifact, key, compute):
+        """Nilai ter-cache untuk ``key``; saat miss, ``compute()`` dipanggil di luar lock."""
+        with self._lock:
+            if artifact.version != self.model_version:
+                self._data.clear()
+                self.model_version = artifact.version
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+
+        value = compute()
+
+        with self._lock:
+            if artifact.version == self.model_version:
+                self._data[key] = value
+                self._data.move_to_end(key)
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'model_version': self.model_version,
+            }
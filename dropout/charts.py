@@ -0,0 +1,184 @@
+"""Histogram dan box plot dari ringkasan yang dihitung di server (NumPy).
+
+Alih-alih mengirim semua baris ke browser (``px.histogram``/``px.box``), grafik
+dibangun dari jumlah per bin dan statistik kuartil/whisker per grup sehingga
+ukuran payload Plotly tidak bergantung jumlah mahasiswa.
+
+Laporan ukuran payload sebelum/sesudah:
+    python -m dropout.charts [--scale 1 10 100]
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+DEFAULT_BINS = 40
+
+
+def histogram_table(frame, value_col, group_col, bins=DEFAULT_BINS):
+    """Jumlah baris per (grup, bin) dengan tepi bin yang sama untuk semua grup."""
+    values = frame[value_col].to_numpy(dtype=float)
+    groups, group_idx = np.unique(frame[group_col].to_numpy(), return_inverse=True)
+    if len(values) == 0:
+        return pd.DataFrame(columns=['group', 'left', 'right', 'count'])
+    edges = np.histogram_bin_edges(values, bins=bins)
+    n_bins = len(edges) - 1
+    bin_idx = np.clip(np.searchsorted(edges, values, side='right') - 1, 0, n_bins - 1)
+    counts = np.bincount(group_idx * n_bins + bin_idx, minlength=len(groups) * n_bins)
+    return pd.DataFrame({
+        'group': np.repeat(groups, n_bins),
+        'left': np.tile(edges[:-1], len(groups)),
+        'right': np.tile(edges[1:], len(groups)),
+        'count': counts,
+    })
+
+
+def box_table(frame, value_col, group_col):
+    """Kuartil, whisker Tukey (1.5 IQR), mean, dan jumlah baris per grup."""
+    rows = []
+    for group, values in frame.groupby(group_col, observed=True, sort=True)[value_col]:
+        values = np.sort(values.to_numpy(dtype=float))
+        q1, median, q3 = np.percentile(values, [25, 50, 75])
+        iqr = q3 - q1
+        inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+        rows.append({
+            'group': group, 'q1': q1, 'median': median, 'q3': q3,
+            'lowerfence': inside[0], 'upperfence': inside[-1],
+            'mean': values.mean(), 'n': len(values),
+        })
+    return pd.DataFrame(rows, columns=['group', 'q1', 'median', 'q3', 'lowerfence', 'upperfence', 'mean', 'n'])
+
+
+def _group_colors(groups, color_map=None, color_sequence=None):
+    if color_map is not None:
+        return [color_map.get(g) for g in groups]
+    if color_sequence is not None:
+        return [color_sequence[i % len(color_sequence)] for i in range(len(groups))]
+    return [None] * len(groups)
+
+
+def histogram_figure(table, title=None, x_title=None, legend_title=None, barmode='overlay',
+                     color_map=None, color_sequence=None):
+    fig = go.Figure()
+    groups = list(dict.fromkeys(table['group']))
+    for group, color in zip(groups, _group_colors(groups, color_map, color_sequence)):
+        part = table[table['group'] == group]
+        fig.add_bar(
+            x=((part['left'] + part['right']) / 2).to_numpy(),
+            y=part['count'].to_numpy(),
+            width=(part['right'] - part['left']).to_numpy(),
+            name=str(group),
+            marker_color=color,
+            opacity=0.6 if barmode == 'overlay' else None,
+        )
+    fig.update_layout(title=title, barmode=barmode, bargap=0, legend_title_text=legend_title,
+                      xaxis_title=x_title, yaxis_title='count')
+    return fig
+
+
+def box_figure(table, title=None, x_title=None, y_title=None, color_map=None, color_sequence=None):
+    fig = go.Figure()
+    groups = list(table['group'])
+    for (_, row), color in zip(table.iterrows(), _group_colors(groups, color_map, color_sequence)):
+        name = str(row['group'])
+        fig.add_trace(go.Box(
+            x=[name], name=name, marker_color=color, boxmean=True,
+            q1=[row['q1']], median=[row['median']], q3=[row['q3']],
+            lowerfence=[row['lowerfence']], upperfence=[row['upperfence']], mean=[row['mean']],
+        ))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title, legend_title_text=x_title)
+    return fig
+
+
+# Lebar PNG dijaga di bawah batas lebar konten Streamlit (1460 px) agar ``st.image``
+# mengirim bytes apa adanya, tanpa decode + resize per rerun
+CORRELATION_DPI = 140
+
+
+def correlation_png(target_corr, dpi=CORRELATION_DPI):
+    """Bar chart horizontal korelasi fitur terhadap Target sebagai PNG (bytes).
+
+    Memakai ``matplotlib.figure.Figure`` langsung (tanpa state global pyplot) sehingga
+    aman dipanggil dari thread sesi mana pun; crop sama dengan ``st.pyplot``.
+    """
+    import io
+
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(8, 12))
+    ax = fig.subplots()
+    target_corr.plot(kind='barh', ax=ax, color='skyblue')
+    ax.set_title("Korelasi terhadap Target (Dropout/Graduate/Enrolled)")
+    ax.set_xlabel("Nilai Korelasi")
+    ax.set_ylabel("Fitur")
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+    return buffer.getvalue()
+
+
+def sensitivity_figure(curves, baseline, current=None, title=None, y_title='Probabilitas dropout', cols=3):
+    """Satu panel per fitur dari kurva what-if (lihat ``dropout.whatif``).
+
+    Garis putus-putus horizontal = probabilitas input asli; garis vertikal = nilai input
+    asli fitur itu (``current``, dict fitur -> nilai).
+    """
+    from plotly.subplots import make_subplots
+
+    features = list(curves['feature'].cat.categories)
+    rows = -(-len(features) // cols)
+    fig = make_subplots(rows=rows, cols=cols, subplot_titles=features, shared_yaxes=True,
+                        vertical_spacing=0.18)
+    for i, feature in enumerate(features):
+        row, col = divmod(i, cols)
+        part = curves[curves['feature'] == feature]
+        fig.add_scatter(x=part['value'].to_numpy(), y=part['probability'].to_numpy(), name=feature,
+                        mode='lines+markers' if len(part) <= 2 else 'lines', showlegend=False,
+                        row=row + 1, col=col + 1)
+        fig.add_hline(y=baseline, line_dash='dash', line_color='gray', row=row + 1, col=col + 1)
+        if current is not None:
+            fig.add_vline(x=float(current[feature]), line_dash='dot', line_color='red', row=row + 1, col=col + 1)
+    fig.update_yaxes(range=[0, 1])
+    fig.update_yaxes(title_text=y_title, col=1)
+    fig.update_layout(title=title, height=320 * rows)
+    return fig
+
+
+def payload_report(frame, scales=(1, 10)):
+    """Ukuran JSON Plotly (byte) grafik raw-row vs grafik ringkasan untuk beberapa skala data."""
+    import plotly.express as px
+
+    charts = {
+        'hist Admission grade': ('Admission grade', 'Target'),
+        'hist Curricular units 1st sem (grade)': ('Curricular units 1st sem (grade)', 'Target'),
+        'box Age at enrollment': ('Age at enrollment', 'Status'),
+        'box Curricular units 1st sem (approved)': ('Curricular units 1st sem (approved)', 'Status'),
+    }
+    rows = []
+    for scale in scales:
+        data = pd.concat([frame] * scale, ignore_index=True)
+        for name, (value_col, group_col) in charts.items():
+            if name.startswith('hist'):
+                before = px.histogram(data, x=value_col, color=group_col, barmode='overlay')
+                after = histogram_figure(histogram_table(data, value_col, group_col))
+            else:
+                before = px.box(data, x=group_col, y=value_col, color=group_col)
+                after = box_figure(box_table(data, value_col, group_col))
+            rows.append({'chart': name, 'rows': len(data),
+                         'before_bytes': len(before.to_json()), 'after_bytes': len(after.to_json())})
+    return pd.DataFrame(rows)
+
+
+def main(argv=None):
+    from .data import load_dataset
+
+    parser = argparse.ArgumentParser(description="Bandingkan ukuran payload grafik raw-row vs ringkasan.")
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10],
+                        help="Kelipatan data.csv yang diuji.")
+    args = parser.parse_args(argv)
+    report = payload_report(load_dataset().frame, args.scale)
+    print(report.to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
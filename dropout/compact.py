@@ -0,0 +1,320 @@
+"""Artefak model ringkas (hanya NumPy) untuk SVC RBF + StandardScaler.
+
+Format: magic ``DRSVM001``, panjang header (uint64), header JSON (versi model,
+gamma, kelas, offset array), lalu array yang di-align 64 byte: mean &
+scale scaler, support vector, koefisien dual, intercept, parameter Platt
+(probA/probB), dan jumlah support vector per kelas. File dibaca dengan
+``np.memmap``, jadi memuat model tidak membutuhkan unpickle maupun import
+scikit-learn.
+
+``CompactSVM.predict_proba`` mengulang perhitungan libsvm: kernel RBF, nilai
+keputusan one-vs-one, sigmoid Platt per pasangan kelas, lalu pairwise coupling
+(Wu, Lin & Weng) seperti ``SVC.predict_proba``.
+
+Jalankan:
+    python -m dropout.compact export [--model dropout_prediction_svm_model.joblib] [--dtype float32]
+    python -m dropout.compact check [--max-load-ms 250] [--max-kb 160] [--atol 1e-6]
+
+``check`` keluar dengan kode 1 jika ukuran file, waktu load cold start (proses baru),
+atau selisih probabilitas terhadap pipeline scikit-learn melewati anggaran.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from .config import BASE_DIR, MODEL_PATH
+
+MAGIC = b'DRSVM001'
+ALIGN = 64
+ARRAYS = ('mean', 'scale', 'support_vectors', 'dual_coef', 'intercept', 'prob_a', 'prob_b', 'n_support')
+# Baris per batch kernel: matriks kernel batch x n_SV tetap kecil untuk scoring massal
+BATCH_ROWS = 1024
+# Konstanta libsvm (svm.cpp: svm_predict_probability / multiclass_probability)
+MIN_PROB = 1e-7
+MAX_COUPLING_ITER = 100
+
+DEFAULT_MAX_LOAD_MS = 250
+DEFAULT_MAX_KB = 160
+DEFAULT_ATOL = 1e-6
+
+
+def compact_path(path):
+    return Path(path).with_suffix('.compact')
+
+
+def _pad(n):
+    return (-n) % ALIGN
+
+
+@dataclass(frozen=True)
+class CompactSVM:
+    gamma: float
+    classes_: np.ndarray
+    mean: np.ndarray
+    scale: np.ndarray
+    support_vectors: np.ndarray
+    dual_coef: np.ndarray
+    intercept: np.ndarray
+    prob_a: np.ndarray
+    prob_b: np.ndarray
+    n_support: np.ndarray
+
+    def _decision(self, X):
+        """Nilai keputusan one-vs-one (n_baris x n_pasangan), urutan pasangan sama dengan libsvm."""
+        X = (X - self.mean) / self.scale
+        sv = self.support_vectors
+        sq_dist = (X ** 2).sum(axis=1)[:, None] - 2 * X @ sv.T + (sv ** 2).sum(axis=1)[None, :]
+        kernel = np.exp(-self.gamma * np.maximum(sq_dist, 0))
+        starts = np.concatenate([[0], np.cumsum(self.n_support)])
+        n_class = len(self.n_support)
+        columns = []
+        for i in range(n_class):
+            for j in range(i + 1, n_class):
+                si, sj = slice(starts[i], starts[i + 1]), slice(starts[j], starts[j + 1])
+                columns.append(kernel[:, si] @ self.dual_coef[j - 1, si]
+                               + kernel[:, sj] @ self.dual_coef[i, sj])
+        return np.stack(columns, axis=1) + self.intercept
+
+    def predict_proba(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        # Sama dengan check_array scikit-learn, agar kedua backend menolak input yang sama
+        if np.isnan(X).any():
+            raise ValueError("Input X contains NaN.")
+        if not np.isfinite(X).all():
+            raise ValueError("Input X contains infinity or a value too large for dtype('float64').")
+        if not len(X):
+            return np.empty((0, len(self.classes_)))
+        return np.concatenate([self._predict_batch(X[start:start + BATCH_ROWS])
+                               for start in range(0, len(X), BATCH_ROWS)])
+
+    def _predict_batch(self, X):
+        f = self._decision(X) * self.prob_a + self.prob_b
+        # Sigmoid Platt yang stabil secara numerik, seperti sigmoid_predict libsvm
+        e = np.exp(-np.abs(f))
+        pairwise = np.where(f >= 0, e / (1 + e), 1 / (1 + e))
+        pairwise = np.clip(pairwise, MIN_PROB, 1 - MIN_PROB)
+        n_class = len(self.n_support)
+        r = np.zeros((len(X), n_class, n_class))
+        pair = 0
+        for i in range(n_class):
+            for j in range(i + 1, n_class):
+                r[:, i, j] = pairwise[:, pair]
+                r[:, j, i] = 1 - pairwise[:, pair]
+                pair += 1
+        return _pairwise_coupling(r)
+
+
+def _pairwise_coupling(r):
+    """multiclass_probability libsvm, divektorisasi per baris (baris yang konvergen berhenti diperbarui)."""
+    n, k, _ = r.shape
+    Q = -r.transpose(0, 2, 1) * r
+    diag = (r ** 2).sum(axis=1) - np.einsum('nii->ni', r) ** 2
+    idx = np.arange(k)
+    Q[:, idx, idx] = diag
+    p = np.full((n, k), 1.0 / k)
+    eps = 0.005 / k
+    active = np.ones(n, dtype=bool)
+    for _ in range(max(MAX_COUPLING_ITER, k)):
+        Qp = np.einsum('nij,nj->ni', Q, p)
+        pQp = (p * Qp).sum(axis=1)
+        active &= np.abs(Qp - pQp[:, None]).max(axis=1) >= eps
+        if not active.any():
+            break
+        a = np.flatnonzero(active)
+        pa, Qpa, pQpa, Qa = p[a], Qp[a], pQp[a], Q[a]
+        for t in range(k):
+            diff = (-Qpa[:, t] + pQpa) / Qa[:, t, t]
+            pa[:, t] += diff
+            pQpa = (pQpa + diff * (diff * Qa[:, t, t] + 2 * Qpa[:, t])) / (1 + diff) ** 2
+            Qpa = (Qpa + diff[:, None] * Qa[:, t, :]) / (1 + diff)[:, None]
+            pa /= (1 + diff)[:, None]
+        p[a] = pa
+    return p
+
+
+def from_pipeline(pipeline, dtype=np.float64):
+    """Ekstrak CompactSVM dari Pipeline(StandardScaler, SVC rbf probability=True)."""
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.svm import SVC
+
+    steps = [step for _, step in pipeline.steps] if isinstance(pipeline, Pipeline) else []
+    if (len(steps) != 2 or not isinstance(steps[0], StandardScaler) or not isinstance(steps[1], SVC)
+            or steps[1].kernel != 'rbf' or not hasattr(steps[1], 'probA_') or len(steps[1].classes_) < 3):
+        raise ValueError("Artefak ringkas hanya untuk Pipeline(StandardScaler, SVC rbf multikelas "
+                         "dengan probability=True)")
+    scaler, svc = steps
+    n_features = svc.support_vectors_.shape[1]
+    return CompactSVM(
+        gamma=float(svc._gamma),
+        classes_=np.asarray(svc.classes_),
+        mean=scaler.mean_ if scaler.with_mean else np.zeros(n_features),
+        scale=scaler.scale_ if scaler.with_std else np.ones(n_features),
+        support_vectors=np.ascontiguousarray(svc.support_vectors_, dtype=dtype),
+        dual_coef=np.ascontiguousarray(svc._dual_coef_, dtype=dtype),
+        intercept=np.asarray(svc._intercept_, dtype=np.float64),
+        prob_a=np.asarray(svc.probA_, dtype=np.float64),
+        prob_b=np.asarray(svc.probB_, dtype=np.float64),
+        n_support=np.asarray(svc.n_support_, dtype=np.int32),
+    )
+
+
+def write_compact(model, path, version):
+    """Tulis ``model`` ke ``path``; ``version`` = versi metadata artefak joblib asalnya."""
+    from .fsutil import atomic_write
+
+    buffers = [np.ascontiguousarray(getattr(model, name)) for name in ARRAYS]
+    arrays, offset = [], 0
+    for name, values in zip(ARRAYS, buffers):
+        arrays.append({'name': name, 'dtype': values.dtype.str, 'shape': list(values.shape), 'offset': offset})
+        offset += values.nbytes + _pad(values.nbytes)
+
+    header = json.dumps({'version': version, 'gamma': model.gamma,
+                         'classes': model.classes_.tolist(), 'arrays': arrays}).encode('utf-8')
+    preamble = len(MAGIC) + 8 + len(header)
+
+    def write(tmp):
+        with open(tmp, 'wb') as f:
+            f.write(MAGIC)
+            f.write(len(header).to_bytes(8, 'little'))
+            f.write(header)
+            f.write(b'\0' * _pad(preamble))
+            for values in buffers:
+                f.write(values.tobytes())
+                f.write(b'\0' * _pad(values.nbytes))
+
+    atomic_write(path, write)
+
+
+def load_compact(path, expected_version=None):
+    """Muat CompactSVM via memory-map. Kembalikan None jika tidak ada atau versinya berbeda."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} bukan artefak model ringkas yang valid")
+        size = int.from_bytes(f.read(8), 'little')
+        header = json.loads(f.read(size).decode('utf-8'))
+    if expected_version is not None and header['version'] != expected_version:
+        return None
+    preamble = len(MAGIC) + 8 + size
+    base = preamble + _pad(preamble)
+
+    mm = np.memmap(path, dtype=np.uint8, mode='r')
+    values = {}
+    for entry in header['arrays']:
+        dtype = np.dtype(entry['dtype'])
+        start = base + entry['offset']
+        count = int(np.prod(entry['shape']))
+        values[entry['name']] = (mm[start:start + count * dtype.itemsize].view(dtype)
+                                 .reshape(entry['shape']).view(np.ndarray))
+    return CompactSVM(gamma=header['gamma'], classes_=np.asarray(header['classes']), **values)
+
+
+def export(model_path=MODEL_PATH, output=None, dtype=np.float64):
+    """Ekspor artefak joblib ``model_path`` ke format ringkas; kembalikan path output."""
+    from .model import load_artifact
+
+    artifact = load_artifact(model_path, compact=False)
+    output = output or compact_path(model_path)
+    write_compact(from_pipeline(artifact.pipeline, dtype), output, artifact.version)
+    return output
+
+
+# Kode yang dijalankan di interpreter baru: waktu (detik) import + load + satu prediksi
+_COLD_LOAD = """
+import time; t0 = time.perf_counter()
+import numpy as np
+from dropout.model import load_artifact
+artifact = load_artifact({path!r}, compact={compact!r})
+artifact.pipeline.predict_proba(np.zeros((1, {n_features})))
+print(time.perf_counter() - t0)
+"""
+
+
+def cold_load_seconds(model_path=MODEL_PATH, compact=True, n_features=5, repeat=5):
+    """Median detik memuat model dan memprediksi satu baris di proses baru."""
+    code = _COLD_LOAD.format(path=str(model_path), compact=compact, n_features=n_features)
+    env = dict(os.environ, PYTHONWARNINGS='ignore')
+    timings = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', code], cwd=BASE_DIR, env=env,
+                             capture_output=True, text=True, check=True)
+        timings.append(float(out.stdout.split()[-1]))
+    return statistics.median(timings)
+
+
+def check(model_path=MODEL_PATH, max_load_ms=DEFAULT_MAX_LOAD_MS, max_kb=DEFAULT_MAX_KB,
+          atol=DEFAULT_ATOL, repeat=5):
+    """Ukur ukuran, waktu load cold start, dan paritas artefak ringkas; kembalikan (laporan, pelanggaran)."""
+    from .data import load_dataset
+    from .model import load_artifact
+
+    path = compact_path(model_path)
+    reference = load_artifact(model_path, compact=False)
+    compact = load_compact(path, reference.version)
+    if compact is None:
+        return {}, [f"{path} tidak ada atau versinya tidak sama dengan {Path(model_path).name}"]
+
+    X = load_dataset().frame[reference.feature_cols]
+    max_diff = float(np.abs(compact.predict_proba(X) - reference.pipeline.predict_proba(X)).max())
+    report = {
+        'compact_kb': path.stat().st_size / 1024,
+        'joblib_kb': Path(model_path).stat().st_size / 1024,
+        'compact_load_ms': cold_load_seconds(model_path, True, len(reference.feature_cols), repeat) * 1000,
+        'joblib_load_ms': cold_load_seconds(model_path, False, len(reference.feature_cols), repeat) * 1000,
+        'max_abs_diff': max_diff,
+    }
+    violations = []
+    if report['compact_kb'] > max_kb:
+        violations.append(f"ukuran {report['compact_kb']:.1f} KB > {max_kb} KB")
+    if report['compact_load_ms'] > max_load_ms:
+        violations.append(f"load cold start {report['compact_load_ms']:.1f} ms > {max_load_ms} ms")
+    if max_diff > atol:
+        violations.append(f"selisih probabilitas {max_diff:.2e} > {atol:.0e}")
+    return report, violations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Artefak model SVM ringkas (NumPy + memmap).")
+    sub = parser.add_subparsers(dest='command', required=True)
+    export_parser = sub.add_parser('export', help="Ekspor artefak joblib ke format ringkas.")
+    export_parser.add_argument('--model', default=str(MODEL_PATH))
+    export_parser.add_argument('--output', help="Default: path model dengan sufiks .compact.")
+    export_parser.add_argument('--dtype', choices=['float64', 'float32'], default='float64',
+                               help="float32 memperkecil file ~separuh dengan selisih probabilitas ~1e-7.")
+    check_parser = sub.add_parser('check', help="Cek anggaran ukuran, waktu load, dan paritas (exit 1 jika lewat).")
+    check_parser.add_argument('--model', default=str(MODEL_PATH))
+    check_parser.add_argument('--max-load-ms', type=float, default=DEFAULT_MAX_LOAD_MS,
+                              help="Batas import + load + 1 prediksi di proses baru.")
+    check_parser.add_argument('--max-kb', type=float, default=DEFAULT_MAX_KB)
+    check_parser.add_argument('--atol', type=float, default=DEFAULT_ATOL,
+                              help="Batas selisih absolut predict_proba terhadap scikit-learn.")
+    check_parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    if args.command == 'export':
+        output = export(args.model, args.output, np.dtype(args.dtype))
+        print(f"Artefak ringkas ditulis ke {output} ({os.path.getsize(output) / 1024:.1f} KB)")
+        return
+
+    report, violations = check(args.model, args.max_load_ms, args.max_kb, args.atol, args.repeat)
+    if report:
+        print(f"Ukuran      : {report['compact_kb']:8.1f} KB (joblib {report['joblib_kb']:.1f} KB)")
+        print(f"Load + 1 row: {report['compact_load_ms']:8.1f} ms (joblib {report['joblib_load_ms']:.1f} ms)")
+        print(f"Selisih maks: {report['max_abs_diff']:.2e}")
+    if violations:
+        print("Melewati anggaran: " + '; '.join(violations))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
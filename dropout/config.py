@@ -0,0 +1,48 @@
+from pathlib import Path
+
+# Lokasi file relatif terhadap root repository
+BASE_DIR = Path(__file__).resolve().parent.parent
+DATA_PATH = BASE_DIR / "data.csv"
+MODEL_PATH = BASE_DIR / "dropout_prediction_svm_model.joblib"
+CACHE_DIR = BASE_DIR / ".cache"
+
+# Fitur yang dipakai model prediksi
+FEATURE_COLS = [
+    'Age at enrollment',
+    'Admission grade',
+    'Scholarship holder',
+    'Curricular units 1st sem (grade)',
+    'Tuition fees up to date',
+]
+TARGET_COL = 'Target'
+
+# Label Target (urutan sama dengan LabelEncoder: 0=Dropout, 1=Enrolled, 2=Graduate)
+TARGET_LABELS = ['Dropout', 'Enrolled', 'Graduate']
+LABEL_TARGET = dict(enumerate(TARGET_LABELS))
+# Kelas yang probabilitasnya dipakai sebagai "Dropout Probability" / kategori risiko
+DROPOUT_LABEL = 'Dropout'
+
+# Mapping Course ID ke nama jurusan
+COURSE_MAPPING = {
+    33: "Biofuel Production Technologies",
+    171: "Animation and Multimedia Design",
+    8014: "Social Service (evening attendance)",
+    9003: "Agronomy",
+    9070: "Communication Design",
+    9085: "Veterinary Nursing",
+    9119: "Informatics Engineering",
+    9130: "Equinculture",
+    9147: "Management",
+    9238: "Social Service",
+    9254: "Tourism",
+    9500: "Nursing",
+    9556: "Oral Hygiene",
+    9670: "Advertising and Marketing Management",
+    9773: "Journalism and Communication",
+    9853: "Basic Education",
+    9991: "Management (evening attendance)",
+}
+
+# Kategori risiko berdasarkan probabilitas dropout
+RISK_BINS = [0, 0.3, 0.7, 1.0]
+RISK_LABELS = ['Risiko Rendah', 'Risiko Sedang', 'Risiko Tinggi']
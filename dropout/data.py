@@ -0,0 +1,185 @@
+"""Loader dataset bersama: CSV dibaca dan dibersihkan sekali per proses.
+
+Frame yang dikembalikan ``load_dataset`` dipakai bersama oleh semua sesi,
+jadi perlakukan sebagai read-only (pakai ``assign``/filter, jangan tambah kolom).
+"""
+import hashlib
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .config import COURSE_MAPPING, DATA_PATH, TARGET_COL, TARGET_LABELS
+from .snapshot import MAGIC, SNAPSHOT_PATH, read_snapshot
+
+# Tipe data eksplisit per kolom (nama kolom sudah dinormalisasi, tanpa spasi/tab)
+COLUMN_DTYPES = {
+    'Marital status': 'int8',
+    'Application mode': 'int8',
+    'Application order': 'int8',
+    'Course': 'int16',
+    'Daytime/evening attendance': 'int8',
+    'Previous qualification': 'int8',
+    'Previous qualification (grade)': 'float64',
+    'Nacionality': 'int16',
+    "Mother's qualification": 'int8',
+    "Father's qualification": 'int8',
+    "Mother's occupation": 'int16',
+    "Father's occupation": 'int16',
+    'Admission grade': 'float64',
+    'Displaced': 'int8',
+    'Educational special needs': 'int8',
+    'Debtor': 'int8',
+    'Tuition fees up to date': 'int8',
+    'Gender': 'int8',
+    'Scholarship holder': 'int8',
+    'Age at enrollment': 'int8',
+    'International': 'int8',
+    'Curricular units 1st sem (credited)': 'int8',
+    'Curricular units 1st sem (enrolled)': 'int8',
+    'Curricular units 1st sem (evaluations)': 'int8',
+    'Curricular units 1st sem (approved)': 'int8',
+    'Curricular units 1st sem (grade)': 'float64',
+    'Curricular units 1st sem (without evaluations)': 'int8',
+    'Curricular units 2nd sem (credited)': 'int8',
+    'Curricular units 2nd sem (enrolled)': 'int8',
+    'Curricular units 2nd sem (evaluations)': 'int8',
+    'Curricular units 2nd sem (approved)': 'int8',
+    'Curricular units 2nd sem (grade)': 'float64',
+    'Curricular units 2nd sem (without evaluations)': 'int8',
+    'Unemployment rate': 'float64',
+    'Inflation rate': 'float64',
+    'GDP': 'float64',
+    TARGET_COL: 'category',
+}
+
+# Kolom turunan yang ditambahkan sekali saat load (bukan bagian dari data.csv)
+DERIVED_COLS = ['Status', 'Course Name']
+
+
+@dataclass(frozen=True)
+class Dataset:
+    frame: pd.DataFrame
+    version: str
+    path: Path
+
+
+def file_sha256(path):
+    """Hash SHA-256 dari isi file (dipakai untuk melacak versi data)."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def parse_csv(path=DATA_PATH):
+    """Parse CSV mentah dengan dtype eksplisit dan nama kolom yang sudah di-strip."""
+    header = pd.read_csv(path, delimiter=';', nrows=0).columns
+    dtypes = {raw: COLUMN_DTYPES[raw.strip()] for raw in header if raw.strip() in COLUMN_DTYPES}
+    ip = pd.read_csv(path, delimiter=';', dtype=dtypes)
+    ip.columns = ip.columns.str.strip()
+    return ip
+
+
+def clean_dataset(ip):
+    """dropna/drop_duplicates dan Target jadi kode 0/1/2."""
+    # Preprocessing dasar
+    ip = ip.dropna().drop_duplicates().reset_index(drop=True)
+
+    # Label encoding Target (setara LabelEncoder: urutan alfabet)
+    ip[TARGET_COL] = ip[TARGET_COL].cat.set_categories(TARGET_LABELS).cat.codes.astype('int8')
+    return ip
+
+
+def read_dataset(path=DATA_PATH):
+    """Parse dan bersihkan CSV: dtype eksplisit, dropna/drop_duplicates, Target jadi kode 0/1/2."""
+    return clean_dataset(parse_csv(path))
+
+
+def is_snapshot(path):
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def iter_chunks(path, chunksize, columns=None):
+    """Baca CSV atau snapshot per potongan ``chunksize`` baris (memori terbatas).
+
+    Tidak ada dropna/drop_duplicates di sini; index tiap potongan adalah nomor
+    baris asli di file sumber.
+    """
+    if is_snapshot(path):
+        ip = read_snapshot(path)
+        if columns is not None:
+            ip = ip[list(columns)]
+        for start in range(0, len(ip), chunksize):
+            yield ip.iloc[start:start + chunksize]
+        return
+
+    header = pd.read_csv(path, delimiter=';', nrows=0).columns
+    names = {raw: raw.strip() for raw in header}
+    if columns is not None:
+        wanted = set(columns)
+        names = {raw: name for raw, name in names.items() if name in wanted}
+    dtypes = {raw: COLUMN_DTYPES[name] for raw, name in names.items()
+              if name in COLUMN_DTYPES and name != TARGET_COL}
+    reader = pd.read_csv(path, delimiter=';', usecols=list(names), dtype=dtypes, chunksize=chunksize)
+    with reader:
+        for chunk in reader:
+            yield chunk.rename(columns=names)
+
+
+def iter_clean_chunks(path, chunksize, columns=None):
+    """Seperti ``iter_chunks``, tetapi dengan pembersihan ``clean_dataset`` (dropna/drop_duplicates).
+
+    Index tiap potongan sama dengan index frame ``load_dataset`` (nomor urut
+    setelah pembersihan), jadi nomor baris cocok dengan dashboard. Duplikat antar
+    potongan dikenali dari hash baris; yang disimpan hanya hash-nya.
+    """
+    seen = np.empty(0, dtype=np.uint64)
+    offset = 0
+    for chunk in iter_chunks(path, chunksize):
+        chunk = chunk.dropna()
+        hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+        keep = ~pd.Index(hashes).duplicated() & ~np.isin(hashes, seen)
+        seen = np.union1d(seen, hashes[keep])
+        chunk = chunk[keep]
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+        offset += len(chunk)
+        yield chunk if columns is None else chunk[list(columns)]
+
+
+def add_derived_columns(ip):
+    return ip.assign(**{
+        'Status': pd.Categorical.from_codes(ip[TARGET_COL], TARGET_LABELS),
+        'Course Name': ip['Course'].map(COURSE_MAPPING).astype('category'),
+    })
+
+
+_lock = threading.Lock()
+_cache = {}
+
+
+def load_dataset(path=DATA_PATH, snapshot_path=SNAPSHOT_PATH):
+    """Dataset bersih (dengan kolom turunan) yang di-cache per proses.
+
+    Snapshot biner (lihat ``dropout.snapshot``) dipakai jika hash sumbernya cocok
+    dengan ``path``; jika basi atau tidak ada, CSV di-parse ulang. Cache otomatis
+    dibuang ketika mtime atau ukuran file berubah.
+    """
+    path = Path(path)
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        cached = _cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        sha = file_sha256(path)
+        ip = read_snapshot(snapshot_path, sha) if snapshot_path is not None else None
+        if ip is None:
+            ip = read_dataset(path)
+        dataset = Dataset(frame=add_derived_columns(ip), version=sha[:12], path=path)
+        _cache[path] = (stamp, dataset)
+        return dataset
@@ -0,0 +1,313 @@
+"""Monitor drift fitur secara streaming terhadap profil distribusi data training.
+
+Profil training (``<model>.profile.json``, ditulis saat model disimpan atau via
+``profile``) berisi per kolom ``feature_cols`` model dan ``Target``: jumlah
+baris, mean/variansi, dan histogram. Kolom kontinu memakai bin kuantil data
+training, sedangkan kolom diskrit (<= MAX_CATEGORIES nilai, dan Target) memakai
+frekuensi per kategori.
+
+``DriftMonitor`` memproses record masuk per potongan dalam satu lintasan.
+Mean/variansi digabung online (Chan et al.) dan histogram diakumulasi pada bin
+profil, sehingga memorinya konstan berapa pun jumlah barisnya. Laporan per
+kolom berisi pergeseran mean (dalam simpangan baku training), PSI, dan KS.
+
+Jalankan:
+    python -m dropout.drift profile [--data data.csv] [--model ...]
+    python -m dropout.drift check --input intake_baru.csv [--max-psi 0.25] [--max-ks 0.15]
+``check`` keluar dengan exit code 1 jika ada kolom yang melewati ambang.
+"""
+import argparse
+import json
+import sys
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .config import DATA_PATH, FEATURE_COLS, MODEL_PATH, TARGET_COL, TARGET_LABELS
+from .data import file_sha256, iter_chunks
+from .fsutil import atomic_write
+
+DEFAULT_BINS = 10
+# Kolom dengan nilai unik sebanyak ini atau kurang diperlakukan sebagai kategori
+MAX_CATEGORIES = 10
+# Proporsi minimum per bin agar PSI tetap terdefinisi untuk bin kosong
+PSI_EPSILON = 1e-4
+# Ambang PSI yang lazim: < 0.1 stabil, 0.1-0.25 moderat, >= 0.25 signifikan
+PSI_MODERATE = 0.1
+DEFAULT_MAX_PSI = 0.25
+DEFAULT_MAX_KS = 0.15
+DEFAULT_CHUNKSIZE = 50_000
+
+
+def profile_path(model_path=MODEL_PATH):
+    return Path(model_path).with_suffix('.profile.json')
+
+
+class FeatureStats:
+    """Akumulator satu kolom: jumlah, mean/M2 online, dan histogram pada ``levels`` yang tetap.
+
+    ``levels`` adalah batas bin (``kind='numeric'``) atau nilai kategori terurut
+    (``kind='categorical'``). Bin terakhir kategori menampung nilai di luar profil.
+    """
+
+    def __init__(self, kind, levels, counts=None, n=0, missing=0, mean=0.0, m2=0.0):
+        self.kind = kind
+        self.levels = np.asarray(levels, dtype=float)
+        size = len(self.levels) + 1
+        self.counts = np.zeros(size, dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+        self.n = n
+        self.missing = missing
+        self.mean = mean
+        self.m2 = m2
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['kind'], data['levels'], data['counts'], data['n'], data['missing'],
+                   data['mean'], data['m2'])
+
+    def to_dict(self):
+        return {
+            'kind': self.kind,
+            'levels': self.levels.tolist(),
+            'counts': self.counts.tolist(),
+            'n': self.n,
+            'missing': self.missing,
+            'mean': self.mean,
+            'm2': self.m2,
+        }
+
+    def empty(self):
+        """Akumulator kosong dengan bin yang sama."""
+        return FeatureStats(self.kind, self.levels)
+
+    @property
+    def std(self):
+        return float(np.sqrt(self.m2 / (self.n - 1))) if self.n > 1 else float('nan')
+
+    def proportions(self):
+        return self.counts / self.counts.sum() if self.n else np.full(len(self.counts), np.nan)
+
+    def _bins(self, values):
+        if self.kind == 'numeric':
+            return np.searchsorted(self.levels, values, side='right')
+        pos = np.searchsorted(self.levels, values).clip(max=len(self.levels) - 1)
+        return np.where(self.levels[pos] == values, pos, len(self.levels))
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        missing = np.isnan(values)
+        self.missing += int(missing.sum())
+        values = values[~missing]
+        if not len(values):
+            return
+        self.counts += np.bincount(self._bins(values), minlength=len(self.counts))
+        # Gabungkan mean/M2 potongan ini ke akumulator (Chan et al.) tanpa menyimpan nilainya
+        n, mean = len(values), float(values.mean())
+        m2 = float(((values - mean) ** 2).sum())
+        total = self.n + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta ** 2 * self.n * n / total
+        self.n = total
+
+
+def psi(expected, actual):
+    """Population Stability Index dua vektor proporsi pada bin yang sama."""
+    expected = np.clip(expected, PSI_EPSILON, None)
+    actual = np.clip(actual, PSI_EPSILON, None)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+def ks(kind, expected, actual):
+    """Statistik KS dari histogram (selisih CDF maksimum pada batas bin).
+
+    Untuk kategori tanpa urutan, selisih proporsi kategori maksimum.
+    """
+    if kind == 'numeric':
+        return float(np.max(np.abs(np.cumsum(actual) - np.cumsum(expected))))
+    return float(np.max(np.abs(actual - expected)))
+
+
+def column_values(series, column):
+    """Nilai numerik kolom; Target berlabel teks ('Dropout', ...) diubah ke kode 0/1/2."""
+    if column == TARGET_COL and not pd.api.types.is_numeric_dtype(series):
+        codes = pd.Categorical(series.astype(str).str.strip(), categories=TARGET_LABELS).codes
+        return np.where(codes >= 0, codes, np.nan)
+    return pd.to_numeric(series, errors='coerce').to_numpy(dtype=float)
+
+
+def build_profile(frame, columns, bins=DEFAULT_BINS, **info):
+    """Profil distribusi ``columns`` pada ``frame`` (data training); ``info`` ikut disimpan."""
+    features = {}
+    for column in columns:
+        values = column_values(frame[column], column)
+        present = values[~np.isnan(values)]
+        unique = np.unique(present)
+        if column == TARGET_COL or len(unique) <= MAX_CATEGORIES:
+            stats = FeatureStats('categorical', unique)
+        else:
+            # Batas bin kuantil; kuantil kembar (mis. banyak nilai 0) digabung
+            edges = np.unique(np.quantile(present, np.linspace(0, 1, bins + 1)[1:-1]))
+            stats = FeatureStats('numeric', edges)
+        stats.update(values)
+        features[column] = stats.to_dict()
+    return {
+        **info,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'rows': int(len(frame)),
+        'features': features,
+    }
+
+
+def training_profile(data_path, metadata, bins=DEFAULT_BINS):
+    """Profil split training model ``metadata`` (split yang sama dengan ``dropout.train``)."""
+    from .train import split_dataset
+
+    X_train, _, y_train, _ = split_dataset(data_path, metadata.get('random_state', 42),
+                                           metadata.get('feature_cols', FEATURE_COLS))
+    frame = X_train.assign(**{TARGET_COL: y_train})
+    return build_profile(frame, list(frame.columns), bins,
+                         model_version=metadata['version'], data_sha256=metadata.get('data_sha256'))
+
+
+def save_profile(profile, path):
+    def dump(tmp):
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(profile, f, indent=1)
+            f.write('\n')
+
+    atomic_write(path, dump)
+
+
+def load_profile(path=None):
+    """Profil dari ``path`` (default: di samping model); None jika belum ada."""
+    path = Path(path) if path is not None else profile_path()
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return None
+
+
+def status(psi_value):
+    if np.isnan(psi_value):
+        return 'tanpa data'
+    if psi_value < PSI_MODERATE:
+        return 'stabil'
+    return 'moderat' if psi_value < DEFAULT_MAX_PSI else 'signifikan'
+
+
+class DriftMonitor:
+    """Statistik online record masuk dibanding profil training; aman dipakai bersama antar-thread."""
+
+    def __init__(self, profile):
+        self.profile = profile
+        self.reference = {c: FeatureStats.from_dict(d) for c, d in profile['features'].items()}
+        self.current = {c: stats.empty() for c, stats in self.reference.items()}
+        self.rows = 0
+        self._lock = threading.Lock()
+
+    @property
+    def columns(self):
+        return list(self.reference)
+
+    def update(self, frame):
+        """Tambahkan satu potongan record; kolom profil yang tidak ada di ``frame`` dilewati."""
+        values = {c: column_values(frame[c], c) for c in self.current if c in frame.columns}
+        with self._lock:
+            for column, array in values.items():
+                self.current[column].update(array)
+            self.rows += len(frame)
+
+    def report(self):
+        """DataFrame per kolom: n, mean training/sekarang, pergeseran mean (SD), PSI, KS, status."""
+        rows = []
+        with self._lock:
+            for column, reference in self.reference.items():
+                current = self.current[column]
+                expected, actual = reference.proportions(), current.proportions()
+                has_data = current.n > 0
+                psi_value = psi(expected, actual) if has_data else float('nan')
+                rows.append({
+                    'feature': column,
+                    'n': current.n,
+                    'missing': current.missing,
+                    'mean_train': reference.mean,
+                    'mean': current.mean if has_data else float('nan'),
+                    'shift_sd': (current.mean - reference.mean) / reference.std if has_data else float('nan'),
+                    'psi': psi_value,
+                    'ks': ks(reference.kind, expected, actual) if has_data else float('nan'),
+                    'status': status(psi_value),
+                })
+        return pd.DataFrame(rows).set_index('feature')
+
+
+def drifted(report, max_psi=DEFAULT_MAX_PSI, max_ks=DEFAULT_MAX_KS):
+    """Nama kolom yang PSI atau KS-nya melewati ambang."""
+    return list(report.index[(report['psi'] >= max_psi) | (report['ks'] > max_ks)])
+
+
+def monitor_chunks(profile, chunks):
+    """``DriftMonitor`` yang sudah memproses semua potongan ``chunks``."""
+    monitor = DriftMonitor(profile)
+    for chunk in chunks:
+        monitor.update(chunk)
+    return monitor
+
+
+def monitor_file(profile, path, chunksize=DEFAULT_CHUNKSIZE):
+    """Proses CSV/snapshot per potongan tanpa memuat seluruh file."""
+    columns = list(profile['features'])
+    return monitor_chunks(profile, iter_chunks(path, chunksize, columns=columns))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monitor drift fitur terhadap profil data training.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    build = sub.add_parser('profile', help="Tulis profil training model (split sama dengan dropout.train).")
+    build.add_argument('--data', default=str(DATA_PATH))
+    build.add_argument('--model', default=str(MODEL_PATH))
+    build.add_argument('--bins', type=int, default=DEFAULT_BINS)
+    check = sub.add_parser('check', help="Bandingkan file record masuk dengan profil training.")
+    check.add_argument('--input', required=True, help="CSV (delimiter ';') atau file snapshot.")
+    check.add_argument('--model', default=str(MODEL_PATH))
+    check.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE)
+    check.add_argument('--max-psi', type=float, default=DEFAULT_MAX_PSI)
+    check.add_argument('--max-ks', type=float, default=DEFAULT_MAX_KS)
+    check.add_argument('--output', help="Simpan laporan sebagai CSV (delimiter ';').")
+    args = parser.parse_args(argv)
+
+    from .model import metadata_path
+
+    metadata = json.loads(metadata_path(args.model).read_text(encoding='utf-8'))
+    path = profile_path(args.model)
+    if args.command == 'profile':
+        profile = training_profile(args.data, metadata, args.bins)
+        if profile['data_sha256'] not in (None, file_sha256(args.data)):
+            print(f"Peringatan: {args.data} berbeda dengan data training model {metadata['version']}")
+        save_profile(profile, path)
+        print(f"Profil {profile['rows']} baris training ({len(profile['features'])} kolom) disimpan ke {path}")
+        return
+
+    profile = load_profile(path)
+    if profile is None:
+        sys.exit(f"Profil {path} tidak ada; jalankan `python -m dropout.drift profile` terlebih dahulu.")
+    if profile.get('model_version') != metadata['version']:
+        print(f"Peringatan: profil dibuat untuk model {profile.get('model_version')}, "
+              f"model sekarang {metadata['version']}")
+    monitor = monitor_file(profile, args.input, args.chunksize)
+    report = monitor.report()
+    print(f"{monitor.rows} record dibandingkan dengan {profile['rows']} baris training")
+    print(report.to_string(float_format=lambda v: f"{v:.4f}"))
+    if args.output:
+        report.to_csv(args.output, sep=';')
+    over = drifted(report, args.max_psi, args.max_ks)
+    if over:
+        print(f"Drift melewati ambang (PSI >= {args.max_psi}, KS > {args.max_ks}): {', '.join(over)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
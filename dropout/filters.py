@@ -0,0 +1,159 @@
+"""Filter berindeks untuk halaman Rekomendasi.
+
+``FilterIndex`` menyimpan array posisi baris (terurut) per nilai kategori untuk
+kolom-kolom filter, sehingga kombinasi filter cukup diselesaikan dengan irisan
+array posisi tanpa menyalin frame. Ringkasan per kombinasi filter di-cache LRU.
+"""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .charts import box_table, histogram_table
+from .config import TARGET_COL
+
+
+def _value_index(values):
+    """Dict nilai -> array posisi baris (terurut naik) untuk satu kolom."""
+    codes, uniques = pd.factorize(values)
+    order = np.argsort(codes, kind='stable')
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    # Kode -1 (NaN) ada di awal urutan; lewati
+    start = int((codes < 0).sum())
+    index = {}
+    for value, count in zip(uniques, counts):
+        index[value] = order[start:start + count]
+        start += count
+    return index
+
+
+class FilterIndex:
+    """Indeks posisi baris per nilai kategori, plus cache ringkasan per kombinasi filter."""
+
+    def __init__(self, frame, columns, maxsize=256):
+        self.frame = frame
+        self.maxsize = maxsize
+        self._index = {col: _value_index(frame[col]) for col in columns}
+        self._all = np.arange(len(frame))
+        self._summaries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def values(self, column):
+        return list(self._index[column])
+
+    def select(self, filters):
+        """Posisi baris yang cocok dengan semua ``{kolom: nilai}``; nilai None berarti semua."""
+        parts = [self._index[col].get(value, self._all[:0])
+                 for col, value in filters.items() if value is not None]
+        if not parts:
+            return self._all
+        parts.sort(key=len)
+        positions = parts[0]
+        for other in parts[1:]:
+            positions = np.intersect1d(positions, other, assume_unique=True)
+        return positions
+
+    def summary(self, filters, compute):
+        """``compute(frame, positions)`` untuk kombinasi filter ini, di-cache per (compute, kombinasi)."""
+        key = (compute.__qualname__,
+               tuple(sorted((col, value) for col, value in filters.items() if value is not None)))
+        with self._lock:
+            if key in self._summaries:
+                self._summaries.move_to_end(key)
+                self.hits += 1
+                return self._summaries[key]
+            self.misses += 1
+        result = compute(self.frame, self.select(filters))
+        with self._lock:
+            self._summaries[key] = result
+            while len(self._summaries) > self.maxsize:
+                self._summaries.popitem(last=False)
+        return result
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._summaries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+
+def crosstab(frame, positions, index_col, column_col=TARGET_COL):
+    """Jumlah baris per (``index_col``, ``column_col``) dari subset posisi, tanpa baris/kolom kosong."""
+    a = frame[index_col].to_numpy()[positions]
+    b = frame[column_col].to_numpy()[positions]
+    ua, ia = np.unique(a, return_inverse=True)
+    ub, ib = np.unique(b, return_inverse=True)
+    counts = np.bincount(ia * len(ub) + ib, minlength=len(ua) * len(ub)).reshape(len(ua), len(ub))
+    return pd.DataFrame(counts.astype(float), index=pd.Index(ua, name=index_col),
+                        columns=pd.Index(ub, name=column_col))
+
+
+@dataclass(frozen=True)
+class CohortSummary:
+    count: int
+    payment_counts: pd.DataFrame
+    pct_unpaid: float
+    grade_hist: pd.DataFrame
+    avg_grade: float
+    grade_q25: float
+    scholarship_counts: pd.DataFrame
+    pct_scholarship: float
+    age_box: pd.DataFrame
+    avg_age: float
+    dropout_age: float
+    admission_hist: pd.DataFrame
+    admission_mean_dropout: float
+    admission_mean_graduate: float
+    admission_q25: float
+
+
+def _mean(values):
+    return float(values.mean()) if len(values) else float('nan')
+
+
+def _quantile(values, q):
+    return float(np.quantile(values, q)) if len(values) else float('nan')
+
+
+def cohort_summary(frame, positions):
+    """Semua angka dan tabel kecil yang dipakai panel-panel halaman Rekomendasi."""
+    target = frame[TARGET_COL].to_numpy()[positions]
+    grade = frame['Curricular units 1st sem (grade)'].to_numpy(dtype=float)[positions]
+    age = frame['Age at enrollment'].to_numpy(dtype=float)[positions]
+    admission = frame['Admission grade'].to_numpy(dtype=float)[positions]
+    tuition = frame['Tuition fees up to date'].to_numpy()[positions]
+    scholarship = frame['Scholarship holder'].to_numpy()[positions]
+    count = len(positions)
+
+    subset = pd.DataFrame({
+        TARGET_COL: target,
+        'Curricular units 1st sem (grade)': grade,
+        'Age at enrollment': age,
+        'Admission grade': admission,
+    })
+    return CohortSummary(
+        count=count,
+        payment_counts=crosstab(frame, positions, 'Tuition fees up to date'),
+        pct_unpaid=float((tuition == 0).sum() / max(1, count)),
+        grade_hist=histogram_table(subset, 'Curricular units 1st sem (grade)', TARGET_COL),
+        avg_grade=_mean(grade),
+        grade_q25=_quantile(grade, 0.25),
+        scholarship_counts=crosstab(frame, positions, 'Scholarship holder'),
+        pct_scholarship=float((scholarship == 1).sum() / max(1, count)),
+        age_box=box_table(subset, 'Age at enrollment', TARGET_COL),
+        avg_age=_mean(age),
+        dropout_age=_mean(age[target == 0]),
+        admission_hist=histogram_table(subset, 'Admission grade', TARGET_COL),
+        admission_mean_dropout=_mean(admission[target == 0]),
+        admission_mean_graduate=_mean(admission[target == 1]),
+        admission_q25=_quantile(admission, 0.25),
+    )
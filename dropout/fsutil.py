@@ -0,0 +1,23 @@
+import os
+import tempfile
+from pathlib import Path
+
+
+def atomic_write(path, write):
+    """Panggil ``write(tmp_path)`` lalu rename ke ``path``.
+
+    Pembaca lain tidak pernah melihat file setengah jadi, dan proses yang
+    menulis bersamaan tidak saling merusak (yang terakhir menang).
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    os.close(fd)
+    try:
+        write(tmp)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
@@ -0,0 +1,117 @@
+"""Laporan waktu import per halaman dashboard dengan ``python -X importtime``.
+
+Membandingkan blok import ``dashboard.py`` baseline (semua library untuk semua
+halaman, termasuk scikit-learn) dengan import halaman-halaman di ``views/`` yang
+dimuat terpisah. Untuk halaman yang memakai model, pemuatan model ikut diukur:
+``joblib.load`` seperti baseline untuk "sebelum", ``load_artifact`` untuk "sesudah".
+Library baseline yang tidak lagi terpasang (mis. seaborn) dilewati dan dicetak.
+
+Setiap skenario dijalankan di interpreter baru sebanyak ``--repeat`` kali
+(median), dengan total = jumlah waktu kumulatif import tingkat atas.
+
+Jalankan:
+    python -m dropout.importtime [--repeat 5] [--top 10]
+"""
+import argparse
+import importlib.util
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+from .config import BASE_DIR, MODEL_PATH
+
+# Blok import dashboard.py baseline, apa adanya (sebelum ada paket dropout/ dan views/)
+LEGACY_IMPORTS = [
+    'pandas', 'matplotlib.pyplot', 'seaborn', 'streamlit', 'plotly.express', 'joblib',
+    'sklearn.svm', 'sklearn.model_selection', 'sklearn.preprocessing', 'sklearn.pipeline',
+    'sklearn.compose',
+]
+# Baseline memuat model dengan joblib.load langsung
+LEGACY_LOAD_MODEL = f'import joblib; joblib.load({str(MODEL_PATH)!r})'
+# Import dashboard.py sekarang, sebelum modul halaman dimuat
+BASE_IMPORTS = ['importlib', 'os', 'streamlit', 'dropout.telemetry']
+PAGES = {
+    'Overview': ('views.overview', False),
+    'Visualisasi': ('views.visualisasi', False),
+    'Prediksi': ('views.prediksi', True),
+    'Rekomendasi': ('views.rekomendasi', True),
+}
+LOAD_MODEL = 'from dropout.model import load_artifact; load_artifact()'
+
+
+def _script(modules, load_model=None):
+    lines = [f"import {module}" for module in modules]
+    if load_model:
+        lines.append(load_model)
+    return '; '.join(lines)
+
+
+def installed(modules):
+    """(modul yang paket tingkat atasnya terpasang, modul yang dilewati)."""
+    found = [m for m in modules if importlib.util.find_spec(m.split('.')[0]) is not None]
+    return found, [m for m in modules if m not in found]
+
+
+def parse_importtime(stderr):
+    """Dict modul tingkat atas -> waktu kumulatif (detik) dari output ``-X importtime``."""
+    top = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Modul bersarang diberi indentasi; hanya yang tanpa indentasi dijumlahkan
+        if name.startswith(' ') and not name.startswith('  '):
+            top[name.strip()] = int(cumulative) / 1e6
+    return top
+
+
+def measure(modules, load_model=None, repeat=5):
+    """(median total detik, median detik per modul tingkat atas) untuk satu skenario import."""
+    env = dict(os.environ, MPLBACKEND='Agg', PYTHONWARNINGS='ignore')
+    totals, per_module = [], defaultdict(list)
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', _script(modules, load_model)],
+                                cwd=BASE_DIR, env=env, capture_output=True, text=True, check=True)
+        top = parse_importtime(result.stderr)
+        totals.append(sum(top.values()))
+        for name, seconds in top.items():
+            per_module[name].append(seconds)
+    return statistics.median(totals), {name: statistics.median(v) for name, v in per_module.items()}
+
+
+def report(repeat=5):
+    """List dict per halaman: waktu import sebelum/sesudah pemecahan halaman dan modul terberat sesudahnya."""
+    legacy, _ = installed(LEGACY_IMPORTS)
+    rows = []
+    for page, (module, load_model) in PAGES.items():
+        before, _ = measure(legacy, LEGACY_LOAD_MODEL if load_model else None, repeat)
+        after, modules = measure(BASE_IMPORTS + [module], LOAD_MODEL if load_model else None, repeat)
+        rows.append({'page': page, 'before': before, 'after': after, 'modules': modules})
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Waktu import per halaman dashboard (python -X importtime).")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=5, help="Jumlah modul terberat yang ditampilkan per halaman.")
+    args = parser.parse_args(argv)
+
+    _, skipped = installed(LEGACY_IMPORTS)
+    if skipped:
+        print(f"Import baseline yang tidak terpasang, dilewati: {', '.join(skipped)}")
+    print(f"{'Halaman':<12} {'sebelum':>10} {'sesudah':>10} {'hemat':>8}")
+    rows = report(args.repeat)
+    for row in rows:
+        saved = 1 - row['after'] / row['before']
+        print(f"{row['page']:<12} {row['before'] * 1000:8.0f} ms {row['after'] * 1000:8.0f} ms {saved:8.0%}")
+    for row in rows:
+        heaviest = sorted(row['modules'].items(), key=lambda item: item[1], reverse=True)[:args.top]
+        print(f"\n{row['page']} (sesudah), import terberat:")
+        for name, seconds in heaviest:
+            print(f"  {name:<28} {seconds * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+"""Uji beban lokal: N sesi Streamlit bersamaan yang berpindah-pindah ke keempat halaman.
+
+Setiap sesi adalah ``AppTest`` terpisah (session state sendiri) yang dijalankan
+di thread sendiri dalam satu proses, sama seperti server Streamlit menjalankan
+rerun tiap sesi. Resource ``st.cache_resource`` dan cache modul ``dropout``
+karenanya dipakai bersama, persis seperti di produksi.
+
+Setiap jumlah sesi dijalankan di proses baru agar RSS tidak saling memengaruhi.
+Laporan per jumlah sesi: latensi rerun (p50/p95/p99), RSS setelah pemanasan
+satu sesi, puncak RSS, dan tambahan memori per sesi. Simpan ``--output`` per
+commit untuk membandingkan sebelum/sesudah perubahan.
+
+Jalankan:
+    python -m dropout.loadtest [--sessions 1 4 8] [--rounds 3] [--output loadtest.json]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from .config import BASE_DIR
+
+APP_PATH = BASE_DIR / "dashboard.py"
+PAGES = ("Overview", "Visualisasi", "Prediksi", "Rekomendasi")
+DEFAULT_TIMEOUT = 300
+
+
+def rss_mb():
+    """RSS proses saat ini (MB) dari /proc; di luar Linux, puncak RSS dari getrusage."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except OSError:
+        return peak_rss_mb()
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS byte
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 1024
+
+
+def run_session(rounds, pages=PAGES, app_path=APP_PATH, start=None):
+    """Satu sesi: buka app lalu kunjungi ``pages`` sebanyak ``rounds`` kali.
+
+    Kembalikan list (halaman, detik, pesan error atau None) per rerun.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    if start is not None:
+        start.wait()
+    at = AppTest.from_file(str(app_path), default_timeout=DEFAULT_TIMEOUT)
+    at.run()
+    results = []
+    for _ in range(rounds):
+        for page in pages:
+            # AppTest sesekali mengembalikan tree kosong saat banyak sesi berjalan bersamaan;
+            # rerun tanpa widget diulang sekali dan dicatat sebagai error jika tetap kosong
+            if not at.sidebar.radio:
+                at.run()
+            if not at.sidebar.radio:
+                results.append((page, float('nan'), "tree kosong (radio halaman tidak ada)"))
+                continue
+            at.sidebar.radio[0].set_value(page)
+            began = time.perf_counter()
+            at.run()
+            seconds = time.perf_counter() - began
+            errors = [e.value for e in at.exception] + [e.value for e in at.error]
+            results.append((page, seconds, '; '.join(map(str, errors)) or None))
+    return results
+
+
+def run_load(sessions, rounds=3, pages=PAGES, app_path=APP_PATH):
+    """Jalankan ``sessions`` sesi bersamaan di proses ini; kembalikan dict hasil (lihat modul)."""
+    baseline_mb = rss_mb()
+    # Pemanasan: satu sesi mengisi cache bersama (import halaman, dataset, model, indeks kohort)
+    run_session(1, pages, app_path)
+    warm_mb = rss_mb()
+
+    peak = [warm_mb]
+    done = threading.Event()
+
+    def sample():
+        while not done.wait(0.05):
+            peak[0] = max(peak[0], rss_mb())
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    start = threading.Barrier(sessions)
+    began = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        futures = [pool.submit(run_session, rounds, pages, app_path, start) for _ in range(sessions)]
+        runs = [row for future in futures for row in future.result()]
+    wall = time.perf_counter() - began
+    done.set()
+    sampler.join()
+    peak_mb = max(peak[0], rss_mb())
+
+    latency = {}
+    for page in pages:
+        ms = np.array([seconds * 1000 for p, seconds, _ in runs if p == page])
+        latency[page] = {f"p{q}": float(np.nanpercentile(ms, q)) for q in (50, 95, 99)}
+    all_ms = np.array([seconds * 1000 for _, seconds, _ in runs])
+    latency['Semua'] = {f"p{q}": float(np.nanpercentile(all_ms, q)) for q in (50, 95, 99)}
+    return {
+        'sessions': sessions,
+        'rounds': rounds,
+        'reruns': len(runs),
+        'errors': [f"{page}: {error}" for page, _, error in runs if error],
+        'wall_seconds': wall,
+        'rss_baseline_mb': baseline_mb,
+        'rss_warm_mb': warm_mb,
+        'rss_peak_mb': peak_mb,
+        'rss_per_session_mb': (peak_mb - warm_mb) / sessions,
+        'latency_ms': latency,
+    }
+
+
+def run_isolated(sessions, rounds=3):
+    """``run_load`` di interpreter baru (RSS tiap jumlah sesi diukur terpisah)."""
+    cmd = [sys.executable, '-m', 'dropout.loadtest', '--worker', str(sessions), '--rounds', str(rounds)]
+    env = dict(os.environ, PYTHONWARNINGS='ignore')
+    out = subprocess.run(cmd, cwd=BASE_DIR, env=env, capture_output=True, text=True)
+    if out.returncode != 0:
+        raise RuntimeError(f"Worker {sessions} sesi gagal:\n{out.stderr[-2000:]}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Uji beban sesi Streamlit bersamaan (AppTest).")
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 4, 8])
+    parser.add_argument('--rounds', type=int, default=3, help="Berapa kali tiap sesi mengunjungi keempat halaman.")
+    parser.add_argument('--output', help="Simpan hasil sebagai JSON.")
+    parser.add_argument('--worker', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        import logging
+
+        # Log Streamlit (peringatan deprecation, "No runtime found") tidak relevan untuk laporan
+        logging.disable(logging.WARNING)
+        print(json.dumps(run_load(args.worker, args.rounds)))
+        return
+
+    results = []
+    print(f"{'sesi':>4} {'rerun':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'RSS hangat':>11} {'RSS puncak':>11} {'MB/sesi':>8}")
+    for sessions in args.sessions:
+        result = run_isolated(sessions, args.rounds)
+        results.append(result)
+        lat = result['latency_ms']['Semua']
+        print(f"{sessions:>4} {result['reruns']:>6} {lat['p50']:7.0f}ms {lat['p95']:7.0f}ms {lat['p99']:7.0f}ms "
+              f"{result['rss_warm_mb']:9.0f}MB {result['rss_peak_mb']:9.0f}MB {result['rss_per_session_mb']:8.1f}")
+        for error in result['errors'][:5]:
+            print(f"     error {error}")
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+    if any(r['errors'] for r in results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Pemuatan artefak model yang sudah dilatih oleh ``dropout.train``."""
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .config import DROPOUT_LABEL, FEATURE_COLS, LABEL_TARGET, MODEL_PATH
+
+
+def metadata_path(path):
+    return Path(path).with_suffix('.json')
+
+
+@dataclass(frozen=True)
+class ModelArtifact:
+    pipeline: object
+    metadata: dict = field(default_factory=dict)
+    path: Path = None
+
+    @property
+    def version(self):
+        return self.metadata['version']
+
+    @property
+    def feature_cols(self):
+        return self.metadata.get('feature_cols', list(FEATURE_COLS))
+
+    @property
+    def class_labels(self):
+        """Label kelas sesuai urutan kolom ``predict_proba``.
+
+        ``classes_`` berupa kode LabelEncoder (0/1/2) atau label teks; keduanya dipetakan ke label.
+        """
+        return [LABEL_TARGET.get(c, c) for c in self.pipeline.classes_]
+
+    @property
+    def dropout_index(self):
+        """Kolom kelas Dropout pada output ``predict_proba``."""
+        return self.class_labels.index(DROPOUT_LABEL)
+
+    def predict_proba(self, X):
+        return self.pipeline.predict_proba(X[self.feature_cols])
+
+    def predict_dropout(self, X):
+        """Probabilitas kelas Dropout untuk setiap baris ``X``."""
+        return self.predict_proba(X)[:, self.dropout_index]
+
+
+def load_artifact(path=MODEL_PATH, compact=True):
+    """Muat pipeline dan metadata-nya. Artefak lama tanpa metadata diberi versi dari hash file.
+
+    Jika ada artefak ringkas (``python -m dropout.compact export``) dengan versi yang
+    sama, model dimuat dari situ via memory-map tanpa joblib/scikit-learn.
+    """
+    path = Path(path)
+    meta_file = metadata_path(path)
+    if meta_file.exists():
+        metadata = json.loads(meta_file.read_text(encoding='utf-8'))
+        if compact:
+            from .compact import compact_path, load_compact
+
+            model = load_compact(compact_path(path), metadata['version'])
+            if model is not None:
+                return ModelArtifact(model, metadata, path)
+    else:
+        metadata = {'version': 'legacy-' + hashlib.sha256(path.read_bytes()).hexdigest()[:8]}
+
+    import joblib
+
+    return ModelArtifact(joblib.load(path), metadata, path)
@@ -0,0 +1,399 @@
+"""Ekspor laporan risiko per program studi (HTML/Excel/CSV) untuk semua program sekaligus.
+
+Isi tiap laporan sama dengan halaman Rekomendasi yang difilter per program:
+jumlah per kategori risiko, rincian status pembayaran dan beasiswa (per status
+mahasiswa jika input punya kolom Target, selain itu per kategori risiko), rata-rata
+nilai/usia, dan daftar mahasiswa Risiko Tinggi (``--top`` dengan probabilitas dropout
+tertinggi per program) beserta program yang direkomendasikan.
+
+Input di-scoring satu kali per chunk (``--workers`` > 1: process pool seperti
+``dropout.scoring``), direkomendasikan, lalu diringkas per program. Yang disimpan
+hanya hitungan per program dan paling banyak ``--top`` baris Risiko Tinggi per
+program, jadi memori tidak bergantung pada ukuran input. Laporan semua program
+kemudian ditulis paralel di process pool, ditambah ``ringkasan.csv`` berisi satu
+baris per program.
+
+Jalankan:
+    python -m dropout.reports --input data.csv --output-dir laporan [--format html|xlsx|csv] [--workers 4] [--top 200]
+    python -m dropout.reports --benchmark-scales 1 10 100 [--workers 4]
+"""
+import argparse
+import html
+import importlib.util
+import json
+import multiprocessing
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+
+from .config import BASE_DIR, COURSE_MAPPING, DATA_PATH, MODEL_PATH, RISK_LABELS, TARGET_COL, TARGET_LABELS
+from .data import is_snapshot
+from .recommendations import PROGRAM_COLS, recommend
+from .scoring import DEFAULT_CHUNKSIZE, ScoreStats, iter_scored_chunks
+
+FORMATS = ('html', 'xlsx', 'csv')
+HIGH_RISK = RISK_LABELS[-1]
+MEAN_COLS = {
+    'Curricular units 1st sem (grade)': 'Rata-rata nilai semester 1',
+    'Age at enrollment': 'Rata-rata usia',
+    'Admission grade': 'Rata-rata nilai masuk',
+}
+STUDENT_COLS = ['row', 'Age at enrollment', 'Admission grade', 'Curricular units 1st sem (grade)',
+                'Scholarship holder', 'Tuition fees up to date', 'Dropout Probability']
+PAYMENT_LABELS = {0: 'Belum Bayar', 1: 'Sudah Bayar'}
+SCHOLARSHIP_LABELS = {0: 'Tanpa Beasiswa', 1: 'Dengan Beasiswa'}
+SUMMARY_FILE = 'ringkasan.csv'
+# Jumlah maksimum mahasiswa Risiko Tinggi yang dicantumkan per program
+DEFAULT_TOP = 200
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="id">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; color: #222; }}
+table {{ border-collapse: collapse; margin-bottom: 1.5em; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 8px; text-align: right; }}
+th {{ background: #f0f0f0; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+{body}
+</body>
+</html>
+"""
+
+
+@dataclass(frozen=True)
+class CourseReport:
+    course: int
+    name: str
+    # Jumlah, jumlah per kategori risiko, persentase pembayaran/beasiswa, rata-rata
+    summary: pd.Series
+    # Status pembayaran / beasiswa x status mahasiswa (atau kategori risiko)
+    payment: pd.DataFrame
+    scholarship: pd.DataFrame
+    # Mahasiswa Risiko Tinggi (paling banyak ``top``), probabilitas dropout tertinggi lebih dulu
+    high_risk: pd.DataFrame
+
+    @property
+    def slug(self):
+        return f"{self.course}_{re.sub(r'[^a-z0-9]+', '_', self.name.lower()).strip('_')}"
+
+
+def status_labels(target):
+    """Target sebagai kategori label ('Dropout', ...), baik berupa kode 0/1/2 maupun teks."""
+    if pd.api.types.is_numeric_dtype(target):
+        return pd.Categorical.from_codes(target.to_numpy(), TARGET_LABELS)
+    return pd.Categorical(target.astype(str).str.strip(), categories=TARGET_LABELS)
+
+
+def input_columns(path):
+    if is_snapshot(path):
+        from .snapshot import read_header
+
+        return [entry['name'] for entry in read_header(path)['columns']]
+    return [name.strip() for name in pd.read_csv(path, delimiter=';', nrows=0).columns]
+
+
+def _add(total, part):
+    return part if total is None else total.add(part, fill_value=0)
+
+
+class ReportAccumulator:
+    """Hitungan per program studi dari chunk ter-scoring, plus ``top`` baris Risiko Tinggi per program."""
+
+    def __init__(self, by, top=DEFAULT_TOP):
+        self.by = by
+        self.top = top
+        self.risk = None
+        self.payment = None
+        self.scholarship = None
+        self.sums = None
+        self.high_risk = None
+
+    def update(self, chunk):
+        if self.by == 'Status':
+            chunk = chunk.assign(Status=status_labels(chunk[TARGET_COL]))
+        self.risk = _add(self.risk, chunk.groupby(['Course', 'Risk Category'], observed=False).size())
+        self.payment = _add(self.payment, chunk.groupby(
+            ['Course', 'Tuition fees up to date', self.by], observed=False).size())
+        self.scholarship = _add(self.scholarship, chunk.groupby(
+            ['Course', 'Scholarship holder', self.by], observed=False).size())
+        self.sums = _add(self.sums, chunk.groupby('Course')[list(MEAN_COLS)].sum())
+        high = chunk.loc[chunk['Risk Category'] == HIGH_RISK, ['Course'] + STUDENT_COLS + PROGRAM_COLS]
+        if len(high):
+            # Gabung dengan kandidat sebelumnya lalu potong lagi ke top-N per program;
+            # sort stabil: pada probabilitas sama, baris yang lebih awal didahulukan
+            kept = high if self.high_risk is None else pd.concat([self.high_risk, high])
+            kept = kept.sort_values('Dropout Probability', ascending=False, kind='stable')
+            self.high_risk = kept.groupby('Course', sort=False).head(self.top)
+
+    def _table(self, counts, course, labels):
+        columns = TARGET_LABELS if self.by == 'Status' else RISK_LABELS
+        if counts is None or course not in counts.index.get_level_values(0):
+            table = pd.DataFrame(0, index=list(labels), columns=columns)
+        else:
+            table = counts.loc[course].unstack(fill_value=0).reindex(index=list(labels), columns=columns,
+                                                                      fill_value=0)
+        table = table.rename(index=labels).astype(int)
+        table.columns.name = self.by
+        return table
+
+    def reports(self):
+        """``CourseReport`` untuk semua program di COURSE_MAPPING (program tanpa mahasiswa tetap ada)."""
+        high_risk = self.high_risk
+        reports = []
+        for course, name in COURSE_MAPPING.items():
+            if self.risk is not None and course in self.risk.index.get_level_values(0):
+                risk = self.risk.loc[course].reindex(RISK_LABELS, fill_value=0).astype(int)
+            else:
+                risk = pd.Series(0, index=RISK_LABELS)
+            count = int(risk.sum())
+            payment = self._table(self.payment, course, PAYMENT_LABELS)
+            scholarship = self._table(self.scholarship, course, SCHOLARSHIP_LABELS)
+            sums = self.sums.loc[course] if self.sums is not None and course in self.sums.index else None
+            ratios = {
+                '% belum bayar': payment.loc['Belum Bayar'].sum(),
+                '% penerima beasiswa': scholarship.loc['Dengan Beasiswa'].sum(),
+                **{label: sums[col] if sums is not None else 0 for col, label in MEAN_COLS.items()},
+            }
+            # Jumlah tetap bilangan bulat, sisanya dibulatkan (Series campuran tidak memakai float_format)
+            summary = pd.Series({
+                'Jumlah mahasiswa': count,
+                **risk.to_dict(),
+                **{label: round(float(total) / count, 4) if count else float('nan') for label, total in ratios.items()},
+            }, dtype=object)
+            if high_risk is not None:
+                students = high_risk[high_risk['Course'] == course].drop(columns='Course')
+            else:
+                students = pd.DataFrame(columns=STUDENT_COLS + PROGRAM_COLS)
+            reports.append(CourseReport(course, name, summary, payment, scholarship,
+                                        students.reset_index(drop=True)))
+        return reports
+
+
+def _listed(report):
+    total = report.summary[HIGH_RISK]
+    shown = len(report.high_risk)
+    return f"{total}" if shown == total else f"{shown} teratas dari {total}"
+
+
+def write_html(report, path):
+    sections = [
+        ('Ringkasan', report.summary.to_frame('Nilai')),
+        (f'Status Pembayaran per {report.payment.columns.name}', report.payment),
+        (f'Status Beasiswa per {report.scholarship.columns.name}', report.scholarship),
+        (f'Mahasiswa {HIGH_RISK} ({_listed(report)})', report.high_risk),
+    ]
+    body = '\n'.join(f"<h2>{html.escape(title)}</h2>\n{table.to_html(float_format=lambda v: f'{v:.4f}')}"
+                     for title, table in sections)
+    title = html.escape(f"Laporan Risiko Dropout: {report.name}")
+    Path(path).write_text(HTML_TEMPLATE.format(title=title, body=body), encoding='utf-8')
+
+
+def write_xlsx(report, path):
+    with pd.ExcelWriter(path) as writer:
+        report.summary.to_frame('Nilai').to_excel(writer, sheet_name='Ringkasan')
+        report.payment.to_excel(writer, sheet_name='Pembayaran')
+        report.scholarship.to_excel(writer, sheet_name='Beasiswa')
+        report.high_risk.to_excel(writer, sheet_name=HIGH_RISK, index=False)
+
+
+def write_csv(report, path):
+    # Tabel ringkas dalam format panjang (bagian;baris;kolom;nilai); daftar mahasiswa di file terpisah
+    parts = [report.summary.to_frame('nilai').assign(bagian='Ringkasan', kolom='')]
+    for section, table in (('Pembayaran', report.payment), ('Beasiswa', report.scholarship)):
+        long = table.stack().rename('nilai').reset_index(level=1)
+        parts.append(long.rename(columns={table.columns.name: 'kolom'}).assign(bagian=section))
+    frame = pd.concat(parts).rename_axis('baris').reset_index()
+    frame[['bagian', 'baris', 'kolom', 'nilai']].to_csv(path, sep=';', index=False)
+    report.high_risk.to_csv(Path(path).with_name(f"{Path(path).stem}_risiko_tinggi.csv"), sep=';',
+                            index=False, float_format='%.6f')
+
+
+WRITERS = {'html': write_html, 'xlsx': write_xlsx, 'csv': write_csv}
+
+
+def write_report(report, output_dir, fmt='html'):
+    path = Path(output_dir) / f"{report.slug}.{fmt}"
+    WRITERS[fmt](report, path)
+    return path
+
+
+def write_reports(reports, output_dir, fmt='html', workers=1):
+    """Tulis semua laporan; ``workers`` > 1 memakai process pool. Kembalikan list path."""
+    if workers <= 1:
+        return [write_report(report, output_dir, fmt) for report in reports]
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(workers, mp_context=context) as executor:
+        futures = [executor.submit(write_report, report, output_dir, fmt) for report in reports]
+        return [future.result() for future in futures]
+
+
+@dataclass
+class ExportStats:
+    scoring: ScoreStats
+    reports: int = 0
+    scoring_seconds: float = 0.0
+    writing_seconds: float = 0.0
+
+
+def export_reports(artifact, input_path, output_dir, fmt='html', workers=1, chunksize=DEFAULT_CHUNKSIZE,
+                   top=DEFAULT_TOP):
+    """Scoring satu lintasan lalu tulis laporan semua program ke ``output_dir``. Kembalikan ``ExportStats``."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    has_target = TARGET_COL in input_columns(input_path)
+    keep = ['Course', *artifact.feature_cols] + ([TARGET_COL] if has_target else [])
+    stats = ExportStats(ScoreStats())
+
+    start = time.perf_counter()
+    accumulator = ReportAccumulator('Status' if has_target else 'Risk Category', top)
+    for chunk in iter_scored_chunks(artifact, input_path, chunksize, keep, stats.scoring, workers):
+        accumulator.update(chunk.join(recommend(chunk)))
+    reports = accumulator.reports()
+    stats.scoring_seconds = stats.scoring.seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    write_reports(reports, output_dir, fmt, workers)
+    summary = pd.DataFrame({report.name: report.summary for report in reports}).T.rename_axis('Course Name')
+    summary.to_csv(output_dir / SUMMARY_FILE, sep=';', float_format='%.4f')
+    stats.writing_seconds = time.perf_counter() - start
+    stats.reports = len(reports)
+    return stats
+
+
+def _rss_kb(pid):
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            return next(int(line.split()[1]) for line in f if line.startswith('VmRSS:'))
+    except (OSError, StopIteration):
+        return 0
+
+
+def _descendants(pid):
+    children = []
+    try:
+        for task in os.listdir(f'/proc/{pid}/task'):
+            with open(f'/proc/{pid}/task/{task}/children') as f:
+                children += f.read().split()
+    except OSError:
+        return []
+    return children + [d for child in children for d in _descendants(child)]
+
+
+def tree_rss_mb():
+    """RSS proses ini ditambah semua proses turunannya (worker pool), dari /proc (Linux)."""
+    pid = os.getpid()
+    return sum(_rss_kb(p) for p in [pid, *_descendants(pid)]) / 1024
+
+
+class PeakSampler:
+    """Catat puncak ``tree_rss_mb`` tiap ``interval`` detik selama blok ``with``.
+
+    ``ru_maxrss`` tidak dipakai karena di Linux nilainya ikut terbawa dari proses
+    induk lewat fork/exec, dan tidak menjumlahkan worker yang berjalan bersamaan.
+    """
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.peak_mb = 0.0
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while True:
+            self.peak_mb = max(self.peak_mb, tree_rss_mb())
+            if self._done.wait(self.interval):
+                return
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._done.set()
+        self._thread.join()
+        self.peak_mb = max(self.peak_mb, tree_rss_mb())
+
+
+def benchmark(scales, fmt='html', workers=1, source=DATA_PATH):
+    """Waktu dan puncak RSS (termasuk worker) ekspor per skala kohort sintetis; tiap skala di proses baru."""
+    from .bench import scaled_csv
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in scales:
+            input_path = source if scale == 1 else scaled_csv(source, scale, Path(tmp) / f'synth_{scale}x.csv')
+            cmd = [sys.executable, '-m', 'dropout.reports', '--input', str(input_path), '--format', fmt,
+                   '--output-dir', str(Path(tmp) / f'laporan_{scale}x'), '--workers', str(workers), '--stats-json']
+            out = subprocess.run(cmd, cwd=BASE_DIR, capture_output=True, text=True)
+            if out.returncode != 0:
+                raise RuntimeError(f"Ekspor skala {scale}x gagal:\n{out.stderr[-2000:]}")
+            results.append({'scale': scale, **json.loads(out.stdout.strip().splitlines()[-1])})
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ekspor laporan risiko per program studi untuk semua program.")
+    parser.add_argument('--input', default=str(DATA_PATH), help="CSV (delimiter ';') atau file snapshot.")
+    parser.add_argument('--output-dir', default='laporan')
+    parser.add_argument('--format', choices=FORMATS, default='html')
+    parser.add_argument('--model', default=str(MODEL_PATH))
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Jumlah proses untuk scoring dan penulisan laporan.")
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP,
+                        help="Jumlah maksimum mahasiswa Risiko Tinggi yang dicantumkan per program.")
+    parser.add_argument('--benchmark-scales', type=int, nargs='+',
+                        help="Ukur waktu & memori ekspor pada kohort sintetis (mis. 1 10 100) alih-alih ekspor.")
+    parser.add_argument('--stats-json', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.format == 'xlsx' and importlib.util.find_spec('openpyxl') is None:
+        parser.error("format xlsx membutuhkan paket openpyxl (pip install openpyxl)")
+
+    if args.benchmark_scales:
+        print(f"{'skala':>5} {'baris':>10} {'scoring':>9} {'tulis':>8} {'total':>8} {'RSS puncak':>11}")
+        for row in benchmark(args.benchmark_scales, args.format, args.workers):
+            print(f"{row['scale']:>4}x {row['rows']:>10} {row['scoring_seconds']:8.2f}s {row['writing_seconds']:7.2f}s "
+                  f"{row['seconds']:7.2f}s {row['rss_peak_mb']:9.0f}MB")
+        return
+
+    from .model import load_artifact
+
+    start = time.perf_counter()
+    with PeakSampler() as sampler:
+        stats = export_reports(load_artifact(args.model), args.input, args.output_dir, args.format,
+                               args.workers, args.chunksize, args.top)
+    seconds = time.perf_counter() - start
+    if args.stats_json:
+        print(json.dumps({
+            'rows': stats.scoring.rows,
+            'reports': stats.reports,
+            'scoring_seconds': stats.scoring_seconds,
+            'writing_seconds': stats.writing_seconds,
+            'seconds': seconds,
+            # Proses induk + worker scoring/penulisan yang berjalan bersamaan
+            'rss_peak_mb': sampler.peak_mb,
+        }))
+        return
+    print(f"{stats.reports} laporan ({args.format}) untuk {stats.scoring.rows} mahasiswa ditulis ke "
+          f"{args.output_dir} dalam {seconds:.2f}s (scoring {stats.scoring_seconds:.2f}s, "
+          f"tulis {stats.writing_seconds:.2f}s)")
+
+
+if __name__ == '__main__':
+    main()
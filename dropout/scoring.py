@@ -0,0 +1,196 @@
+"""Scoring risiko dropout massal, per potongan (chunk) dengan output bertahap.
+
+Jalankan:
+    python -m dropout.scoring --input data.csv --output risk_scores.csv [--chunksize 50000] [--workers 4]
+    python -m dropout.scoring --benchmark-workers 1 2 4 [--benchmark-rows 200000]
+
+Input boleh berupa CSV (delimiter ';') atau snapshot dari ``dropout.snapshot``.
+Dengan ``--workers`` > 1 chunk dibagi ke process pool; setiap worker memuat
+model sekali dan hasil tetap ditulis berurutan sesuai input.
+"""
+import argparse
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .config import DATA_PATH, MODEL_PATH, RISK_BINS, RISK_LABELS
+from .data import iter_chunks
+from .model import load_artifact
+
+DEFAULT_CHUNKSIZE = 50_000
+
+
+def categorize_risk(probs):
+    return pd.cut(probs, bins=RISK_BINS, labels=RISK_LABELS)
+
+
+def score_frame(artifact, frame):
+    """Probabilitas dropout dan kategori risiko untuk setiap baris ``frame``."""
+    probs = artifact.predict_dropout(frame)
+    return pd.DataFrame({
+        'Dropout Probability': probs,
+        'Risk Category': categorize_risk(probs),
+    }, index=frame.index)
+
+
+# Model milik proses worker, dimuat sekali oleh initializer pool
+_worker_artifact = None
+
+
+def _init_worker(model_path):
+    global _worker_artifact
+    _worker_artifact = load_artifact(model_path)
+
+
+def _score_in_worker(chunk):
+    return score_frame(_worker_artifact, chunk)
+
+
+def score_chunks(artifact, chunks, workers=1):
+    """Hasilkan ``(chunk, skor)`` berurutan; ``workers`` > 1 memakai process pool.
+
+    Jumlah chunk yang sedang diproses dibatasi ``2 * workers`` agar memori tetap terbatas.
+    """
+    features = list(artifact.feature_cols)
+    if workers <= 1:
+        for chunk in chunks:
+            yield chunk, score_frame(artifact, chunk)
+        return
+
+    # spawn: worker bersih tanpa state thread/BLAS warisan dari proses induk
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker,
+                             initargs=(str(artifact.path),)) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append((chunk, executor.submit(_score_in_worker, chunk[features])))
+            if len(pending) >= 2 * workers:
+                done, future = pending.popleft()
+                yield done, future.result()
+        while pending:
+            done, future = pending.popleft()
+            yield done, future.result()
+
+
+@dataclass
+class ScoreStats:
+    rows: int = 0
+    skipped: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_sec(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def iter_scored_chunks(artifact, input_path, chunksize=DEFAULT_CHUNKSIZE, keep_cols=(), stats=None,
+                       workers=1):
+    """Hasilkan DataFrame skor per chunk: kolom ``row``, ``keep_cols``, probabilitas, kategori.
+
+    Baris dengan fitur kosong dilewati dan dihitung di ``stats.skipped``.
+    """
+    stats = stats if stats is not None else ScoreStats()
+    features = list(artifact.feature_cols)
+    columns = features + [c for c in keep_cols if c not in features]
+
+    def valid_chunks():
+        for chunk in iter_chunks(input_path, chunksize, columns=columns):
+            valid = chunk.dropna(subset=features)
+            stats.skipped += len(chunk) - len(valid)
+            yield valid
+
+    for valid, scored in score_chunks(artifact, valid_chunks(), workers):
+        out = pd.concat([valid[list(keep_cols)], scored], axis=1)
+        out.insert(0, 'row', valid.index)
+        stats.rows += len(out)
+        stats.chunks += 1
+        yield out
+
+
+def score_file(artifact, input_path, output_path, chunksize=DEFAULT_CHUNKSIZE, keep_cols=(),
+               progress=None, workers=1):
+    """Skor seluruh file dan tulis hasilnya ke CSV secara bertahap. Kembalikan ``ScoreStats``."""
+    stats = ScoreStats()
+    start = time.perf_counter()
+    header = True
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        for out in iter_scored_chunks(artifact, input_path, chunksize, keep_cols, stats, workers):
+            out.to_csv(f, sep=';', index=False, header=header, float_format='%.6f')
+            header = False
+            stats.seconds = time.perf_counter() - start
+            if progress is not None:
+                progress(stats)
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+def benchmark_workers(artifact, frame, worker_counts, chunksize=DEFAULT_CHUNKSIZE):
+    """Ukur throughput scoring ``frame`` untuk tiap jumlah worker (waktu start pool ikut dihitung).
+
+    Kembalikan list dict berisi workers, seconds, rows_per_sec, dan speedup terhadap entri pertama.
+    Hasil setiap konfigurasi diverifikasi identik dengan hasil 1 worker.
+    """
+    chunks = [frame.iloc[i:i + chunksize] for i in range(0, len(frame), chunksize)]
+    results = []
+    reference = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        probs = np.concatenate([scored['Dropout Probability'].to_numpy()
+                                for _, scored in score_chunks(artifact, chunks, workers)])
+        seconds = time.perf_counter() - start
+        if reference is None:
+            reference = probs
+        elif not np.array_equal(reference, probs):
+            raise AssertionError(f"Hasil scoring dengan {workers} worker berbeda")
+        results.append({'workers': workers, 'seconds': seconds, 'rows_per_sec': len(frame) / seconds})
+    for row in results:
+        row['speedup'] = results[0]['seconds'] / row['seconds']
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scoring risiko dropout massal per chunk.")
+    parser.add_argument('--input', default=str(DATA_PATH), help="CSV (delimiter ';') atau file snapshot.")
+    parser.add_argument('--output', default='risk_scores.csv')
+    parser.add_argument('--model', default=str(MODEL_PATH))
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument('--keep', nargs='*', default=['Course'],
+                        help="Kolom input yang ikut ditulis ke output.")
+    parser.add_argument('--workers', type=int, default=1, help="Jumlah proses scoring paralel.")
+    parser.add_argument('--benchmark-workers', type=int, nargs='+',
+                        help="Jalankan benchmark skala worker (mis. 1 2 4) alih-alih scoring file.")
+    parser.add_argument('--benchmark-rows', type=int, default=200_000,
+                        help="Jumlah baris benchmark (data input diulang sampai ukuran ini).")
+    args = parser.parse_args(argv)
+
+    artifact = load_artifact(args.model)
+
+    if args.benchmark_workers:
+        base = pd.concat(list(iter_chunks(args.input, args.chunksize, columns=artifact.feature_cols)))
+        reps = -(-args.benchmark_rows // len(base))
+        frame = pd.concat([base] * reps, ignore_index=True).iloc[:args.benchmark_rows]
+        print(f"Benchmark {len(frame)} baris, chunk {args.chunksize}, CPU tersedia: {os.cpu_count()}")
+        for row in benchmark_workers(artifact, frame, args.benchmark_workers, args.chunksize):
+            print(f"  workers={row['workers']:>2}: {row['seconds']:.2f}s, "
+                  f"{row['rows_per_sec']:,.0f} baris/detik, speedup {row['speedup']:.2f}x")
+        return
+
+    def progress(stats):
+        print(f"  chunk {stats.chunks}: {stats.rows} baris, {stats.rows_per_sec:,.0f} baris/detik")
+
+    stats = score_file(artifact, args.input, args.output, args.chunksize, args.keep, progress,
+                       args.workers)
+    print(f"Selesai: {stats.rows} baris di-scoring ({stats.skipped} dilewati) dalam "
+          f"{stats.seconds:.2f}s ({stats.rows_per_sec:,.0f} baris/detik) -> {Path(args.output)}")
+
+
+if __name__ == '__main__':
+    main()
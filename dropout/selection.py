@@ -0,0 +1,220 @@
+"""Seleksi model: stratified k-fold CV untuk semua kandidat dari notebook, paralel per core.
+
+Kandidat sama dengan ``notebook.ipynb`` (Logistic Regression, Random Forest,
+XGBoost, SVM, Gradient Boosting). Setiap pasangan (kandidat, fold) di-fit
+sebagai satu job ``joblib`` sehingga seluruh core terpakai. Model fold pertama
+tiap kandidat lalu diukur berurutan (tanpa rebutan CPU) untuk latensi inferensi
+per 1.000 baris dan ukuran serialisasinya.
+
+Model produksi dipilih dari kandidat yang masuk anggaran latensi/ukuran,
+dengan metrik kualitas tertinggi (seri: yang lebih cepat). XGBoost bersifat
+opsional: jika paket ``xgboost`` tidak terpasang, kandidat itu dilewati.
+
+Jalankan:
+    python -m dropout.selection [--folds 5] [--jobs -1] [--features dashboard|notebook]
+                             [--metric roc_auc_ovr] [--max-latency-ms 50] [--max-model-mb 5]
+                             [--output selection.json] [--save]
+
+``--save`` melatih ulang kandidat terpilih seperti ``dropout.train`` dan menyimpannya
+sebagai artefak dashboard (hanya untuk fitur ``dashboard``, yang diisi form Prediksi).
+"""
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import recall_score
+from sklearn.model_selection import StratifiedKFold
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from .config import DATA_PATH, FEATURE_COLS, MODEL_PATH, TARGET_COL
+from .data import read_dataset
+from .drift import training_profile
+from .train import build_pipeline, evaluate, save_artifact, serialized_size, train
+
+try:
+    from xgboost import XGBClassifier
+except ImportError:
+    XGBClassifier = None
+
+# Kolom yang di-drop notebook karena korelasinya sangat lemah terhadap Target
+NOTEBOOK_DROPPED = [
+    "Father's qualification", "Father's occupation", 'International', 'Educational special needs',
+    "Mother's occupation", 'Nacionality', 'Unemployment rate', 'Inflation rate', 'GDP',
+]
+FEATURE_SETS = ('dashboard', 'notebook')
+METRICS = ('accuracy', 'f1_macro', 'roc_auc_ovr', 'recall_dropout')
+LATENCY_ROWS = 1000
+# Kode Target untuk Dropout (lihat TARGET_LABELS)
+DROPOUT_CODE = 0
+
+
+def _logreg(random_state):
+    return Pipeline([('scaler', StandardScaler()), ('logreg', LogisticRegression(max_iter=1000))])
+
+
+def _random_forest(random_state):
+    # n_jobs=1: paralelisme sudah di level (kandidat, fold)
+    return RandomForestClassifier(random_state=random_state, n_jobs=1)
+
+
+def _xgboost(random_state):
+    return XGBClassifier(eval_metric='mlogloss', random_state=random_state, n_jobs=1)
+
+
+def _svm(random_state):
+    return build_pipeline(random_state, 'svm')
+
+
+def _gradient_boosting(random_state):
+    return GradientBoostingClassifier(random_state=random_state)
+
+
+CANDIDATES = {
+    'logreg': _logreg,
+    'random_forest': _random_forest,
+    'xgboost': _xgboost,
+    'svm': _svm,
+    'gradient_boosting': _gradient_boosting,
+}
+
+
+def available_candidates():
+    return [name for name in CANDIDATES if name != 'xgboost' or XGBClassifier is not None]
+
+
+def feature_columns(frame, feature_set='dashboard'):
+    if feature_set == 'dashboard':
+        return list(FEATURE_COLS)
+    if feature_set == 'notebook':
+        return [c for c in frame.columns if c != TARGET_COL and c not in NOTEBOOK_DROPPED]
+    raise ValueError(f"feature_set tidak dikenal: {feature_set!r} (pilih dari {FEATURE_SETS})")
+
+
+def _fit_fold(name, fold, X, y, train_idx, test_idx, random_state):
+    model = CANDIDATES[name](random_state)
+    start = time.perf_counter()
+    model.fit(X.iloc[train_idx], y.iloc[train_idx])
+    train_seconds = time.perf_counter() - start
+    X_test, y_test = X.iloc[test_idx], y.iloc[test_idx]
+    metrics = evaluate(model, X_test, y_test)
+    pred = model.classes_[model.predict_proba(X_test).argmax(axis=1)]
+    metrics['recall_dropout'] = round(float(recall_score(y_test == DROPOUT_CODE, pred == DROPOUT_CODE)), 4)
+    # Hanya model fold pertama yang dikirim balik untuk diukur latensi & ukurannya
+    return name, fold, metrics, train_seconds, model if fold == 0 else None
+
+
+def inference_latency(model, X, rows=LATENCY_ROWS, repeat=5):
+    """Median milidetik ``predict_proba`` untuk ``rows`` baris."""
+    batch = pd.concat([X] * -(-rows // len(X)), ignore_index=True).iloc[:rows]
+    model.predict_proba(batch.iloc[:10])
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        model.predict_proba(batch)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def cross_validate(data_path=DATA_PATH, feature_set='dashboard', candidates=None, folds=5,
+                   n_jobs=-1, random_state=42):
+    """List dict per kandidat: rata-rata/std metrik CV, waktu training, latensi per 1k baris, ukuran model."""
+    frame = read_dataset(data_path)
+    X = frame[feature_columns(frame, feature_set)]
+    y = frame[TARGET_COL]
+    candidates = candidates or available_candidates()
+    splits = list(StratifiedKFold(n_splits=folds, shuffle=True, random_state=random_state).split(X, y))
+
+    outputs = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_fold)(name, fold, X, y, train_idx, test_idx, random_state)
+        for name in candidates
+        for fold, (train_idx, test_idx) in enumerate(splits)
+    )
+
+    results = []
+    for name in candidates:
+        runs = [out for out in outputs if out[0] == name]
+        model = next(out[4] for out in runs if out[4] is not None)
+        row = {'model': name}
+        for metric in METRICS:
+            values = [out[2][metric] for out in runs]
+            row[metric] = round(statistics.mean(values), 4)
+            row[f"{metric}_std"] = round(statistics.stdev(values), 4) if len(values) > 1 else 0.0
+        row['train_seconds'] = round(statistics.mean(out[3] for out in runs), 3)
+        row['predict_ms_per_1k'] = round(inference_latency(model, X), 3)
+        row['model_bytes'] = serialized_size(model)
+        results.append(row)
+    return results
+
+
+def select(results, metric='roc_auc_ovr', max_latency_ms=None, max_model_mb=None):
+    """Kandidat dengan ``metric`` tertinggi yang masuk anggaran; None jika tidak ada."""
+    eligible = [
+        r for r in results
+        if (max_latency_ms is None or r['predict_ms_per_1k'] <= max_latency_ms)
+        and (max_model_mb is None or r['model_bytes'] <= max_model_mb * 2**20)
+    ]
+    if not eligible:
+        return None
+    return max(eligible, key=lambda r: (r[metric], -r['predict_ms_per_1k']))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Seleksi model prediksi dropout dengan stratified k-fold CV.")
+    parser.add_argument('--data', default=str(DATA_PATH), help="Path dataset CSV (delimiter ';').")
+    parser.add_argument('--candidates', nargs='+', choices=list(CANDIDATES))
+    parser.add_argument('--features', choices=FEATURE_SETS, default='dashboard',
+                        help="dashboard = 5 fitur form Prediksi; notebook = semua kolom kecuali yang di-drop notebook.")
+    parser.add_argument('--folds', type=int, default=5)
+    parser.add_argument('--jobs', type=int, default=-1, help="Jumlah proses paralel (-1 = semua core).")
+    parser.add_argument('--random-state', type=int, default=42)
+    parser.add_argument('--metric', choices=METRICS, default='roc_auc_ovr')
+    parser.add_argument('--max-latency-ms', type=float, help="Batas latensi predict_proba per 1.000 baris.")
+    parser.add_argument('--max-model-mb', type=float, help="Batas ukuran model terserialisasi.")
+    parser.add_argument('--output', help="Simpan hasil CV dan pilihan sebagai JSON.")
+    parser.add_argument('--save', action='store_true', help="Latih ulang kandidat terpilih dan simpan sebagai model dashboard.")
+    parser.add_argument('--model-output', default=str(MODEL_PATH))
+    args = parser.parse_args(argv)
+
+    if args.save and args.features != 'dashboard':
+        parser.error("--save hanya untuk --features dashboard (fitur yang diisi form Prediksi)")
+    if args.candidates and 'xgboost' in args.candidates and XGBClassifier is None:
+        parser.error("kandidat xgboost membutuhkan paket xgboost (pip install xgboost)")
+    if XGBClassifier is None and not args.candidates:
+        print("xgboost tidak terpasang: kandidat xgboost dilewati")
+
+    start = time.perf_counter()
+    results = cross_validate(args.data, args.features, args.candidates, args.folds, args.jobs, args.random_state)
+    print(f"CV {args.folds}-fold selesai dalam {time.perf_counter() - start:.1f}s")
+    columns = ['model', *METRICS, 'train_seconds', 'predict_ms_per_1k', 'model_bytes']
+    print(pd.DataFrame(results)[columns].set_index('model').to_string())
+
+    chosen = select(results, args.metric, args.max_latency_ms, args.max_model_mb)
+    if args.output:
+        report = {'features': args.features, 'folds': args.folds, 'metric': args.metric,
+                  'max_latency_ms': args.max_latency_ms, 'max_model_mb': args.max_model_mb,
+                  'results': results, 'selected': chosen and chosen['model']}
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    if chosen is None:
+        print("Tidak ada kandidat yang masuk anggaran latensi/ukuran")
+        raise SystemExit(1)
+    print(f"Terpilih: {chosen['model']} ({args.metric}={chosen[args.metric]:.4f}, "
+          f"{chosen['predict_ms_per_1k']:.1f} ms/1k baris, {chosen['model_bytes'] / 2**20:.2f} MB)")
+
+    if args.save:
+        name = chosen['model']
+        pipeline, metadata = train(args.data, args.random_state, model_type=name,
+                                   pipeline=CANDIDATES[name](args.random_state))
+        metadata['selection'] = {key: value for key, value in chosen.items() if key != 'model'}
+        save_artifact(pipeline, metadata, args.model_output, training_profile(args.data, metadata))
+        print(f"Model {metadata['version']} disimpan ke {args.model_output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,291 @@
+"""Layanan HTTP/JSON lokal untuk prediksi dropout dengan micro-batching.
+
+Jalankan:
+    python -m dropout.service [--host 127.0.0.1] [--port 8000] [--max-batch 64] [--max-wait-ms 5]
+
+Endpoint:
+    POST /predict  body: satu record ``{"Age at enrollment": 20, ...}`` atau ``{"records": [...]}``
+    GET  /stats    jumlah request, latensi p50/p99, throughput, ukuran batch rata-rata
+    GET  /health   status dan versi model
+    GET  /drift    drift fitur record yang masuk terhadap profil training (lihat dropout/drift.py)
+
+Request yang datang bersamaan dikumpulkan oleh satu thread batcher (maksimal
+``max_batch`` baris atau ``max_wait_ms``) lalu di-scoring dengan satu panggilan
+``predict_proba``. Setelah hasilnya dikirim, batch yang sama diteruskan ke
+monitor drift (jika profil training model tersedia).
+"""
+import argparse
+import json
+import math
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+from .config import MODEL_PATH
+from .drift import DriftMonitor, load_profile, profile_path
+from .model import load_artifact
+from .scoring import categorize_risk
+
+
+class MicroBatcher:
+    """Gabungkan request bersamaan menjadi satu batch ``predict_proba``."""
+
+    def __init__(self, artifact, max_batch=64, max_wait=0.005, monitor=None):
+        self.artifact = artifact
+        self.monitor = monitor
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.batches = 0
+        self.batched_rows = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='micro-batcher', daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def submit(self, rows):
+        """``rows``: list baris nilai fitur (urutan ``artifact.feature_cols``). Hasil: Future array proba."""
+        future = Future()
+        self._queue.put((rows, future))
+        return future
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            size = len(item[0])
+            deadline = time.monotonic() + self.max_wait
+            stop = False
+            while size < self.max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+                size += len(item[0])
+            self._score(batch, size)
+            if stop:
+                return
+
+    def _score(self, batch, size):
+        frame = pd.DataFrame([row for rows, _ in batch for row in rows],
+                             columns=self.artifact.feature_cols)
+        try:
+            proba = self.artifact.predict_proba(frame)
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        self.batches += 1
+        self.batched_rows += size
+        offset = 0
+        for rows, future in batch:
+            future.set_result(proba[offset:offset + len(rows)])
+            offset += len(rows)
+        if self.monitor is not None:
+            self.monitor.update(frame)
+
+
+class LatencyStats:
+    """Latensi request (jendela geser) dan throughput sejak server start."""
+
+    def __init__(self, window=10_000):
+        self.started = time.monotonic()
+        self.requests = 0
+        self.rows = 0
+        self.errors = 0
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds, rows):
+        with self._lock:
+            self.requests += 1
+            self.rows += rows
+            self._latencies.append(seconds)
+
+    def record_error(self):
+        with self._lock:
+            self.errors += 1
+
+    def snapshot(self):
+        with self._lock:
+            latencies = np.array(self._latencies)
+            requests, rows, errors = self.requests, self.rows, self.errors
+        elapsed = time.monotonic() - self.started
+        p50, p99 = (np.percentile(latencies, [50, 99]) * 1000) if len(latencies) else (0.0, 0.0)
+        return {
+            'requests': requests,
+            'rows': rows,
+            'errors': errors,
+            'p50_ms': round(float(p50), 3),
+            'p99_ms': round(float(p99), 3),
+            'requests_per_sec': round(requests / elapsed, 2),
+            'rows_per_sec': round(rows / elapsed, 2),
+        }
+
+
+def parse_records(payload, feature_cols):
+    """Ubah body JSON menjadi list baris fitur; ValueError jika format/fitur tidak valid."""
+    records = payload.get('records', [payload]) if isinstance(payload, dict) else payload
+    if not isinstance(records, list) or not records:
+        raise ValueError("body harus berupa record atau {\"records\": [...]} yang tidak kosong")
+    rows = []
+    for i, record in enumerate(records):
+        if not isinstance(record, dict):
+            raise ValueError(f"record #{i} harus berupa object JSON")
+        missing = [c for c in feature_cols if c not in record]
+        if missing:
+            raise ValueError(f"record #{i} tidak memiliki fitur: {missing}")
+        try:
+            row = [float(record[c]) for c in feature_cols]
+        except (TypeError, ValueError):
+            raise ValueError(f"record #{i} memiliki nilai fitur yang bukan angka") from None
+        # NaN/Infinity/1e400 lolos float() tetapi membuat batch gagal (sklearn) atau prediksi
+        # seragam (artefak ringkas), dan merusak statistik monitor drift
+        invalid = [c for c, value in zip(feature_cols, row) if not math.isfinite(value)]
+        if invalid:
+            raise ValueError(f"record #{i} memiliki nilai fitur yang tidak hingga: {invalid}")
+        rows.append(row)
+    return rows
+
+
+def format_predictions(artifact, proba):
+    """Hasil per baris; probabilitas dropout dan kategori risiko dari kolom kelas Dropout."""
+    dropout_probs = proba[:, artifact.dropout_index]
+    categories = categorize_risk(dropout_probs)
+    labels = artifact.class_labels
+    return [
+        {
+            'dropout_probability': float(p),
+            'risk_category': None if pd.isna(category) else str(category),
+            'probabilities': dict(zip(labels, map(float, row))),
+        }
+        for p, category, row in zip(dropout_probs, categories, proba)
+    ]
+
+
+class PredictionHandler(BaseHTTPRequestHandler):
+    server_version = 'DropoutService/1.0'
+
+    def _send_json(self, status, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_json(200, {'status': 'ok', 'model_version': self.server.artifact.version})
+        elif self.path == '/stats':
+            batcher = self.server.batcher
+            stats = self.server.stats.snapshot()
+            stats['batches'] = batcher.batches
+            stats['avg_batch_rows'] = round(batcher.batched_rows / batcher.batches, 2) if batcher.batches else 0.0
+            self._send_json(200, stats)
+        elif self.path == '/drift':
+            monitor = self.server.batcher.monitor
+            if monitor is None:
+                self._send_json(404, {'error': 'profil drift model tidak tersedia'})
+                return
+            report = monitor.report().reset_index()
+            self._send_json(200, {
+                'rows': monitor.rows,
+                'features': report.astype(object).where(report.notna(), None).to_dict('records'),
+            })
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        if self.path != '/predict':
+            self._send_json(404, {'error': 'not found'})
+            return
+        start = time.perf_counter()
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length) or b'null')
+            rows = parse_records(payload, self.server.artifact.feature_cols)
+        except ValueError as exc:
+            self.server.stats.record_error()
+            self._send_json(400, {'error': str(exc)})
+            return
+        try:
+            proba = self.server.batcher.submit(rows).result()
+        except Exception as exc:
+            self.server.stats.record_error()
+            self._send_json(500, {'error': str(exc)})
+            return
+        self.server.stats.record(time.perf_counter() - start, len(rows))
+        self._send_json(200, {
+            'model_version': self.server.artifact.version,
+            'predictions': format_predictions(self.server.artifact, proba),
+        })
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(artifact, host='127.0.0.1', port=8000, max_batch=64, max_wait=0.005, verbose=False):
+    """Buat server (belum berjalan); panggil ``serve_forever`` lalu ``shutdown_service`` saat selesai."""
+    server = ThreadingHTTPServer((host, port), PredictionHandler)
+    server.daemon_threads = True
+    server.artifact = artifact
+    profile = load_profile(profile_path(artifact.path)) if artifact.path is not None else None
+    monitor = DriftMonitor(profile) if profile is not None else None
+    server.batcher = MicroBatcher(artifact, max_batch, max_wait, monitor).start()
+    server.stats = LatencyStats()
+    server.verbose = verbose
+    return server
+
+
+def shutdown_service(server):
+    server.shutdown()
+    server.server_close()
+    server.batcher.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Layanan HTTP prediksi dropout dengan micro-batching.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--model', default=str(MODEL_PATH))
+    parser.add_argument('--max-batch', type=int, default=64, help="Maksimal baris per batch.")
+    parser.add_argument('--max-wait-ms', type=float, default=5.0,
+                        help="Waktu tunggu maksimal untuk mengumpulkan batch.")
+    parser.add_argument('--verbose', action='store_true', help="Log setiap request.")
+    args = parser.parse_args(argv)
+
+    artifact = load_artifact(args.model)
+    server = make_server(artifact, args.host, args.port, args.max_batch, args.max_wait_ms / 1000, args.verbose)
+    print(f"Model {artifact.version} melayani di http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shutdown_service(server)
+
+
+if __name__ == '__main__':
+    main()
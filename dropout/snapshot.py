@@ -0,0 +1,228 @@
+"""Snapshot kolumnar biner dari dataset bersih untuk cold start yang cepat.
+
+Format: satu file berisi magic ``DRSNAP01``, panjang header (uint64), header JSON
+(skema, offset kolom, hash sumber), lalu buffer tiap kolom yang di-align 64 byte.
+File dibaca dengan ``np.memmap`` sehingga tidak ada parsing teks sama sekali.
+
+Bangun/refresh snapshot:
+    python -m dropout.snapshot [--data data.csv] [--output data.snapshot] [--benchmark]
+"""
+import argparse
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .config import BASE_DIR, DATA_PATH
+from .fsutil import atomic_write
+
+SNAPSHOT_PATH = BASE_DIR / "data.snapshot"
+MAGIC = b'DRSNAP01'
+ALIGN = 64
+
+
+def _pad(n):
+    return (-n) % ALIGN
+
+
+def write_snapshot(ip, path, source):
+    """Tulis frame ``ip`` ke snapshot; ``source`` berisi sha256/size file asal."""
+    columns = []
+    buffers = []
+    for name in ip.columns:
+        col = ip[name]
+        entry = {'name': name}
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            values = np.ascontiguousarray(col.cat.codes.to_numpy())
+            entry['categories'] = [str(c) for c in col.cat.categories]
+        else:
+            values = np.ascontiguousarray(col.to_numpy())
+        entry['dtype'] = values.dtype.str
+        columns.append(entry)
+        buffers.append(values)
+
+    # Offset dihitung relatif terhadap awal area data
+    offset = 0
+    for entry, values in zip(columns, buffers):
+        entry['offset'] = offset
+        offset += values.nbytes + _pad(values.nbytes)
+
+    header = json.dumps({'rows': len(ip), 'source': source, 'columns': columns}).encode('utf-8')
+    preamble = len(MAGIC) + 8 + len(header)
+
+    def write(tmp):
+        with open(tmp, 'wb') as f:
+            f.write(MAGIC)
+            f.write(len(header).to_bytes(8, 'little'))
+            f.write(header)
+            f.write(b'\0' * _pad(preamble))
+            for values in buffers:
+                f.write(values.tobytes())
+                f.write(b'\0' * _pad(values.nbytes))
+
+    atomic_write(path, write)
+
+
+def write_snapshot_chunks(chunks, path, rows, source):
+    """Tulis snapshot dari iterator frame berskema sama, total ``rows`` baris, tanpa menampung semuanya.
+
+    Skema (kolom, dtype, kategori) diambil dari chunk pertama; setiap chunk ditulis
+    langsung ke posisinya di file lewat ``np.memmap``.
+    """
+    chunks = iter(chunks)
+    first = next(chunks)
+    columns = []
+    offset = 0
+    for name in first.columns:
+        col = first[name]
+        entry = {'name': name}
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            entry['categories'] = [str(c) for c in col.cat.categories]
+            dtype = col.cat.codes.dtype
+        else:
+            dtype = col.to_numpy().dtype
+        entry['dtype'] = dtype.str
+        entry['offset'] = offset
+        nbytes = rows * dtype.itemsize
+        offset += nbytes + _pad(nbytes)
+        columns.append(entry)
+
+    header = json.dumps({'rows': rows, 'source': source, 'columns': columns}).encode('utf-8')
+    preamble = len(MAGIC) + 8 + len(header)
+    base = preamble + _pad(preamble)
+
+    def write(tmp):
+        with open(tmp, 'wb') as f:
+            f.write(MAGIC)
+            f.write(len(header).to_bytes(8, 'little'))
+            f.write(header)
+            f.truncate(base + offset)
+        mm = np.memmap(tmp, dtype=np.uint8, mode='r+')
+        start = 0
+        for chunk in itertools.chain([first], chunks):
+            stop = start + len(chunk)
+            if stop > rows:
+                raise ValueError(f"Chunk melebihi jumlah baris snapshot ({rows})")
+            for entry in columns:
+                col = chunk[entry['name']]
+                values = col.cat.codes.to_numpy() if 'categories' in entry else col.to_numpy()
+                dtype = np.dtype(entry['dtype'])
+                at = base + entry['offset']
+                mm[at + start * dtype.itemsize:at + stop * dtype.itemsize] = \
+                    np.ascontiguousarray(values, dtype=dtype).view(np.uint8)
+            start = stop
+        mm.flush()
+        del mm
+        if start != rows:
+            raise ValueError(f"Snapshot berisi {start} baris, seharusnya {rows}")
+
+    atomic_write(path, write)
+
+
+def read_header(path):
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} bukan file snapshot yang valid")
+        size = int.from_bytes(f.read(8), 'little')
+        header = json.loads(f.read(size).decode('utf-8'))
+    preamble = len(MAGIC) + 8 + size
+    header['data_offset'] = preamble + _pad(preamble)
+    return header
+
+
+def read_snapshot(path, expected_sha256=None):
+    """Muat snapshot via memory-map. Kembalikan None jika tidak ada atau sudah basi."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    header = read_header(path)
+    if expected_sha256 is not None and header['source'].get('sha256') != expected_sha256:
+        return None
+
+    mm = np.memmap(path, dtype=np.uint8, mode='r')
+    rows = header['rows']
+    base = header['data_offset']
+    data = {}
+    for entry in header['columns']:
+        dtype = np.dtype(entry['dtype'])
+        start = base + entry['offset']
+        values = mm[start:start + rows * dtype.itemsize].view(dtype).view(np.ndarray)
+        if 'categories' in entry:
+            values = pd.Categorical.from_codes(values, entry['categories'])
+        data[entry['name']] = values
+    return pd.DataFrame(data, copy=False)
+
+
+def build_snapshot(data_path=DATA_PATH, output=SNAPSHOT_PATH):
+    from .data import file_sha256, read_dataset
+
+    ip = read_dataset(data_path)
+    source = {'path': Path(data_path).name, 'sha256': file_sha256(data_path),
+              'size': os.path.getsize(data_path)}
+    write_snapshot(ip, output, source)
+    return ip
+
+
+# Kode yang dijalankan di interpreter baru untuk mengukur cold start;
+# mencetak waktu total (termasuk import) dan waktu load saja
+_COLD_START_CSV = """
+import time; t0 = time.perf_counter()
+from dropout.data import read_dataset
+t1 = time.perf_counter()
+read_dataset({data!r})
+t2 = time.perf_counter()
+print(t2 - t0, t2 - t1)
+"""
+_COLD_START_SNAPSHOT = """
+import time; t0 = time.perf_counter()
+from dropout.data import file_sha256
+from dropout.snapshot import read_snapshot
+t1 = time.perf_counter()
+assert read_snapshot({snapshot!r}, file_sha256({data!r})) is not None
+t2 = time.perf_counter()
+print(t2 - t0, t2 - t1)
+"""
+
+
+def benchmark_cold_start(data_path=DATA_PATH, snapshot_path=SNAPSHOT_PATH, repeat=5):
+    """Median waktu (detik) di proses baru, CSV vs snapshot: {'csv': (total, load), ...}."""
+    results = {}
+    for name, template in [('csv', _COLD_START_CSV), ('snapshot', _COLD_START_SNAPSHOT)]:
+        code = template.format(data=str(data_path), snapshot=str(snapshot_path))
+        timings = []
+        for _ in range(repeat):
+            out = subprocess.run([sys.executable, '-c', code], cwd=BASE_DIR,
+                                 capture_output=True, text=True, check=True)
+            timings.append([float(v) for v in out.stdout.split()[-2:]])
+        total, load = np.median(timings, axis=0)
+        results[name] = (float(total), float(load))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bangun snapshot biner dari data.csv.")
+    parser.add_argument('--data', default=str(DATA_PATH))
+    parser.add_argument('--output', default=str(SNAPSHOT_PATH))
+    parser.add_argument('--benchmark', action='store_true',
+                        help="Ukur waktu load cold start CSV vs snapshot.")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    ip = build_snapshot(args.data, args.output)
+    print(f"Snapshot {len(ip)} baris ditulis ke {args.output} "
+          f"({os.path.getsize(args.output) / 1024:.1f} KB, {time.perf_counter() - start:.2f}s)")
+
+    if args.benchmark:
+        results = benchmark_cold_start(args.data, args.output)
+        for name, (total, load) in results.items():
+            print(f"Cold start {name:<8}: total {total * 1000:7.1f} ms, load {load * 1000:7.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,323 @@
+"""Penyimpanan skor risiko lokal (SQLite): scoring inkremental dan query berindeks.
+
+Tabel ``scores`` menyimpan probabilitas per (versi model, hash ``feature_cols``)
+sehingga refresh hanya memanggil ``predict_proba`` untuk baris yang baru atau
+berubah. Tabel ``students`` berisi hasil scoring terakhir per baris data (``row``
+sama dengan index dataset dashboard, lihat ``iter_clean_chunks``), berindeks pada kategori risiko, program studi, dan flag utama, untuk query
+berhalaman dari dashboard dan CLI tanpa memuat seluruh tabel ke memori.
+
+Jalankan:
+    python -m dropout.store refresh [--input data.csv] [--model ...]
+    python -m dropout.store query --risk "Risiko Tinggi" --course Nursing --unpaid [--page 1]
+"""
+import argparse
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .config import BASE_DIR, COURSE_MAPPING, DATA_PATH, MODEL_PATH, TARGET_COL, TARGET_LABELS
+from .data import file_sha256, iter_clean_chunks
+from .model import load_artifact
+from .scoring import DEFAULT_CHUNKSIZE, categorize_risk
+
+STORE_PATH = BASE_DIR / "scores.sqlite"
+DEFAULT_PAGE_SIZE = 50
+# Versi format isi store (PRAGMA user_version). Naikkan jika arti kolom berubah
+# agar skor lama dengan versi model yang sama tidak dipakai ulang.
+# 2: probability = P(Dropout) (sebelumnya kolom predict_proba ke-1, P(Enrolled))
+# 3: students.row = index dataset dashboard setelah dropna/drop_duplicates (sebelumnya baris CSV)
+STORE_FORMAT = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    model_version TEXT NOT NULL,
+    feature_hash INTEGER NOT NULL,
+    probability REAL NOT NULL,
+    PRIMARY KEY (model_version, feature_hash)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS students (
+    row INTEGER PRIMARY KEY,
+    course INTEGER,
+    course_name TEXT,
+    age INTEGER,
+    admission_grade REAL,
+    scholarship INTEGER,
+    grade_1st_sem REAL,
+    tuition_up_to_date INTEGER,
+    debtor INTEGER,
+    status TEXT,
+    probability REAL,
+    risk_category TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_students_risk_course ON students (risk_category, course_name);
+CREATE INDEX IF NOT EXISTS idx_students_course ON students (course_name);
+CREATE INDEX IF NOT EXISTS idx_students_tuition ON students (tuition_up_to_date);
+CREATE INDEX IF NOT EXISTS idx_students_scholarship ON students (scholarship);
+CREATE INDEX IF NOT EXISTS idx_students_debtor ON students (debtor);
+CREATE INDEX IF NOT EXISTS idx_students_probability ON students (probability);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Kolom tabel students -> nama kolom di DataFrame (sama dengan dataset/dashboard)
+STUDENT_COLUMNS = {
+    'course': 'Course',
+    'course_name': 'Course Name',
+    'age': 'Age at enrollment',
+    'admission_grade': 'Admission grade',
+    'scholarship': 'Scholarship holder',
+    'grade_1st_sem': 'Curricular units 1st sem (grade)',
+    'tuition_up_to_date': 'Tuition fees up to date',
+    'debtor': 'Debtor',
+    'status': 'Status',
+    'probability': 'Dropout Probability',
+    'risk_category': 'Risk Category',
+}
+# Filter kesamaan yang boleh dipakai query (semuanya berindeks)
+FILTER_COLUMNS = ('risk_category', 'course_name', 'tuition_up_to_date', 'scholarship', 'debtor')
+SORT_ORDERS = {'row': 'row', 'probability': 'probability DESC, row'}
+
+
+def feature_hashes(frame, feature_cols):
+    """Hash 64-bit (int64) per baris dari nilai fitur; dtype sumber (int8/float) tidak berpengaruh."""
+    values = frame[list(feature_cols)].astype('float64')
+    return pd.util.hash_pandas_object(values, index=False).to_numpy().view(np.int64)
+
+
+@dataclass
+class RefreshStats:
+    rows: int = 0
+    # Baris yang hash-nya baru/berubah sehingga perlu di-scoring
+    scored: int = 0
+    # Baris yang memakai probabilitas tersimpan
+    reused: int = 0
+    # Vektor fitur unik yang benar-benar dikirim ke predict_proba
+    predicted: int = 0
+    seconds: float = 0.0
+
+
+def _where(filters):
+    clauses, params = [], []
+    for col, value in filters.items():
+        if col not in FILTER_COLUMNS:
+            raise ValueError(f"Filter tidak dikenal: {col}")
+        if value is not None:
+            clauses.append(f"{col} = ?")
+            params.append(value)
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+class ScoreStore:
+    """Skor per (versi model, hash fitur) dan tabel students di SQLite; aman dari beberapa thread."""
+
+    def __init__(self, path=STORE_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        with closing(self._connect()) as conn:
+            # WAL: pembaca (dashboard/CLI) tidak terblokir saat refresh menulis
+            conn.execute("PRAGMA journal_mode=WAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != STORE_FORMAT:
+                conn.executescript("DROP TABLE IF EXISTS scores; DROP TABLE IF EXISTS students; "
+                                   "DROP TABLE IF EXISTS meta;")
+                conn.execute(f"PRAGMA user_version = {STORE_FORMAT}")
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def _lookup(conn, model_version, hashes):
+        unique = np.unique(hashes)
+        probs = np.full(len(hashes), np.nan)
+        if len(unique) == 0:
+            return probs
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS batch (feature_hash INTEGER PRIMARY KEY)")
+        conn.execute("DELETE FROM batch")
+        conn.executemany("INSERT INTO batch VALUES (?)", ((h,) for h in unique.tolist()))
+        rows = conn.execute(
+            "SELECT s.feature_hash, s.probability FROM batch b JOIN scores s "
+            "ON s.model_version = ? AND s.feature_hash = b.feature_hash", (model_version,)
+        ).fetchall()
+        if rows:
+            known_hashes = np.fromiter((h for h, _ in rows), dtype=np.int64, count=len(rows))
+            known_probs = np.fromiter((p for _, p in rows), dtype=np.float64, count=len(rows))
+            order = np.argsort(known_hashes)
+            known_hashes, known_probs = known_hashes[order], known_probs[order]
+            pos = np.clip(np.searchsorted(known_hashes, hashes), 0, len(known_hashes) - 1)
+            found = known_hashes[pos] == hashes
+            probs[found] = known_probs[pos[found]]
+        return probs
+
+    @staticmethod
+    def _score(conn, artifact, frame, stats):
+        hashes = feature_hashes(frame, artifact.feature_cols)
+        probs = ScoreStore._lookup(conn, artifact.version, hashes)
+        missing = np.isnan(probs)
+        if missing.any():
+            # Vektor fitur kembar cukup di-predict sekali
+            new_hashes, first = np.unique(hashes[missing], return_index=True)
+            new_probs = artifact.predict_dropout(frame.iloc[np.flatnonzero(missing)[first]])
+            conn.executemany(
+                "INSERT OR REPLACE INTO scores VALUES (?, ?, ?)",
+                zip([artifact.version] * len(new_hashes), new_hashes.tolist(), new_probs.tolist()))
+            probs[missing] = new_probs[np.searchsorted(new_hashes, hashes[missing])]
+            stats.predicted += len(new_hashes)
+        stats.rows += len(frame)
+        stats.scored += int(missing.sum())
+        stats.reused += int(len(frame) - missing.sum())
+        return pd.DataFrame({
+            'Dropout Probability': probs,
+            'Risk Category': categorize_risk(probs),
+        }, index=frame.index)
+
+    def lookup(self, model_version, hashes):
+        """Probabilitas tersimpan untuk tiap hash (NaN jika belum ada)."""
+        with closing(self._connect()) as conn:
+            return self._lookup(conn, model_version, hashes)
+
+    def score_frame(self, artifact, frame, stats=None):
+        """Sama dengan ``dropout.scoring.score_frame``, tetapi hanya baris baru/berubah yang di-predict."""
+        stats = stats if stats is not None else RefreshStats()
+        with self._lock, closing(self._connect()) as conn, conn:
+            return self._score(conn, artifact, frame, stats)
+
+    def prune(self, keep_version):
+        """Hapus skor model lain; kembalikan jumlah baris yang dihapus."""
+        with self._lock, closing(self._connect()) as conn, conn:
+            return conn.execute("DELETE FROM scores WHERE model_version != ?", (keep_version,)).rowcount
+
+    def meta(self):
+        with closing(self._connect()) as conn:
+            return dict(conn.execute("SELECT key, value FROM meta").fetchall())
+
+    def is_current(self, dataset_version, model_version):
+        """True jika tabel students berasal dari versi dataset dan model ini."""
+        meta = self.meta()
+        return meta.get('dataset_version') == dataset_version and meta.get('model_version') == model_version
+
+    def count(self, filters=None):
+        where, params = _where(filters or {})
+        with closing(self._connect()) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM students{where}", params).fetchone()[0]
+
+    def query(self, filters=None, page=1, page_size=DEFAULT_PAGE_SIZE, sort='row'):
+        """Satu halaman baris students yang cocok dengan ``{kolom: nilai}`` (lihat FILTER_COLUMNS)."""
+        where, params = _where(filters or {})
+        sql = (f"SELECT row, {', '.join(STUDENT_COLUMNS)} FROM students{where} "
+               f"ORDER BY {SORT_ORDERS[sort]} LIMIT ? OFFSET ?")
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql, params + [page_size, (max(1, page) - 1) * page_size]).fetchall()
+        frame = pd.DataFrame(rows, columns=['row'] + list(STUDENT_COLUMNS.values()))
+        return frame.set_index('row')
+
+
+def _student_rows(chunk, scores):
+    target = chunk[TARGET_COL]
+    if pd.api.types.is_numeric_dtype(target):
+        # Snapshot menyimpan Target sebagai kode 0/1/2
+        target = pd.Series(pd.Categorical.from_codes(target, TARGET_LABELS), index=chunk.index)
+    columns = [
+        chunk.index.to_numpy(),
+        chunk['Course'].to_numpy(),
+        chunk['Course'].map(COURSE_MAPPING).to_numpy(),
+        chunk['Age at enrollment'].to_numpy(),
+        chunk['Admission grade'].to_numpy(),
+        chunk['Scholarship holder'].to_numpy(),
+        chunk['Curricular units 1st sem (grade)'].to_numpy(),
+        chunk['Tuition fees up to date'].to_numpy(),
+        chunk['Debtor'].to_numpy(),
+        target.astype(str).to_numpy(),
+        scores['Dropout Probability'].to_numpy(),
+        scores['Risk Category'].astype(object).to_numpy(),
+    ]
+    return zip(*(c.tolist() for c in columns))
+
+
+def refresh(store, artifact, input_path, chunksize=DEFAULT_CHUNKSIZE):
+    """Perbarui skor dan tabel students dari seluruh file, per chunk. Kembalikan RefreshStats.
+
+    Data dibersihkan seperti dataset dashboard (baris kosong dan duplikat
+    dilewati), jadi ``row`` sama dengan index frame ``load_dataset``. Seluruh
+    refresh satu transaksi: pembaca tetap melihat isi lama sampai commit.
+    """
+    stats = RefreshStats()
+    start = time.perf_counter()
+    features = list(artifact.feature_cols)
+    columns = features + ['Course', 'Debtor', TARGET_COL]
+    placeholders = ', '.join('?' * (len(STUDENT_COLUMNS) + 1))
+    with store._lock, closing(store._connect()) as conn, conn:
+        conn.execute("DELETE FROM students")
+        for chunk in iter_clean_chunks(input_path, chunksize, columns=columns):
+            scores = store._score(conn, artifact, chunk, stats)
+            conn.executemany(f"INSERT INTO students VALUES ({placeholders})", _student_rows(chunk, scores))
+        conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", [
+            ('dataset_version', file_sha256(input_path)[:12]),
+            ('model_version', artifact.version),
+        ])
+        # Statistik indeks untuk query planner (pilih indeks paling selektif)
+        conn.execute("ANALYZE students")
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Penyimpanan skor risiko dropout (SQLite).")
+    parser.add_argument('--db', default=str(STORE_PATH))
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    refresh_cmd = commands.add_parser('refresh', help="Scoring inkremental: hanya baris baru/berubah.")
+    refresh_cmd.add_argument('--input', default=str(DATA_PATH), help="CSV (delimiter ';') atau file snapshot.")
+    refresh_cmd.add_argument('--model', default=str(MODEL_PATH))
+    refresh_cmd.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE)
+    refresh_cmd.add_argument('--keep-old-models', action='store_true',
+                             help="Jangan hapus skor dari versi model lain.")
+
+    query_cmd = commands.add_parser('query', help="Tampilkan satu halaman mahasiswa hasil scoring terakhir.")
+    query_cmd.add_argument('--risk', help="Kategori risiko, mis. 'Risiko Tinggi'.")
+    query_cmd.add_argument('--course', help="Nama program studi, mis. 'Nursing'.")
+    query_cmd.add_argument('--unpaid', action='store_true', help="Hanya yang biaya kuliahnya belum lunas.")
+    query_cmd.add_argument('--scholarship', type=int, choices=[0, 1])
+    query_cmd.add_argument('--debtor', type=int, choices=[0, 1])
+    query_cmd.add_argument('--sort', choices=sorted(SORT_ORDERS), default='probability')
+    query_cmd.add_argument('--page', type=int, default=1)
+    query_cmd.add_argument('--page-size', type=int, default=DEFAULT_PAGE_SIZE)
+    args = parser.parse_args(argv)
+
+    store = ScoreStore(args.db)
+
+    if args.command == 'query':
+        filters = {
+            'risk_category': args.risk,
+            'course_name': args.course,
+            'tuition_up_to_date': 0 if args.unpaid else None,
+            'scholarship': args.scholarship,
+            'debtor': args.debtor,
+        }
+        total = store.count(filters)
+        pages = max(1, -(-total // args.page_size))
+        page = store.query(filters, args.page, args.page_size, args.sort)
+        print(page.to_string())
+        print(f"Halaman {args.page} dari {pages} ({total} mahasiswa)")
+        return
+
+    artifact = load_artifact(args.model)
+    stats = refresh(store, artifact, args.input, args.chunksize)
+    pruned = 0 if args.keep_old_models else store.prune(artifact.version)
+    print(f"{stats.rows} baris: {stats.scored} di-scoring ({stats.predicted} vektor fitur unik), "
+          f"{stats.reused} memakai skor tersimpan, dalam {stats.seconds:.2f}s")
+    if pruned:
+        print(f"{pruned} skor dari versi model lain dihapus")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+"""Generator kohort sintetis berskema sama dengan ``data.csv`` untuk uji beban dan skala.
+
+Model dipelajari dari ``data.csv`` per kelas Target: proporsi kelas, distribusi
+marginal empiris tiap kolom, dan korelasi antarkolom (Gaussian copula atas
+rank). Karena semuanya dipisah per kelas, hubungan Target dengan curricular
+units, pembayaran, debtor, usia, dan kolom lain ikut terbawa. Kolom diskrit
+hanya berisi nilai yang memang ada di data asli; kolom pecahan diinterpolasi
+antar kuantil.
+
+Output ditulis bertahap per chunk (memori tidak bergantung jumlah baris).
+Seed dan chunksize yang sama menghasilkan file yang identik.
+
+Jalankan:
+    python -m dropout.synth --rows 1000000 --output synth.csv [--seed 42] [--chunksize 100000]
+    python -m dropout.synth --rows 1000000 --output synth.snapshot --format snapshot
+    python -m dropout.synth --rows 100000 --report
+"""
+import argparse
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr, ndtri
+
+from .config import DATA_PATH, TARGET_COL, TARGET_LABELS
+from .data import COLUMN_DTYPES
+from .snapshot import write_snapshot_chunks
+
+DEFAULT_CHUNKSIZE = 100_000
+# Kolom yang hubungannya dengan Target dicek oleh --report
+KEY_COLUMNS = [
+    'Curricular units 1st sem (approved)', 'Curricular units 2nd sem (approved)',
+    'Curricular units 1st sem (grade)', 'Tuition fees up to date', 'Debtor', 'Age at enrollment',
+]
+
+
+@dataclass(frozen=True)
+class ClassModel:
+    prior: float
+    # Nilai terurut per kolom (n_kelas x n_kolom): invers CDF empiris
+    sorted_values: np.ndarray
+    # Faktor Cholesky matriks korelasi copula (n_kolom x n_kolom)
+    chol: np.ndarray
+
+
+@dataclass(frozen=True)
+class CohortModel:
+    # Nama kolom persis seperti di header CSV sumber (tanpa Target)
+    columns: list
+    target_col: str
+    # True untuk kolom bilangan bulat (nilai diambil apa adanya, tanpa interpolasi)
+    discrete: np.ndarray
+    classes: dict
+
+
+def _nearest_correlation(corr):
+    """Matriks korelasi valid (positive definite) terdekat lewat pemotongan eigenvalue."""
+    corr = np.nan_to_num(corr)
+    np.fill_diagonal(corr, 1.0)
+    w, v = np.linalg.eigh(corr)
+    corr = (v * np.clip(w, 1e-6, None)) @ v.T
+    d = np.sqrt(np.diag(corr))
+    return corr / np.outer(d, d)
+
+
+def fit(path=DATA_PATH):
+    """Pelajari CohortModel dari CSV (delimiter ';')."""
+    raw = pd.read_csv(path, delimiter=';').dropna()
+    target_col = next(c for c in raw.columns if c.strip() == TARGET_COL)
+    columns = [c for c in raw.columns if c != target_col]
+    discrete = np.array([raw[c].dtype.kind in 'iub' for c in columns])
+
+    classes = {}
+    for label, part in raw.groupby(target_col):
+        values = part[columns]
+        # Rank -> uniform -> normal standar; korelasi di ruang normal = parameter copula
+        u = (values.rank(method='average').to_numpy() - 0.5) / len(part)
+        corr = _nearest_correlation(np.corrcoef(ndtri(u), rowvar=False))
+        classes[label] = ClassModel(
+            prior=len(part) / len(raw),
+            sorted_values=np.sort(values.to_numpy(dtype=float), axis=0),
+            chol=np.linalg.cholesky(corr),
+        )
+    return CohortModel(columns=columns, target_col=target_col, discrete=discrete, classes=classes)
+
+
+def _sample_class(cls, n, discrete, rng):
+    z = rng.standard_normal((n, cls.chol.shape[0])) @ cls.chol.T
+    u = ndtr(z)
+    size = len(cls.sorted_values)
+    # Kolom diskrit: ambil order statistic; kolom pecahan: interpolasi linear antar order statistic
+    pos = u * (size - 1)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, size - 1)
+    cols = np.arange(cls.sorted_values.shape[1])
+    low, high = cls.sorted_values[lo, cols], cls.sorted_values[hi, cols]
+    interp = low + (pos - lo) * (high - low)
+    nearest = cls.sorted_values[np.rint(pos).astype(np.intp), cols]
+    return np.where(discrete, nearest, np.round(interp, 3))
+
+
+def sample(model, n, rng):
+    """Satu frame ``n`` baris berskema CSV sumber (Target berupa label)."""
+    labels = list(model.classes)
+    priors = np.array([model.classes[label].prior for label in labels])
+    counts = rng.multinomial(n, priors / priors.sum())
+    parts, targets = [], []
+    for label, count in zip(labels, counts):
+        parts.append(_sample_class(model.classes[label], count, model.discrete, rng))
+        targets.append(np.full(count, label, dtype=object))
+    values = np.concatenate(parts)
+    target = np.concatenate(targets)
+    # Acak urutan agar kelas tidak berkelompok
+    order = rng.permutation(n)
+    frame = pd.DataFrame(values[order], columns=model.columns)
+    for col, is_discrete in zip(model.columns, model.discrete):
+        if is_discrete:
+            frame[col] = frame[col].astype('int64')
+    frame[model.target_col] = target[order]
+    return frame
+
+
+def generate(model, rows, chunksize=DEFAULT_CHUNKSIZE, seed=42):
+    """Hasilkan frame per chunk sampai total ``rows`` baris."""
+    rng = np.random.default_rng(seed)
+    for start in range(0, rows, chunksize):
+        yield sample(model, min(chunksize, rows - start), rng)
+
+
+def to_clean_schema(chunk):
+    """Chunk berskema CSV -> skema dataset bersih (nama kolom di-strip, dtype tetap, Target kode 0/1/2)."""
+    chunk = chunk.rename(columns=lambda c: c.strip())
+    dtypes = {c: COLUMN_DTYPES[c] for c in chunk.columns if c in COLUMN_DTYPES and c != TARGET_COL}
+    chunk = chunk.astype(dtypes)
+    chunk[TARGET_COL] = pd.Categorical(chunk[TARGET_COL], categories=TARGET_LABELS).codes.astype('int8')
+    return chunk
+
+
+def write_csv(model, rows, output, chunksize=DEFAULT_CHUNKSIZE, seed=42):
+    with open(output, 'w', newline='', encoding='utf-8') as f:
+        for i, chunk in enumerate(generate(model, rows, chunksize, seed)):
+            chunk.to_csv(f, sep=';', index=False, header=i == 0)
+    return output
+
+
+def write_snapshot(model, rows, output, chunksize=DEFAULT_CHUNKSIZE, seed=42):
+    """Snapshot biner (lihat ``dropout.snapshot``) berisi dataset bersih sintetis."""
+    source = {'generator': 'dropout.synth', 'seed': seed, 'rows': rows, 'sha256': None}
+    chunks = (to_clean_schema(chunk) for chunk in generate(model, rows, chunksize, seed))
+    write_snapshot_chunks(chunks, output, rows, source)
+    return output
+
+
+def report(source, synthetic):
+    """Bandingkan proporsi Target dan rata-rata KEY_COLUMNS per Target: sumber vs sintetis."""
+    rows = []
+    for name, frame in [('sumber', source), ('sintetis', synthetic)]:
+        frame = frame.rename(columns=lambda c: c.strip())
+        share = frame[TARGET_COL].value_counts(normalize=True)
+        means = frame.groupby(TARGET_COL)[KEY_COLUMNS].mean()
+        for label in TARGET_LABELS:
+            rows.append({'data': name, TARGET_COL: label, 'proporsi': share.get(label, 0.0),
+                         **means.loc[label].to_dict()})
+    return pd.DataFrame(rows).set_index(['data', TARGET_COL]).round(3)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generator kohort sintetis berskema data.csv.")
+    parser.add_argument('--source', default=str(DATA_PATH), help="CSV acuan distribusi.")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--output', default='synth.csv')
+    parser.add_argument('--format', choices=['csv', 'snapshot'], default='csv')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument('--report', action='store_true',
+                        help="Tampilkan perbandingan distribusi sumber vs sintetis, tanpa menulis file.")
+    args = parser.parse_args(argv)
+
+    model = fit(args.source)
+    if args.report:
+        synthetic = pd.concat(generate(model, args.rows, args.chunksize, args.seed))
+        print(report(pd.read_csv(args.source, delimiter=';'), synthetic).to_string())
+        return
+
+    start = time.perf_counter()
+    writer = write_snapshot if args.format == 'snapshot' else write_csv
+    writer(model, args.rows, args.output, args.chunksize, args.seed)
+    seconds = time.perf_counter() - start
+    print(f"{args.rows} baris sintetis ditulis ke {args.output} dalam {seconds:.2f}s "
+          f"({args.rows / seconds:,.0f} baris/detik)")
+
+
+if __name__ == '__main__':
+    main()
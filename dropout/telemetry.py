@@ -0,0 +1,180 @@
+"""Timing span ringan untuk tahap-tahap dashboard dan ekspor latensinya.
+
+Setiap rerun halaman membuka satu trace (``start_trace``) yang mengumpulkan durasi
+``span`` per nama, lalu ditutup dengan ``finish_trace``. Trace yang selesai masuk
+ke registry proses (sampel terakhir per halaman/span untuk p50/p95/p99) dan, jika
+env ``DROPOUT_TIMING_LOG`` di-set, ditambahkan sebagai satu baris JSON ke file itu.
+
+Ringkasan dari log JSON lines:
+    python -m dropout.telemetry timings.jsonl [--format summary|prometheus]
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import numpy as np
+
+LOG_ENV = 'DROPOUT_TIMING_LOG'
+QUANTILES = (0.5, 0.95, 0.99)
+MAX_SAMPLES = 2048
+
+
+@dataclass
+class Trace:
+    page: str
+    started: float = field(default_factory=time.perf_counter)
+    timestamp: float = field(default_factory=time.time)
+    total: float = 0.0
+    # Nama span -> total detik dalam trace ini (span bernama sama dijumlahkan)
+    spans: dict = field(default_factory=lambda: defaultdict(float))
+    # Nama cache -> statistik (hits/misses/hit_rate) yang dilaporkan halaman pada rerun ini
+    caches: dict = field(default_factory=dict)
+
+    def to_record(self):
+        return {
+            'ts': round(self.timestamp, 3),
+            'page': self.page,
+            'total_ms': round(self.total * 1000, 3),
+            'spans_ms': {name: round(seconds * 1000, 3) for name, seconds in self.spans.items()},
+        }
+
+
+class Registry:
+    """Sampel latensi terakhir per halaman dan per span, dipakai bersama semua sesi."""
+
+    def __init__(self, maxlen=MAX_SAMPLES):
+        self._pages = defaultdict(lambda: deque(maxlen=maxlen))
+        self._spans = defaultdict(lambda: deque(maxlen=maxlen))
+        self._counts = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def add(self, trace):
+        with self._lock:
+            self._pages[trace.page].append(trace.total)
+            self._counts[trace.page] += 1
+            for name, seconds in trace.spans.items():
+                self._spans[name].append(seconds)
+
+    def page_summary(self):
+        with self._lock:
+            return {page: _summarize(samples, self._counts[page]) for page, samples in self._pages.items()}
+
+    def span_summary(self):
+        with self._lock:
+            return {name: _summarize(samples, len(samples)) for name, samples in self._spans.items()}
+
+
+def _summarize(samples, count):
+    values = np.fromiter(samples, dtype=float)
+    summary = {'count': count, 'sum': float(values.sum())}
+    for q in QUANTILES:
+        summary[f"p{round(q * 100)}"] = float(np.quantile(values, q)) if len(values) else float('nan')
+    return summary
+
+
+registry = Registry()
+_local = threading.local()
+_log_lock = threading.Lock()
+
+
+def start_trace(page):
+    """Mulai trace baru untuk rerun ``page`` di thread ini (trace lama dibuang)."""
+    _local.trace = Trace(page)
+    return _local.trace
+
+
+def current_trace():
+    return getattr(_local, 'trace', None)
+
+
+@contextmanager
+def span(name):
+    """Catat durasi blok ke trace aktif (tanpa trace aktif, span diabaikan)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace = current_trace()
+        if trace is not None:
+            trace.spans[name] += time.perf_counter() - start
+
+
+def note_cache(name, stats):
+    """Lampirkan statistik cache (dict dengan hit_rate) ke trace aktif."""
+    trace = current_trace()
+    if trace is not None:
+        trace.caches[name] = stats
+
+
+def finish_trace(log_path=None):
+    """Tutup trace aktif: simpan ke registry dan log JSON lines (jika ada). Kembalikan Trace."""
+    trace = current_trace()
+    if trace is None:
+        return None
+    _local.trace = None
+    trace.total = time.perf_counter() - trace.started
+    registry.add(trace)
+    log_path = log_path or os.environ.get(LOG_ENV)
+    if log_path:
+        line = json.dumps(trace.to_record())
+        with _log_lock, open(log_path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+    return trace
+
+
+def prometheus_text(page_summary, span_summary, gauges=None):
+    """Format teks eksposisi Prometheus (summary per halaman/span + gauge opsional)."""
+    lines = []
+    for metric, label, summaries in [('dropout_page_seconds', 'page', page_summary),
+                                     ('dropout_span_seconds', 'span', span_summary)]:
+        lines.append(f"# TYPE {metric} summary")
+        for key, summary in sorted(summaries.items()):
+            for q in QUANTILES:
+                value = summary[f"p{round(q * 100)}"]
+                lines.append(f'{metric}{{{label}="{key}",quantile="{q}"}} {value:.6f}')
+            lines.append(f'{metric}_sum{{{label}="{key}"}} {summary["sum"]:.6f}')
+            lines.append(f'{metric}_count{{{label}="{key}"}} {summary["count"]}')
+    for name, value in (gauges or {}).items():
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name} {value}")
+    return '\n'.join(lines) + '\n'
+
+
+def read_log(path):
+    """Bangun Registry dari file log JSON lines."""
+    log_registry = Registry(maxlen=None)
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            trace = Trace(record['page'], total=record['total_ms'] / 1000)
+            trace.spans.update({name: ms / 1000 for name, ms in record['spans_ms'].items()})
+            log_registry.add(trace)
+    return log_registry
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ringkas log timing dashboard (JSON lines).")
+    parser.add_argument('log', help=f"File log (lihat env {LOG_ENV}).")
+    parser.add_argument('--format', choices=['summary', 'prometheus'], default='summary')
+    args = parser.parse_args(argv)
+
+    log_registry = read_log(args.log)
+    if args.format == 'prometheus':
+        print(prometheus_text(log_registry.page_summary(), log_registry.span_summary()), end='')
+        return
+    for title, summary in [('Halaman', log_registry.page_summary()), ('Span', log_registry.span_summary())]:
+        print(f"{title}:")
+        for name, s in sorted(summary.items()):
+            print(f"  {name:<22} n={s['count']:<6} p50={s['p50'] * 1000:8.1f} ms  "
+                  f"p95={s['p95'] * 1000:8.1f} ms  p99={s['p99'] * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+"""Pelatihan model prediksi dropout secara offline.
+
+Jalankan:
+    python -m dropout.train [--data data.csv] [--output dropout_prediction_svm_model.joblib]
+                            [--model-type svm|nystroem|rff]
+    python -m dropout.train --compare
+
+``svm`` adalah SVC RBF eksak. ``nystroem`` dan ``rff`` mengaproksimasi kernel RBF
+dengan feature map (Nystroem / Random Fourier Features) lalu LinearSVC yang
+probabilitasnya dikalibrasi (sigmoid/Platt), sehingga biaya training linear
+terhadap jumlah baris dan biaya inferensi tidak bergantung jumlah support vector.
+"""
+import argparse
+import io
+import json
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import joblib
+import pandas as pd
+import sklearn
+from sklearn.calibration import CalibratedClassifierCV
+from sklearn.kernel_approximation import Nystroem, RBFSampler
+from sklearn.metrics import accuracy_score, f1_score, roc_auc_score
+from sklearn.model_selection import train_test_split
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC, LinearSVC
+
+from .compact import compact_path, from_pipeline, write_compact
+from .config import DATA_PATH, FEATURE_COLS, MODEL_PATH, TARGET_COL, TARGET_LABELS
+from .data import file_sha256, read_dataset
+from .drift import profile_path, save_profile, training_profile
+from .fsutil import atomic_write
+from .model import metadata_path
+
+
+MODEL_TYPES = ('svm', 'nystroem', 'rff')
+
+# Setelah StandardScaler variansi tiap fitur = 1, jadi gamma='scale' milik SVC = 1 / n_fitur
+KERNEL_GAMMA = 1.0 / len(FEATURE_COLS)
+KERNEL_COMPONENTS = 300
+
+
+def build_pipeline(random_state=None, model_type='svm'):
+    if model_type == 'svm':
+        return Pipeline([
+            ('scaler', StandardScaler()),
+            ('svm', SVC(probability=True, random_state=random_state)),
+        ])
+    if model_type == 'nystroem':
+        feature_map = Nystroem(gamma=KERNEL_GAMMA, n_components=KERNEL_COMPONENTS,
+                               random_state=random_state)
+    elif model_type == 'rff':
+        feature_map = RBFSampler(gamma=KERNEL_GAMMA, n_components=KERNEL_COMPONENTS,
+                                 random_state=random_state)
+    else:
+        raise ValueError(f"model_type tidak dikenal: {model_type!r} (pilih dari {MODEL_TYPES})")
+    return Pipeline([
+        ('scaler', StandardScaler()),
+        ('kernel', feature_map),
+        ('linear', CalibratedClassifierCV(LinearSVC(random_state=random_state), method='sigmoid', cv=3)),
+    ])
+
+
+def split_dataset(data_path=DATA_PATH, random_state=42, feature_cols=FEATURE_COLS):
+    ip = read_dataset(data_path)
+    X = ip[list(feature_cols)]
+    y = ip[TARGET_COL]
+    return train_test_split(X, y, stratify=y, random_state=random_state)
+
+
+def evaluate(pipeline, X_test, y_test):
+    proba = pipeline.predict_proba(X_test)
+    pred = pipeline.classes_[proba.argmax(axis=1)]
+    return {
+        'accuracy': round(float(accuracy_score(y_test, pred)), 4),
+        'f1_macro': round(float(f1_score(y_test, pred, average='macro')), 4),
+        'roc_auc_ovr': round(float(roc_auc_score(y_test, proba, multi_class='ovr')), 4),
+    }
+
+
+def train(data_path=DATA_PATH, random_state=42, model_type='svm', pipeline=None):
+    """Latih pipeline dan kembalikan (pipeline, metadata).
+
+    ``pipeline`` (belum di-fit) menggantikan ``build_pipeline(model_type)``; dipakai
+    ``dropout.selection`` untuk kandidat di luar MODEL_TYPES.
+    """
+    X_train, X_test, y_train, y_test = split_dataset(data_path, random_state)
+
+    if pipeline is None:
+        pipeline = build_pipeline(random_state, model_type)
+    start = time.perf_counter()
+    pipeline.fit(X_train, y_train)
+    train_seconds = time.perf_counter() - start
+
+    data_hash = file_sha256(data_path)
+    created_at = datetime.now(timezone.utc)
+    metadata = {
+        'version': f"{created_at:%Y%m%d%H%M%S}-{data_hash[:8]}",
+        'created_at': created_at.isoformat(),
+        'model_type': model_type,
+        'feature_cols': list(FEATURE_COLS),
+        'target_col': TARGET_COL,
+        'classes': list(TARGET_LABELS),
+        'data_path': Path(data_path).name,
+        'data_sha256': data_hash,
+        'random_state': random_state,
+        'sklearn_version': sklearn.__version__,
+        'n_train': int(len(X_train)),
+        'n_test': int(len(X_test)),
+        'metrics': {
+            **evaluate(pipeline, X_test, y_test),
+            'train_seconds': round(train_seconds, 3),
+        },
+    }
+    return pipeline, metadata
+
+
+def serialized_size(pipeline):
+    buffer = io.BytesIO()
+    joblib.dump(pipeline, buffer)
+    return buffer.tell()
+
+
+def compare_models(data_path=DATA_PATH, random_state=42, model_types=MODEL_TYPES, latency_rows=10_000):
+    """Bandingkan akurasi, waktu training, latensi inferensi, dan ukuran tiap backend pada split yang sama."""
+    X_train, X_test, y_train, y_test = split_dataset(data_path, random_state)
+    reps = -(-latency_rows // len(X_test))
+    X_latency = pd.concat([X_test] * reps, ignore_index=True).iloc[:latency_rows]
+    results = []
+    for model_type in model_types:
+        pipeline = build_pipeline(random_state, model_type)
+        start = time.perf_counter()
+        pipeline.fit(X_train, y_train)
+        train_seconds = time.perf_counter() - start
+
+        pipeline.predict_proba(X_latency.iloc[:100])
+        start = time.perf_counter()
+        pipeline.predict_proba(X_latency)
+        predict_seconds = time.perf_counter() - start
+
+        tracemalloc.start()
+        pipeline.predict_proba(X_latency)
+        predict_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        results.append({
+            'model_type': model_type,
+            **evaluate(pipeline, X_test, y_test),
+            'train_seconds': round(train_seconds, 3),
+            'predict_ms_per_1k': round(predict_seconds * 1000 * 1000 / len(X_latency), 3),
+            'predict_peak_mb': round(predict_peak / 2**20, 2),
+            'model_bytes': serialized_size(pipeline),
+        })
+    return results
+
+
+def save_artifact(pipeline, metadata, path=MODEL_PATH, profile=None):
+    """Simpan pipeline (joblib) beserta metadata JSON dan, untuk SVM, artefak ringkas di sampingnya.
+
+    ``profile`` (lihat ``dropout.drift.training_profile``) ditulis sebagai profil drift model ini.
+    File joblib ditulis paling akhir: mtime-nya bagian dari key cache model dashboard, jadi
+    saat mtime itu berubah metadata dan artefak ringkas versi baru sudah lengkap.
+    """
+    def dump_metadata(tmp):
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2)
+            f.write('\n')
+
+    if profile is not None:
+        save_profile(profile, profile_path(path))
+    # Artefak ringkas (lihat dropout/compact.py) hanya untuk SVC RBF; model lain tetap dimuat via joblib,
+    # jadi artefak ringkas model sebelumnya dihapus agar loader tidak memakainya
+    try:
+        write_compact(from_pipeline(pipeline), compact_path(path), metadata['version'])
+    except ValueError:
+        compact_path(path).unlink(missing_ok=True)
+    atomic_write(metadata_path(path), dump_metadata)
+    atomic_write(path, lambda tmp: joblib.dump(pipeline, tmp))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latih model SVM prediksi dropout secara offline.")
+    parser.add_argument('--data', default=str(DATA_PATH), help="Path dataset CSV (delimiter ';').")
+    parser.add_argument('--output', default=str(MODEL_PATH), help="Path artefak model (.joblib).")
+    parser.add_argument('--random-state', type=int, default=42)
+    parser.add_argument('--model-type', choices=MODEL_TYPES, default='svm',
+                        help="svm (eksak) atau aproksimasi kernel nystroem/rff + linear terkalibrasi.")
+    parser.add_argument('--compare', action='store_true',
+                        help="Bandingkan semua backend pada split yang sama tanpa menyimpan model.")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        results = compare_models(args.data, random_state=args.random_state)
+        print(pd.DataFrame(results).set_index('model_type').to_string())
+        return
+
+    pipeline, metadata = train(args.data, random_state=args.random_state, model_type=args.model_type)
+    save_artifact(pipeline, metadata, args.output, training_profile(args.data, metadata))
+    print(f"Model {metadata['version']} disimpan ke {args.output}")
+    print(json.dumps(metadata['metrics'], indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""Analisis what-if: bagaimana probabilitas dropout berubah jika satu fitur input diubah.
+
+Di sekitar input form, tiap fitur model disapu sepanjang rentangnya (fitur lain
+tetap), lalu seluruh grid beserta input aslinya di-score dengan satu panggilan
+``predict_proba``. Hasilnya kurva sensitivitas per fitur dan besar ayunan
+(swing) probabilitas tiap fitur.
+
+Ukur latensi satu sapuan (tanpa cache) terhadap anggaran:
+    python -m dropout.whatif [--points 1000] [--repeat 20] [--budget-ms 100]
+"""
+import argparse
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .cache import PredictionCache, normalize_input
+from .config import MODEL_PATH
+
+# Rentang tiap fitur, sama dengan batas input form halaman Prediksi: (min, maks, bilangan bulat)
+FEATURE_RANGES = {
+    'Age at enrollment': (15, 70, True),
+    'Admission grade': (95.0, 200.0, False),
+    'Scholarship holder': (0, 1, True),
+    'Curricular units 1st sem (grade)': (0.0, 20.0, False),
+    'Tuition fees up to date': (0, 1, True),
+}
+DEFAULT_POINTS = 200
+DEFAULT_BUDGET_MS = 100
+
+
+@dataclass(frozen=True)
+class Sensitivity:
+    # Probabilitas dropout untuk input apa adanya
+    baseline: float
+    # Format panjang: feature, value, probability (satu baris per titik grid)
+    curves: pd.DataFrame
+
+    def swing(self):
+        """Probabilitas minimum/maksimum per fitur dan selisihnya, diurutkan dari ayunan terbesar."""
+        table = self.curves.groupby('feature', sort=False)['probability'].agg(['min', 'max'])
+        table['swing'] = table['max'] - table['min']
+        return table.sort_values('swing', ascending=False)
+
+
+def feature_values(feature, points=DEFAULT_POINTS):
+    low, high, integer = FEATURE_RANGES[feature]
+    if integer:
+        return np.unique(np.round(np.linspace(low, high, min(points, int(high - low) + 1))))
+    return np.linspace(low, high, points)
+
+
+def sensitivity_grid(record, feature_cols, points=DEFAULT_POINTS):
+    """Frame grid (blok per fitur, fitur lain = ``record``) dan label fitur tiap baris."""
+    base = np.array([float(record[c]) for c in feature_cols])
+    blocks, labels = [], []
+    for i, feature in enumerate(feature_cols):
+        values = feature_values(feature, points)
+        block = np.tile(base, (len(values), 1))
+        block[:, i] = values
+        blocks.append(block)
+        labels.append(np.full(len(values), i, dtype=np.int16))
+    return pd.DataFrame(np.vstack(blocks), columns=feature_cols), np.concatenate(labels)
+
+
+def sensitivity(artifact, record, points=DEFAULT_POINTS):
+    """Kurva sensitivitas semua fitur ``artifact`` untuk ``record``, dengan satu ``predict_proba``."""
+    feature_cols = artifact.feature_cols
+    grid, labels = sensitivity_grid(record, feature_cols, points)
+    # Input asli ikut di-score di baris terakhir agar baseline berasal dari panggilan yang sama
+    frame = pd.concat([grid, pd.DataFrame([[float(record[c]) for c in feature_cols]], columns=feature_cols)],
+                      ignore_index=True)
+    probs = artifact.predict_dropout(frame)
+    curves = pd.DataFrame({
+        'feature': pd.Categorical.from_codes(labels, feature_cols),
+        'value': grid.to_numpy()[np.arange(len(grid)), labels],
+        'probability': probs[:-1],
+    })
+    return Sensitivity(baseline=float(probs[-1]), curves=curves)
+
+
+class SensitivityCache(PredictionCache):
+    """LRU hasil ``sensitivity`` per (input, jumlah titik); dibuang saat versi model berganti."""
+
+    def __init__(self, maxsize=256):
+        super().__init__(maxsize)
+
+    def sensitivity(self, artifact, record, points=DEFAULT_POINTS):
+        values = normalize_input(record, artifact.feature_cols)
+        key = values + (points,)
+        return self._lookup(artifact, key,
+                            lambda: sensitivity(artifact, dict(zip(artifact.feature_cols, values)), points))
+
+
+def benchmark(artifact, points=1000, repeat=20, seed=42):
+    """Latensi satu sapuan (ms) untuk input acak dalam FEATURE_RANGES; kembalikan (n_grid, p50, p95)."""
+    rng = np.random.default_rng(seed)
+    timings = []
+    n_grid = 0
+    for _ in range(repeat + 1):
+        record = {c: rng.uniform(*FEATURE_RANGES[c][:2]) for c in artifact.feature_cols}
+        start = time.perf_counter()
+        n_grid = len(sensitivity(artifact, record, points).curves)
+        timings.append((time.perf_counter() - start) * 1000)
+    # Putaran pertama = pemanasan
+    timings = timings[1:]
+    return n_grid, statistics.median(timings), float(np.percentile(timings, 95))
+
+
+def main(argv=None):
+    from .model import load_artifact
+
+    parser = argparse.ArgumentParser(description="Latensi sapuan what-if halaman Prediksi.")
+    parser.add_argument('--model', default=str(MODEL_PATH))
+    parser.add_argument('--points', type=int, default=1000, help="Titik grid per fitur kontinu.")
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help="Batas p95 latensi satu sapuan (exit code 1 jika terlewati).")
+    args = parser.parse_args(argv)
+
+    artifact = load_artifact(args.model)
+    n_grid, p50, p95 = benchmark(artifact, args.points, args.repeat)
+    print(f"{n_grid} titik grid ({type(artifact.pipeline).__name__}): p50 {p50:.1f} ms, p95 {p95:.1f} ms")
+    if p95 > args.budget_ms:
+        print(f"Melewati anggaran {args.budget_ms:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
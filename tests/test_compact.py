@@ -0,0 +1,39 @@
+"""Anggaran artefak model ringkas: ukuran, waktu load cold start, dan paritas dengan scikit-learn."""
+import shutil
+
+import numpy as np
+import pytest
+
+from dropout.compact import (DEFAULT_ATOL, DEFAULT_MAX_KB, DEFAULT_MAX_LOAD_MS, cold_load_seconds,
+                             compact_path, export, load_compact)
+from dropout.config import MODEL_PATH
+from dropout.data import load_dataset
+from dropout.model import load_artifact, metadata_path
+
+
+@pytest.fixture(scope='module')
+def model_path(tmp_path_factory):
+    # Ekspor dari salinan artefak joblib agar file di root repo tidak tersentuh
+    path = tmp_path_factory.mktemp('model') / MODEL_PATH.name
+    shutil.copy(MODEL_PATH, path)
+    shutil.copy(metadata_path(MODEL_PATH), metadata_path(path))
+    export(path)
+    return path
+
+
+def test_size_budget(model_path):
+    assert compact_path(model_path).stat().st_size / 1024 <= DEFAULT_MAX_KB
+
+
+def test_parity_with_sklearn(model_path):
+    reference = load_artifact(model_path, compact=False)
+    compact = load_compact(compact_path(model_path), reference.version)
+    assert compact is not None
+    X = load_dataset().frame[reference.feature_cols]
+    np.testing.assert_allclose(compact.predict_proba(X), reference.pipeline.predict_proba(X),
+                               rtol=0, atol=DEFAULT_ATOL)
+
+
+def test_cold_load_budget(model_path):
+    # Median beberapa proses baru (import + load + 1 prediksi)
+    assert cold_load_seconds(model_path, compact=True) * 1000 <= DEFAULT_MAX_LOAD_MS
@@ -0,0 +1,34 @@
+"""Rekomendasi pada output model sungguhan: ketiga tier risiko muncul dan cocok dengan aturan per baris."""
+import pytest
+
+from dropout.data import load_dataset
+from dropout.model import load_artifact
+from dropout.recommendations import PROGRAMS, TIERS, _recommend_rowwise, recommend, risk_tier
+from dropout.scoring import score_frame
+
+
+@pytest.fixture(scope='module')
+def scored():
+    frame = load_dataset().frame
+    return frame.join(score_frame(load_artifact(), frame))
+
+
+def test_real_scores_cover_all_tiers(scored):
+    tiers = risk_tier(scored['Risk Category'])
+    assert sorted(set(tiers.tolist())) == [0, 1, 2]
+
+
+def test_every_tier_program_set_is_recommended(scored):
+    table = recommend(scored)
+    recommended = set(table.stack().astype(str))
+    for tier in TIERS:
+        assert recommended & set(PROGRAMS[tier]), tier
+
+
+def test_vectorized_matches_rowwise_per_tier(scored):
+    table = recommend(scored)
+    tiers = risk_tier(scored['Risk Category'])
+    for code in range(len(TIERS)):
+        # Sampel per tier agar perbandingan iterrows tetap cepat
+        sample = scored[tiers == code].head(300)
+        assert (table.loc[sample.index].astype(str) == _recommend_rowwise(sample)).all().all()
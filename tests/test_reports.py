@@ -0,0 +1,47 @@
+"""Laporan per program: hitungan sama dengan scoring penuh, daftar Risiko Tinggi terisi dan dibatasi."""
+import pytest
+
+from dropout.config import DATA_PATH, RISK_LABELS
+from dropout.model import load_artifact
+from dropout.recommendations import recommend
+from dropout.reports import HIGH_RISK, ReportAccumulator
+from dropout.scoring import iter_scored_chunks
+
+
+@pytest.fixture(scope='module')
+def chunks():
+    artifact = load_artifact()
+    keep = ['Course', *artifact.feature_cols]
+    return [chunk.join(recommend(chunk)) for chunk in iter_scored_chunks(artifact, DATA_PATH, 1000, keep)]
+
+
+def _reports(chunks, top):
+    accumulator = ReportAccumulator('Risk Category', top)
+    for chunk in chunks:
+        accumulator.update(chunk)
+    return {report.course: report for report in accumulator.reports()}
+
+
+def test_counts_match_full_scoring(chunks):
+    reports = _reports(chunks, top=10_000)
+    for label in RISK_LABELS:
+        expected = sum(int((chunk['Risk Category'] == label).sum()) for chunk in chunks)
+        assert sum(report.summary[label] for report in reports.values()) == expected
+
+
+def test_high_risk_list_is_filled(chunks):
+    reports = _reports(chunks, top=10_000)
+    listed = sum(len(report.high_risk) for report in reports.values())
+    assert listed > 0
+    for report in reports.values():
+        assert len(report.high_risk) == report.summary[HIGH_RISK]
+        assert report.high_risk['Dropout Probability'].is_monotonic_decreasing
+
+
+def test_high_risk_list_keeps_top_n(chunks):
+    full = _reports(chunks, top=10_000)
+    top = _reports(chunks, top=5)
+    for course, report in top.items():
+        expected = full[course].high_risk.head(5)
+        assert len(report.high_risk) == min(5, report.summary[HIGH_RISK])
+        assert report.high_risk['row'].tolist() == expected['row'].tolist()
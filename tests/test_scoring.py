@@ -0,0 +1,33 @@
+"""Skor risiko memakai kolom kelas Dropout dari ``predict_proba``."""
+import pytest
+
+from dropout.config import RISK_LABELS
+from dropout.data import load_dataset
+from dropout.model import load_artifact
+from dropout.scoring import score_frame
+
+
+@pytest.fixture(scope='module')
+def dataset():
+    return load_dataset()
+
+
+@pytest.fixture(params=[True, False], ids=['compact', 'sklearn'], scope='module')
+def artifact(request):
+    return load_artifact(compact=request.param)
+
+
+def test_dropout_index_follows_classes(artifact):
+    assert list(artifact.pipeline.classes_)[artifact.dropout_index] == 0
+
+
+def test_known_dropouts_score_higher_than_graduates(dataset, artifact):
+    scores = score_frame(artifact, dataset.frame)
+    by_status = scores['Dropout Probability'].groupby(dataset.frame['Status'], observed=True).mean()
+    assert by_status['Dropout'] > by_status['Enrolled'] > by_status['Graduate']
+    assert by_status['Dropout'] - by_status['Graduate'] > 0.2
+
+
+def test_all_risk_categories_occur(dataset, artifact):
+    counts = score_frame(artifact, dataset.frame)['Risk Category'].value_counts()
+    assert (counts.reindex(RISK_LABELS, fill_value=0) > 0).all()
@@ -0,0 +1,96 @@
+"""Validasi input layanan prediksi: nilai fitur tidak hingga ditolak sebelum masuk batch."""
+import json
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dropout.config import FEATURE_COLS, RISK_LABELS
+from dropout.model import load_artifact
+from dropout.service import make_server, parse_records, shutdown_service
+
+VALID = {
+    'Age at enrollment': 20,
+    'Admission grade': 130,
+    'Scholarship holder': 0,
+    'Curricular units 1st sem (grade)': 12,
+    'Tuition fees up to date': 1,
+}
+# Body mentah: json.loads menerima literal NaN/Infinity dan 1e400 menjadi inf
+NON_FINITE = ['NaN', 'Infinity', '-Infinity', '1e400', '"1e400"', '"nan"']
+
+
+def _body(value):
+    record = json.dumps({c: v for c, v in VALID.items() if c != 'Admission grade'})
+    return (record[:-1] + f', "Admission grade": {value}}}').encode('utf-8')
+
+
+def _post(url, body):
+    request = urllib.request.Request(url + '/predict', body, {'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read())
+
+
+@pytest.fixture(params=[True, False], ids=['compact', 'sklearn'])
+def service(request):
+    server = make_server(load_artifact(compact=request.param), port=0, max_wait=0.05)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_port}"
+    shutdown_service(server)
+
+
+@pytest.mark.parametrize('value', NON_FINITE)
+def test_parse_records_rejects_non_finite(value):
+    with pytest.raises(ValueError, match='tidak hingga'):
+        parse_records(json.loads(_body(value)), FEATURE_COLS)
+
+
+@pytest.mark.parametrize('value', NON_FINITE)
+def test_predict_returns_400_for_non_finite(service, value):
+    _, url = service
+    status, body = _post(url, _body(value))
+    assert status == 400
+    assert 'Admission grade' in body['error']
+
+
+def test_valid_request_in_same_batch_unaffected(service):
+    # Request buruk dan baik dikirim bersamaan dalam jendela batch yang sama
+    _, url = service
+    valid = json.dumps(VALID).encode('utf-8')
+    with ThreadPoolExecutor(8) as pool:
+        futures = [pool.submit(_post, url, _body('NaN') if i % 2 else valid) for i in range(8)]
+        results = [future.result() for future in futures]
+    assert [status for status, _ in results] == [200, 400] * 4
+    for status, body in results[::2]:
+        probabilities = body['predictions'][0]['probabilities']
+        assert max(probabilities.values()) - min(probabilities.values()) > 0.01
+
+
+def test_dropout_probability_matches_dropout_class(service):
+    _, url = service
+    # Belum bayar dan nilai semester 1 rendah: P(Dropout) jauh di atas kelas lain
+    risky = dict(VALID, **{'Tuition fees up to date': 0, 'Curricular units 1st sem (grade)': 0})
+    status, body = _post(url, json.dumps({'records': [VALID, risky]}).encode('utf-8'))
+    assert status == 200
+    for prediction in body['predictions']:
+        assert prediction['dropout_probability'] == prediction['probabilities']['Dropout']
+    assert body['predictions'][1]['risk_category'] == RISK_LABELS[-1]
+
+
+def test_drift_stays_valid_json(service):
+    server, url = service
+    if server.batcher.monitor is None:
+        pytest.skip("profil drift model tidak tersedia")
+    for value in NON_FINITE:
+        _post(url, _body(value))
+    _post(url, json.dumps(VALID).encode('utf-8'))
+    with urllib.request.urlopen(url + '/drift') as response:
+        text = response.read().decode('utf-8')
+    report = json.loads(text, parse_constant=lambda name: pytest.fail(f"/drift berisi {name}"))
+    assert report['rows'] == 1
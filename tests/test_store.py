@@ -0,0 +1,56 @@
+"""Store skor: nomor baris sama dengan dataset dashboard, query contoh README tidak kosong."""
+import numpy as np
+import pytest
+
+from dropout.config import DATA_PATH
+from dropout.data import add_derived_columns, read_dataset
+from dropout.model import load_artifact
+from dropout.scoring import score_frame
+from dropout.store import ScoreStore, refresh
+
+
+@pytest.fixture(scope='module')
+def artifact():
+    return load_artifact()
+
+
+@pytest.fixture
+def dirty_csv(tmp_path):
+    # Duplikat (dalam satu chunk maupun antar chunk) dan nilai kosong di kolom non-fitur (GDP)
+    lines = DATA_PATH.read_text(encoding='utf-8').splitlines()
+    header, rows = lines[0], lines[1:301]
+    blank = rows[3].split(';')
+    blank[35] = ''
+    rows = [rows[0], rows[0], rows[1], ';'.join(blank)] + rows[2:] + [rows[10], rows[250]]
+    path = tmp_path / 'kotor.csv'
+    path.write_text('\n'.join([header] + rows) + '\n', encoding='utf-8')
+    return path
+
+
+def test_rows_match_dashboard_index(tmp_path, artifact, dirty_csv):
+    store = ScoreStore(tmp_path / 'scores.sqlite')
+    refresh(store, artifact, dirty_csv, chunksize=64)
+    frame = add_derived_columns(read_dataset(dirty_csv))
+    students = store.query(page_size=len(frame) + 10)
+    assert students.index.tolist() == frame.index.tolist()
+    assert (students['Course'].to_numpy() == frame['Course'].to_numpy()).all()
+    np.testing.assert_allclose(students['Dropout Probability'].to_numpy(),
+                               score_frame(artifact, frame)['Dropout Probability'].to_numpy())
+
+
+def test_readme_query_finds_students(tmp_path, artifact):
+    store = ScoreStore(tmp_path / 'scores.sqlite')
+    refresh(store, artifact, DATA_PATH)
+    filters = {'risk_category': 'Risiko Tinggi', 'course_name': 'Nursing', 'tuition_up_to_date': 0}
+    assert store.count(filters) > 0
+
+
+def test_prune_drops_other_model_versions(tmp_path, artifact):
+    store = ScoreStore(tmp_path / 'scores.sqlite')
+    refresh(store, artifact, DATA_PATH)
+    hashes = np.array([1, 2], dtype=np.int64)
+    with store._connect() as conn:
+        conn.executemany("INSERT INTO scores VALUES ('versi-lama', ?, 0.5)", [(1,), (2,)])
+    assert not np.isnan(store.lookup('versi-lama', hashes)).any()
+    assert store.prune(artifact.version) == 2
+    assert np.isnan(store.lookup('versi-lama', hashes)).all()
@@ -0,0 +1,33 @@
+"""Kurva what-if memplot probabilitas kelas Dropout."""
+import pandas as pd
+import pytest
+
+from dropout.model import load_artifact
+from dropout.whatif import sensitivity
+
+RECORD = {
+    'Age at enrollment': 20,
+    'Admission grade': 130.0,
+    'Scholarship holder': 0,
+    'Curricular units 1st sem (grade)': 12.0,
+    'Tuition fees up to date': 0,
+}
+
+
+@pytest.fixture(params=[True, False], ids=['compact', 'sklearn'], scope='module')
+def artifact(request):
+    return load_artifact(compact=request.param)
+
+
+def test_baseline_is_dropout_probability(artifact):
+    result = sensitivity(artifact, RECORD, points=20)
+    frame = pd.DataFrame([RECORD], columns=artifact.feature_cols)
+    expected = artifact.predict_proba(frame)[0, artifact.dropout_index]
+    assert result.baseline == pytest.approx(expected)
+
+
+def test_paying_tuition_lowers_dropout_probability(artifact):
+    curves = sensitivity(artifact, RECORD, points=20).curves
+    tuition = curves[curves['feature'] == 'Tuition fees up to date'].set_index('value')['probability']
+    assert tuition[1] < tuition[0]
+
@@ -0,0 +1 @@
+"""Halaman-halaman dashboard; tiap modul diimpor hanya saat halamannya dibuka."""
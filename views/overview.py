@@ -0,0 +1,103 @@
+"""Halaman Overview: jumlah mahasiswa, dropout rate, distribusi status per program studi, dan drift data."""
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from dropout.aggregates import get_aggregates
+from dropout.drift import DEFAULT_CHUNKSIZE, drifted, load_profile, monitor_chunks, profile_path
+from dropout.telemetry import span
+
+from .shared import page_dataset, plotly_chart
+
+
+def current_profile_mtime():
+    try:
+        return profile_path().stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+# Drift dataset terhadap profil training, dihitung sekali per versi dataset & profil
+@st.cache_resource(show_spinner=False, max_entries=2)
+def dataset_drift(dataset_version, profile_mtime, _dataset):
+    profile = load_profile()
+    if profile is None:
+        return None, None
+    return profile, monitor_chunks(profile, [_dataset.frame]).report()
+
+
+def drift_panel(dataset):
+    st.markdown("### 🧭 Drift Data terhadap Data Training Model")
+    with span('drift'):
+        profile, report = dataset_drift(dataset.version, current_profile_mtime(), dataset)
+    if profile is None:
+        st.info("Profil data training belum ada. Jalankan `python -m dropout.drift profile` terlebih dahulu.")
+        return
+
+    uploaded = st.file_uploader("Bandingkan file intake baru (CSV, delimiter ';'):", type='csv')
+    if uploaded is not None:
+        # File dibaca per potongan; monitor hanya menyimpan statistik ringkas
+        with span('drift_upload'):
+            reader = pd.read_csv(uploaded, delimiter=';', chunksize=DEFAULT_CHUNKSIZE)
+            report = monitor_chunks(profile, (chunk.rename(columns=str.strip) for chunk in reader)).report()
+        source = uploaded.name
+    else:
+        source = "dataset dashboard"
+
+    st.dataframe(report.round(4))
+    over = drifted(report)
+    if over:
+        st.warning(f"Distribusi {source} bergeser dari data training pada: **{', '.join(over)}**. "
+                   "Pertimbangkan melatih ulang model.")
+    else:
+        st.success(f"Distribusi {source} masih sesuai dengan data training model.")
+
+    st.info("""
+    **Insight:**  
+    - PSI (Population Stability Index) < 0.1 berarti stabil, 0.1–0.25 moderat, dan ≥ 0.25 pergeseran signifikan.
+    - KS adalah selisih maksimum distribusi kumulatif; `shift_sd` adalah pergeseran rata-rata dalam simpangan baku data training.
+    - Drift pada fitur model (mis. nilai masuk atau usia) membuat prediksi risiko kurang dapat diandalkan.
+    """)
+
+
+def render():
+    st.title("🎓 Overview Mahasiswa")
+
+    dataset = page_dataset()
+
+    # Ringkasan dihitung sekali per versi dataset (lihat dropout/aggregates.py)
+    with span('aggregates'):
+        agg = get_aggregates(dataset)
+
+    # Metric info
+    col1, col2 = st.columns(2)
+    col1.metric("Total Mahasiswa", agg.total)
+    col2.metric("Dropout Rate", f"{agg.dropout_rate:.2f}%")
+
+    # Visualisasi Distribusi berdasarkan Course
+    st.markdown("### 📊 Distribusi Dropout Berdasarkan Program Studi")
+    fig1 = px.bar(agg.course_status, x='Course Name', y='Count', color='Status', barmode='group',
+                  labels={'Status': 'Status Mahasiswa', 'Count': 'Jumlah'}, height=500)
+    fig1.update_layout(xaxis_title='Program Studi', yaxis_title='Jumlah Mahasiswa')
+    plotly_chart(fig1)
+
+    st.info("""
+    **Insight:**  
+    - Beberapa program studi seperti *Informatics Engineering*, *Nursing*, dan *Management* memiliki jumlah dropout tinggi.
+    - Program seperti *Biofuel Production* dan *Oral Hygiene* relatif lebih kecil secara populasi.
+    - Visual ini membantu institusi mengidentifikasi jurusan mana yang perlu perhatian khusus dalam hal retensi mahasiswa.
+    """)
+
+    # Tabel Rata-rata nilai dan usia
+    st.markdown("### 📈 Rata-rata Nilai & Usia berdasarkan Status Mahasiswa")
+    st.dataframe(agg.status_means)
+
+    st.info("""
+    **Insight:**  
+    - Mahasiswa yang **dropout** cenderung memiliki nilai lebih rendah pada semester awal dan usia lebih tua saat masuk.
+    - Mahasiswa yang **graduate** memiliki performa akademik semester awal yang lebih baik.
+    - Institusi dapat menjadikan nilai semester pertama sebagai indikator awal untuk melakukan intervensi.
+    """)
+
+    # Drift dataset (atau file intake yang diunggah) terhadap profil training model
+    drift_panel(dataset)
@@ -0,0 +1,120 @@
+"""Halaman Prediksi: form input manual dan prediksi model SVM (tanpa memuat dataset)."""
+import pandas as pd
+import streamlit as st
+
+from dropout.charts import sensitivity_figure
+from dropout.telemetry import note_cache, span
+
+from .shared import current_model, get_prediction_cache, get_whatif_cache, plotly_chart
+
+
+def render():
+    st.title("🧠 Prediksi Dropout Mahasiswa (SVM)")
+        
+    st.markdown("### 🔧 Form Input Prediksi Manual")
+
+    age = st.number_input("Usia saat mendaftar (tahun):", min_value=15, max_value=70, value=20)
+    admission_grade = st.number_input("Nilai ujian masuk:", min_value=95.0, max_value=200.0, value=130.0)
+    scholarship = st.selectbox("Menerima beasiswa?", ['Tidak', 'Ya'])
+    grade_1st_sem = st.number_input("Nilai semester 1:", min_value=0.0, max_value=20.0, value=12.0)
+    tuition_status = st.radio("Status pembayaran:", ['Belum membayar', 'Sudah membayar'])
+
+    # Konversi input ke format numerik
+    input_data = pd.DataFrame([{
+        'Age at enrollment': age,
+        'Admission grade': admission_grade,
+        'Scholarship holder': 1 if scholarship == 'Ya' else 0,
+        'Curricular units 1st sem (grade)': grade_1st_sem,
+        'Tuition fees up to date': 1 if tuition_status == 'Sudah membayar' else 0
+    }])
+
+    # Model dilatih offline (python -m dropout.train); halaman ini hanya melakukan prediksi
+    artifact = current_model()
+    if artifact is None:
+        st.error("Model belum tersedia. Jalankan `python -m dropout.train` terlebih dahulu.")
+        st.stop()
+
+    # Prediksi (input yang sama dengan model yang sama diambil dari cache)
+    with span('predict_proba'):
+        proba = get_prediction_cache().predict_proba(artifact, input_data.iloc[0])
+    prob = proba[artifact.dropout_index]
+    
+    status = "Dropout" if proba.argmax() == artifact.dropout_index else "TIDAK Dropout"
+    st.success(f"🧾 Prediksi: {status} dengan probabilitas {prob:.2f}")
+    
+    # Tambahkan insight berdasarkan input yang diberikan
+    st.markdown("### Insight Prediksi")
+    
+    insight_container = st.container()
+    with insight_container:
+        st.markdown(f"""
+        **Analisis Parameter Mahasiswa:**
+
+        Berdasarkan parameter yang diatur:
+        - Usia Mahasiswa: **{input_data.loc[0, 'Age at enrollment']:.2f}** tahun
+        - Nilai Masuk: **{input_data.loc[0, 'Admission grade']:.2f}**
+        - Status Beasiswa: **{"Menerima" if input_data.loc[0, 'Scholarship holder'] == 1 else "Tidak Menerima"}**
+        - Nilai Semester 1: **{input_data.loc[0, 'Curricular units 1st sem (grade)']:.2f}**
+        - Status Pembayaran: **{"Tepat Waktu" if input_data.loc[0, 'Tuition fees up to date'] == 1 else "Terlambat/Belum"}**
+
+        **Hasil Analisis:**
+        """)
+
+        
+        # Insight dinamis berdasarkan probabilitas dropout
+        if prob < 0.3:
+            st.markdown(f"""
+            Mahasiswa ini memiliki **risiko dropout rendah** ({prob:.2f}). Beberapa faktor yang mungkin mempengaruhi:
+            
+            {"- Nilai semester pertama yang baik" if input_data['Curricular units 1st sem (grade)'].iloc[0] > 15 else ""}
+            {"- Nilai masuk yang tinggi" if input_data['Admission grade'].iloc[0] > 150 else ""}
+            {"- Status pembayaran tepat waktu" if input_data['Tuition fees up to date'].iloc[0] > 0.5 else ""}
+            {"- Memiliki beasiswa" if input_data['Scholarship holder'].iloc[0] > 0.5 else ""}
+            """)
+        elif prob < 0.7:
+            st.markdown(f"""
+            Mahasiswa ini memiliki **risiko dropout sedang** ({prob:.2f}). Area yang perlu diperhatikan:
+            
+            {"- Nilai semester pertama cukup rendah" if input_data['Curricular units 1st sem (grade)'].iloc[0] < 12 else ""}
+            {"- Nilai masuk di bawah rata-rata" if input_data['Admission grade'].iloc[0] < 130 else ""}
+            {"- Status pembayaran perlu diperhatikan" if input_data['Tuition fees up to date'].iloc[0] < 0.5 else ""}
+            {"- Tidak memiliki beasiswa" if input_data['Scholarship holder'].iloc[0] < 0.5 else ""}
+            """)
+        else:
+            st.markdown(f"""
+            Mahasiswa ini memiliki **risiko dropout tinggi** ({prob:.2f}). Faktor risiko utama:
+            
+            {"- Nilai semester pertama sangat rendah" if input_data['Curricular units 1st sem (grade)'].iloc[0] < 8 else ""}
+            {"- Nilai masuk rendah" if input_data['Admission grade'].iloc[0] < 110 else ""}
+            {"- Masalah dalam pembayaran biaya kuliah" if input_data['Tuition fees up to date'].iloc[0] < 0.5 else ""}
+            {"- Tidak memiliki dukungan beasiswa" if input_data['Scholarship holder'].iloc[0] < 0.5 else ""}
+            """)
+        
+        # Kurva what-if: tiap fitur disapu sepanjang rentang form (fitur lain tetap),
+        # seluruh grid di-score dengan satu predict_proba dan di-cache per input
+        st.markdown("**Analisis What-If:**")
+        whatif_cache = get_whatif_cache()
+        with span('whatif'):
+            whatif = whatif_cache.sensitivity(artifact, input_data.iloc[0])
+        note_cache('Cache what-if', whatif_cache.stats())
+        plotly_chart(sensitivity_figure(whatif.curves, whatif.baseline, input_data.iloc[0]),
+                     use_container_width=True)
+        swing = whatif.swing()
+        top_feature = swing.index[0]
+        st.markdown(f"""
+        Garis putus-putus menunjukkan probabilitas saat ini ({whatif.baseline:.2f}), garis merah nilai input saat ini.
+        Fitur paling berpengaruh untuk mahasiswa ini adalah **{top_feature}**: probabilitas bergerak antara
+        {swing.loc[top_feature, 'min']:.2f} dan {swing.loc[top_feature, 'max']:.2f} sepanjang rentangnya.
+        """)
+        st.dataframe(swing.round(3))
+        
+        st.markdown("""
+        **Rekomendasi:**
+        """)
+        
+        if prob < 0.3:
+            st.markdown("Mahasiswa ini memiliki prospek yang baik untuk menyelesaikan studi. Tetap pantau perkembangan akademiknya.")
+        elif prob < 0.7:
+            st.markdown("Pertimbangkan untuk memberikan pendampingan akademik dan konseling keuangan jika diperlukan.")
+        else:
+            st.markdown("Mahasiswa ini membutuhkan intervensi segera. Rekomendasikan program bimbingan intensif dan evaluasi dukungan finansial.")
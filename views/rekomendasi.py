@@ -0,0 +1,310 @@
+"""Halaman Rekomendasi: filter kohort ter-scoring, rekomendasi program, dan daftar mahasiswa."""
+import numpy as np
+import plotly.express as px
+import streamlit as st
+
+from dropout.charts import box_figure, histogram_figure
+from dropout.config import COURSE_MAPPING
+from dropout.filters import cohort_summary
+from dropout.recommendations import PROGRAM_COLS, recommendation_csv
+from dropout.telemetry import note_cache, span
+
+from .shared import current_model, get_cohort_index, get_score_store, page_dataset, plotly_chart
+
+
+def render():
+    st.title("📌 Rekomendasi Strategis")
+
+    dataset = page_dataset()
+    
+    st.markdown("""
+    Berdasarkan hasil analisis dan prediksi, berikut rekomendasi untuk mengurangi risiko dropout:
+    """)
+    
+    # Tambahkan filter untuk melihat data yang menjadi objek rekomendasi
+    st.sidebar.markdown("### Filter Data")
+    st.sidebar.markdown("Gunakan filter berikut untuk menyesuaikan visualisasi dan rekomendasi:")
+    
+    # Filter berdasarkan kriteria risiko
+    risk_category = st.sidebar.radio(
+        "Kategori Risiko Dropout:",
+        ["Semua Mahasiswa", "Risiko Tinggi", "Risiko Sedang", "Risiko Rendah"]
+    )
+    
+    # Gunakan model yang sudah dimuat sekali per proses (jika ada)
+    artifact = current_model()
+    has_model = artifact is not None
+    
+    # Probabilitas dropout + kategori risiko seluruh mahasiswa dan indeks baris per
+    # kategori risiko/program studi; dihitung sekali per versi dataset & model
+    with span('cohort_index'):
+        cohort = get_cohort_index(dataset.version, artifact.version if has_model else None, dataset, artifact)
+    ip = cohort.frame
+    
+    # Filter data berdasarkan kategori risiko yang dipilih (irisan indeks, tanpa menyalin frame)
+    filters = {'Risk Category': None, 'Course Name': None}
+    if risk_category != "Semua Mahasiswa" and has_model:
+        filters['Risk Category'] = risk_category
+    
+    # Tampilkan jumlah mahasiswa terfilter
+    st.sidebar.markdown(f"**Jumlah mahasiswa terfilter:** {len(cohort.select(filters))}")
+    
+    # Tambahkan filter untuk program studi
+    available_courses = ['Semua Course'] + sorted(COURSE_MAPPING.values())
+    
+    selected_course = st.sidebar.selectbox(
+        "Program Studi:",
+        available_courses
+    )
+    
+    if selected_course != 'Semua Course':
+        filters['Course Name'] = selected_course
+    
+    # Semua angka/tabel panel di bawah, di-cache per kombinasi filter
+    with span('cohort_summary'):
+        summary = cohort.summary(filters, cohort_summary)
+    filtered_positions = cohort.select(filters)
+    
+    if selected_course != 'Semua Course':
+        st.sidebar.markdown(f"**Jumlah mahasiswa dalam program {selected_course}:** {summary.count}")
+    
+    # Tampilkan rekomendasi strategis dalam 4 kolom
+    col1, col2 = st.columns(2)
+    col3, col4 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 💸 Evaluasi Pembayaran")
+        payment_data = summary.payment_counts
+        if not payment_data.empty:
+            payment_fig = px.pie(
+                names=['Belum Bayar', 'Sudah Bayar'], 
+                values=payment_data.iloc[:, 0] if 0 in payment_data.columns else [0, 0],
+                title="Status Pembayaran Mahasiswa Dropout"
+            )
+            plotly_chart(payment_fig, use_container_width=True)
+            
+            # Insight untuk pembayaran
+            pct_unpaid = summary.pct_unpaid
+            st.markdown(f"""
+            **Insight:**
+            - {pct_unpaid:.1%} mahasiswa memiliki status pembayaran terlambat/belum membayar
+            - Mahasiswa dengan status pembayaran belum selesai memiliki risiko dropout lebih tinggi
+            
+            **Rekomendasi:**
+            - Buat sistem peringatan dini untuk pembayaran
+            - Tawarkan opsi pembayaran fleksibel untuk mahasiswa berisiko
+            """)
+    
+    with col2:
+        st.markdown("### 🎓 Intervensi Akademik")
+        # Histogram dari jumlah per bin (dihitung di server), bukan dari seluruh baris
+        grade_fig = histogram_figure(
+            summary.grade_hist,
+            x_title='Curricular units 1st sem (grade)',
+            legend_title='Target',
+            title="Distribusi Nilai Semester 1"
+        )
+        plotly_chart(grade_fig, use_container_width=True)
+        
+        # Insight untuk nilai akademik
+        avg_grade = summary.avg_grade
+        risk_threshold = summary.grade_q25
+        st.markdown(f"""
+        **Insight:**
+        - Rata-rata nilai semester 1: {avg_grade:.2f}
+        - Nilai di bawah {risk_threshold:.2f} berpotensi tinggi untuk dropout
+        
+        **Rekomendasi:**
+        - Program bimbingan akademik untuk mahasiswa dengan nilai < {risk_threshold:.2f}
+        - Sesi tambahan untuk mata kuliah dengan tingkat kesulitan tinggi
+        """)
+    
+    with col3:
+        st.markdown("### 🎯 Alokasi Beasiswa")
+        scholarship_data = summary.scholarship_counts
+        if not scholarship_data.empty:
+            scholarship_fig = px.bar(
+                scholarship_data.reset_index(),
+                x='Scholarship holder',
+                y=[0, 1] if all(col in scholarship_data.columns for col in [0, 1]) else [0] if 0 in scholarship_data.columns else [1],
+                barmode='group',
+                title="Pengaruh Beasiswa terhadap Status Dropout",
+                labels={'Scholarship holder': 'Status Beasiswa', 'value': 'Jumlah Mahasiswa', 'variable': 'Status'},
+                color_discrete_map={0: 'red', 1: 'green'}
+            )
+            scholarship_fig.update_layout(xaxis=dict(tickmode='array', tickvals=[0, 1], ticktext=['Tanpa Beasiswa', 'Dengan Beasiswa']))
+            plotly_chart(scholarship_fig, use_container_width=True)
+            
+            # Insight untuk beasiswa
+            pct_scholarship = summary.pct_scholarship
+            st.markdown(f"""
+            **Insight:**
+            - {pct_scholarship:.1%} mahasiswa menerima beasiswa
+            - Beasiswa dapat mengurangi tingkat dropout secara signifikan
+            
+            **Rekomendasi:**
+            - Prioritaskan beasiswa untuk mahasiswa berisiko tinggi dropout
+            - Tingkatkan jumlah dan cakupan program beasiswa
+            """)
+    
+    with col4:
+        st.markdown("### 📚 Konsultasi Usia")
+        age_fig = box_figure(
+            summary.age_box,
+            x_title='Target',
+            y_title='Age at enrollment',
+            title="Distribusi Usia saat Pendaftaran"
+        )
+        plotly_chart(age_fig, use_container_width=True)
+        
+        # Insight untuk usia
+        avg_age = summary.avg_age
+        risk_age = summary.dropout_age
+        st.markdown(f"""
+        **Insight:**
+        - Rata-rata usia: {avg_age:.2f} tahun
+        - Mahasiswa dropout rata-rata berusia {risk_age:.2f} tahun
+        
+        **Rekomendasi:**
+        - Program khusus untuk mahasiswa non-tradisional (usia lebih tua)
+        - Konseling karir untuk mahasiswa dewasa
+        """)
+    
+    # Content-Based Filtering untuk rekomendasi program intervensi
+    st.markdown("### 📊 Rekomendasi Program Intervensi")
+    st.markdown("""
+    Sistem rekomendasi ini menggunakan metode **Content-Based Filtering** untuk menyarankan program intervensi
+    berdasarkan karakteristik mahasiswa. Program ini disesuaikan dengan profil dan kebutuhan spesifik mahasiswa.
+    """)
+    
+    # Simulasi sistem rekomendasi
+    if has_model:
+        # Contoh sampel mahasiswa untuk rekomendasi
+        sample_size = min(5, len(filtered_positions))
+        sample_students = ip.take(np.random.choice(filtered_positions, sample_size, replace=False))
+        
+        # Tampilkan rekomendasi untuk sampel mahasiswa
+        st.markdown("#### Contoh Rekomendasi Program untuk Mahasiswa")
+        
+        for i, (idx, student) in enumerate(sample_students.iterrows()):
+            risk_level = student['Risk Category']
+            final_recommendations = [student[col] for col in PROGRAM_COLS]
+            
+            # Tampilkan profil mahasiswa dan rekomendasi
+            expander = st.expander(f"Mahasiswa #{i+1} - {risk_level}")
+            with expander:
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.markdown("**Profil Mahasiswa:**")
+                    st.markdown(f"- Usia: {student['Age at enrollment']:.1f} tahun")
+                    st.markdown(f"- Nilai Masuk: {student['Admission grade']:.1f}")
+                    st.markdown(f"- Nilai Semester 1: {student['Curricular units 1st sem (grade)']:.1f}")
+                    st.markdown(f"- Status Beasiswa: {'Ya' if student['Scholarship holder'] == 1 else 'Tidak'}")
+                    st.markdown(f"- Status Pembayaran: {'Tepat Waktu' if student['Tuition fees up to date'] == 1 else 'Terlambat/Belum'}")
+                    if 'Course' in student:
+                        st.markdown(f"- Program Studi: {student['Course']}")
+                
+                with col2:
+                    st.markdown("**Program yang Direkomendasikan:**")
+                    for j, program in enumerate(final_recommendations):
+                        st.markdown(f"{j+1}. {program}")
+        
+        # Rekomendasi seluruh mahasiswa terfilter, di-cache per kombinasi filter
+        with span('recommendation_csv'):
+            recommendation_bytes = cohort.summary(filters, recommendation_csv)
+        st.download_button(
+            "Unduh Rekomendasi Semua Mahasiswa Terfilter (CSV)",
+            data=recommendation_bytes,
+            file_name="rekomendasi.csv",
+            mime="text/csv",
+        )
+    
+    # Daftar mahasiswa langsung dari store SQLite berindeks, per halaman
+    store = get_score_store(dataset.version, artifact.version, dataset, artifact) if has_model else None
+    if store is not None:
+        st.markdown("### 📋 Daftar Mahasiswa")
+        flag_col1, flag_col2, flag_col3 = st.columns(3)
+        with flag_col1:
+            only_unpaid = st.checkbox("Hanya yang biaya kuliahnya belum lunas")
+        with flag_col2:
+            only_debtor = st.checkbox("Hanya debitur")
+        with flag_col3:
+            only_no_scholarship = st.checkbox("Hanya tanpa beasiswa")
+        
+        store_filters = {
+            'risk_category': filters['Risk Category'],
+            'course_name': filters['Course Name'],
+            'tuition_up_to_date': 0 if only_unpaid else None,
+            'debtor': 1 if only_debtor else None,
+            'scholarship': 0 if only_no_scholarship else None,
+        }
+        with span('store_query'):
+            total_rows = store.count(store_filters)
+        page_size = 25
+        total_pages = max(1, -(-total_rows // page_size))
+        page_number = st.number_input("Halaman", min_value=1, max_value=total_pages, value=1, step=1)
+        with span('store_query'):
+            student_page = store.query(store_filters, page_number, page_size, sort='probability')
+        st.dataframe(student_page)
+        st.caption(f"Halaman {page_number} dari {total_pages} ({total_rows} mahasiswa), "
+                   "diurutkan dari probabilitas dropout tertinggi")
+    
+    # Tambahkan insight visualisasi admission grade dari kode asli
+    st.markdown("### 📈 Analisis Nilai Masuk")
+    admission_fig = histogram_figure(
+        summary.admission_hist,
+        title="Distribusi Nilai Masuk Berdasarkan Status Dropout",
+        x_title='Nilai Masuk',
+        color_map={0: 'red', 1: 'blue', 2: 'green'}
+    )
+    
+    # Tambahkan legenda yang lebih informatif
+    admission_fig.update_layout(
+        legend=dict(
+            title="Status Mahasiswa",
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+    
+    plotly_chart(admission_fig)
+    
+    # Insight untuk nilai masuk
+    mean_dropout = summary.admission_mean_dropout
+    mean_graduate = summary.admission_mean_graduate
+    threshold = summary.admission_q25
+    
+    st.markdown(f"""
+    **Insight Nilai Masuk:**
+    - Rata-rata nilai masuk mahasiswa dropout: {mean_dropout:.2f}
+    - Rata-rata nilai masuk mahasiswa lulus: {mean_graduate:.2f}
+    - Nilai masuk di bawah {threshold:.2f} menunjukkan risiko dropout lebih tinggi
+    
+    **Rekomendasi:**
+    - Pertimbangkan program persiapan untuk mahasiswa dengan nilai masuk rendah
+    - Evaluasi kembali standar penerimaan untuk program studi tertentu
+    - Integrasikan program pengenalan kampus yang lebih komprehensif untuk mahasiswa baru
+    """)
+    
+    # Tambahkan kesimpulan umum
+    st.markdown("### 🔍 Kesimpulan dan Rekomendasi Umum")
+    st.markdown("""
+    Berdasarkan analisis data di atas, sistem rekomendasi kami mengidentifikasi beberapa faktor utama yang memengaruhi risiko dropout mahasiswa:
+    
+    1. **Faktor Akademik**: Nilai masuk dan performa semester pertama menjadi indikator kuat risiko dropout.
+    2. **Faktor Finansial**: Status pembayaran dan dukungan beasiswa sangat memengaruhi kelangsungan studi.
+    3. **Faktor Demografis**: Usia saat pendaftaran dapat menjadi indikator tambahan untuk menyesuaikan dukungan.
+    
+    **Rekomendasi Strategis Komprehensif:**
+    
+    - **Sistem Peringatan Dini**: Implementasikan sistem monitoring untuk mengidentifikasi mahasiswa berisiko sejak dini
+    - **Program Dukungan Terintegrasi**: Gabungkan dukungan akademik, finansial, dan sosial secara personal
+    - **Evaluasi Berkala**: Lakukan penilaian rutin terhadap efektivitas intervensi yang dilakukan
+    - **Peningkatan Engagement**: Kembangkan program keterlibatan mahasiswa untuk meningkatkan rasa memiliki
+    """)
+
+    # Hit rate cache ringkasan filter untuk panel debug
+    note_cache('Cache ringkasan filter', cohort.stats())
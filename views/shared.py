@@ -0,0 +1,117 @@
+"""Resource bersama halaman dashboard (di-cache per proses lewat ``st.cache_resource``).
+
+Import modul berat (joblib/scikit-learn, SQLite store, filter/plotly) dilakukan
+di dalam fungsi agar hanya dimuat oleh halaman yang benar-benar memakainya.
+"""
+import streamlit as st
+
+from dropout.config import MODEL_PATH
+from dropout.data import load_dataset
+from dropout.telemetry import span
+
+
+def page_dataset():
+    """Dataset bersih bersama semua sesi (lihat dropout/data.py).
+
+    Kolom Target sudah di-encode, kolom 'Status' dan 'Course Name' sudah
+    tersedia; frame-nya read-only, jangan dimutasi.
+    """
+    with span('load_dataset'):
+        return load_dataset()
+
+
+# Model dimuat sekali per proses; mtime semua file artefak ikut jadi key cache
+# sehingga model baru hasil `python -m dropout.train` langsung terpakai
+@st.cache_resource(show_spinner=False)
+def get_model(mtimes):
+    from dropout.model import load_artifact
+
+    return load_artifact(MODEL_PATH)
+
+
+def _artifact_mtimes():
+    """mtime joblib, metadata JSON, dan artefak ringkas (None jika tidak ada).
+
+    Ketiganya ditulis terpisah; model yang dimuat di tengah penulisan ulang
+    tersimpan di bawah key lama dan dimuat ulang begitu file terakhir berubah.
+    """
+    from dropout.compact import compact_path
+    from dropout.model import metadata_path
+
+    mtimes = []
+    for path in (MODEL_PATH, metadata_path(MODEL_PATH), compact_path(MODEL_PATH)):
+        try:
+            mtimes.append(path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def current_model():
+    with span('load_model'):
+        mtimes = _artifact_mtimes()
+        if mtimes[0] is None:
+            return None
+        return get_model(mtimes)
+
+
+# Cache LRU hasil prediksi form, dipakai bersama semua sesi dalam proses ini
+@st.cache_resource(show_spinner=False)
+def get_prediction_cache():
+    from dropout.cache import PredictionCache
+
+    return PredictionCache(maxsize=1024)
+
+
+# Cache LRU kurva what-if per input (lihat dropout/whatif.py), dipakai bersama semua sesi
+@st.cache_resource(show_spinner=False)
+def get_whatif_cache():
+    from dropout.whatif import SensitivityCache
+
+    return SensitivityCache(maxsize=256)
+
+
+# Store skor SQLite yang tabel students-nya sesuai versi dataset & model (lihat dropout/store.py).
+# Refresh hanya mem-predict baris baru/berubah, lalu skor versi model lain dihapus
+# agar tidak menumpuk tiap kali model diganti; None jika store tidak bisa dibuka.
+@st.cache_resource(show_spinner=False, max_entries=2)
+def get_score_store(dataset_version, model_version, _dataset, _artifact):
+    import sqlite3
+
+    from dropout.store import ScoreStore, refresh
+
+    try:
+        store = ScoreStore()
+        if not store.is_current(dataset_version, model_version):
+            refresh(store, _artifact, _dataset.path)
+            store.prune(model_version)
+        return store
+    except (sqlite3.Error, OSError):
+        # Store hanya optimasi; filesystem read-only tetap boleh
+        return None
+
+
+# Cohort ter-scoring beserta indeks filter, dihitung sekali per versi dataset & model
+@st.cache_resource(show_spinner=False, max_entries=2)
+def get_cohort_index(dataset_version, model_version, _dataset, _artifact):
+    from dropout.filters import FilterIndex
+    from dropout.recommendations import recommend
+    from dropout.scoring import score_frame
+
+    if _artifact is None:
+        return FilterIndex(_dataset.frame, ['Course Name'])
+    store = get_score_store(dataset_version, model_version, _dataset, _artifact)
+    if store is not None:
+        scores = store.score_frame(_artifact, _dataset.frame)
+    else:
+        scores = score_frame(_artifact, _dataset.frame)
+    scored = _dataset.frame.join(scores)
+    # Rekomendasi program untuk seluruh mahasiswa (aturan vektorisasi, lihat dropout/recommendations.py)
+    scored = scored.join(recommend(scored))
+    return FilterIndex(scored, ['Risk Category', 'Course Name'])
+
+
+# Serialisasi figure ke frontend ikut diukur sebagai span tersendiri
+def plotly_chart(fig, **kwargs):
+    with span('plotly_chart'):
+        st.plotly_chart(fig, **kwargs)
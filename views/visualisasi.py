@@ -0,0 +1,86 @@
+"""Halaman Visualisasi: korelasi fitur dan distribusi status per fitur numerik/kategorikal."""
+import plotly.express as px
+import streamlit as st
+
+from dropout.aggregates import BOX_FEATURES, CATEGORICAL_FEATURES, get_aggregates
+from dropout.charts import box_figure, correlation_png
+from dropout.telemetry import span
+
+from .shared import page_dataset, plotly_chart
+
+
+# PNG korelasi hanya bergantung pada dataset: dirender sekali per versi dan dipakai
+# bersama semua sesi, bukan satu figure matplotlib per rerun
+@st.cache_resource(show_spinner=False, max_entries=2)
+def correlation_chart(dataset_version, _target_corr):
+    return correlation_png(_target_corr)
+
+
+def render():
+    st.title("📈 Visualisasi Performa & Demografi Mahasiswa")
+
+    dataset = page_dataset()
+
+    # Ringkasan dihitung sekali per versi dataset (lihat dropout/aggregates.py)
+    with span('aggregates'):
+        agg = get_aggregates(dataset)
+
+    # Korelasi Numerik terhadap Target
+    st.subheader("📊 Korelasi Fitur Numerik terhadap Status Mahasiswa")
+    with span('correlation_chart'):
+        st.image(correlation_chart(dataset.version, agg.target_corr), width='stretch')
+
+    st.info("""
+    **Insight:**  
+    - Fitur seperti `Curricular units approved` dan `Tuition fees up to date` berkorelasi positif dengan kelulusan.  
+    - Fitur seperti `Debtor`, `Age at enrollment`, dan `Application mode` berkorelasi negatif (cenderung dropout).
+    """)
+
+    # Visualisasi Multivariate: Distribusi Fitur Berdasarkan Status
+    st.subheader("📉 Distribusi Fitur Numerik Berdasarkan Status Mahasiswa")
+
+    # Box plot dari statistik kuartil yang sudah dihitung, bukan dari seluruh baris
+    for feature in BOX_FEATURES:
+        fig_box = box_figure(agg.status_boxes[feature], x_title='Status', y_title=feature,
+                             color_sequence=px.colors.qualitative.Set2,
+                             title=f"Distribusi {feature} berdasarkan Status Mahasiswa")
+        plotly_chart(fig_box)
+
+    st.info("""
+    **Insight Multivariat:**  
+    - Mahasiswa dropout cenderung memiliki nilai lebih rendah pada fitur `Curricular units approved`.  
+    - Mereka juga lebih banyak menunggak pembayaran (`Tuition fees up to date`) dan usia pendaftarannya cenderung lebih tinggi.
+    """)
+
+    # Distribusi Mahasiswa berdasarkan Course
+    st.subheader("🎓 Distribusi Mahasiswa Berdasarkan Program Studi")
+    fig_course = px.bar(agg.course_status, x='Course Name', y='Count', color='Status',
+                        title='Distribusi Status Mahasiswa per Program Studi',
+                        color_discrete_sequence=px.colors.qualitative.Pastel)
+    fig_course.update_layout(xaxis_tickangle=-45)
+    plotly_chart(fig_course)
+
+    st.info("""
+    **Insight:**  
+    - Beberapa program studi seperti **Social Service** dan **Management** memiliki jumlah dropout lebih tinggi.
+    - Hal ini dapat membantu fokus intervensi per jurusan.
+    """)
+
+    # Proporsi Status Mahasiswa Berdasarkan Gender, Debtor, dan Application mode
+    st.subheader("📊 Proporsi Status Mahasiswa Berdasarkan Fitur Kategorikal")
+
+    for feature in CATEGORICAL_FEATURES:
+        # Persentase status per kategori (long format) sudah dihitung di agregat
+        fig = px.bar(agg.category_status[feature], x=feature, y='Persentase', color='Status', barmode='stack',
+                    title=f"Proporsi Status Mahasiswa berdasarkan {feature}",
+                    labels={'Persentase': 'Persentase (%)'},
+                    color_discrete_sequence=px.colors.qualitative.Set2)
+        plotly_chart(fig)
+
+    # Insight naratif
+    st.info("""
+    **Insight Multivariat:**  
+    - Mahasiswa dengan status **Debtor = Yes** memiliki rasio dropout jauh lebih tinggi.  
+    - Beberapa kategori di **Application mode** seperti mode 1 dan 17 mendominasi dropout.  
+    - Perbedaan berdasarkan **Gender** tidak terlalu besar, namun dropout sedikit lebih banyak terjadi pada laki-laki.
+    """)
@@ -0,0 +1,106 @@
+"""Warm-up resource dashboard di proses server sebelum Streamlit mulai melayani.
+
+Dataset, model, agregat, indeks kohort (termasuk refresh store skor), grafik
+korelasi, drift dataset, ringkasan filter default, dan modul halaman dihitung
+paralel di thread pool, mengikuti dependensinya. Semuanya masuk ke cache proses yang sama
+(``st.cache_resource`` dan cache modul ``dropout``) yang dipakai sesi, jadi
+tidak ada request pertama yang membayar cold path. Durasi tiap artefak dicetak
+ke log.
+
+Server baru dijalankan setelah warm-up selesai, sehingga ``/_stcore/health``
+baru menjawab (dan HEALTHCHECK docker baru sehat) ketika semuanya siap:
+    python -m views.warmup [opsi streamlit run ...]
+    python -m views.warmup --warmup-only
+"""
+import importlib
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from dropout.config import BASE_DIR
+
+APP_PATH = BASE_DIR / "dashboard.py"
+PAGE_MODULES = ('views.overview', 'views.visualisasi', 'views.prediksi', 'views.rekomendasi')
+
+
+def _log(message):
+    print(f"[warmup] {message}", flush=True)
+
+
+def warm_up(max_workers=4):
+    """Isi semua cache proses; kembalikan dict nama artefak -> detik."""
+    from dropout.aggregates import get_aggregates
+    from dropout.filters import cohort_summary
+    from dropout.recommendations import recommendation_csv
+
+    from . import shared
+
+    timings = {}
+
+    def timed(name, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        timings[name] = time.perf_counter() - start
+        _log(f"{name:<22} {timings[name] * 1000:9.1f} ms")
+        return result
+
+    def pages():
+        for module in PAGE_MODULES:
+            importlib.import_module(module)
+
+    def cohort(dataset, artifact):
+        index = shared.get_cohort_index(dataset.version, artifact.version if artifact else None, dataset, artifact)
+        # Tampilan awal halaman Rekomendasi: tanpa filter
+        filters = {'Risk Category': None, 'Course Name': None}
+        index.summary(filters, cohort_summary)
+        if artifact is not None:
+            index.summary(filters, recommendation_csv)
+        return index
+
+    def drift(dataset):
+        from .overview import current_profile_mtime, dataset_drift
+
+        return dataset_drift(dataset.version, current_profile_mtime(), dataset)
+
+    def correlation(dataset, agg):
+        from .visualisasi import correlation_chart
+
+        return correlation_chart(dataset.version, agg.target_corr)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # Tahap 1 saling independen; tahap berikutnya menunggu dependensinya saja
+        dataset_f = pool.submit(timed, 'dataset', shared.page_dataset)
+        model_f = pool.submit(timed, 'model', shared.current_model)
+        pages_f = pool.submit(timed, 'page_modules', pages)
+        dataset = dataset_f.result()
+        agg_f = pool.submit(timed, 'aggregates', get_aggregates, dataset)
+        cohort_f = pool.submit(timed, 'cohort_index', cohort, dataset, model_f.result())
+        pages_f.result()
+        drift_f = pool.submit(timed, 'drift', drift, dataset)
+        correlation_f = pool.submit(timed, 'correlation_chart', correlation, dataset, agg_f.result())
+        for future in (cohort_f, drift_f, correlation_f):
+            future.result()
+    timings['total'] = time.perf_counter() - start
+    _log(f"{'total':<22} {timings['total'] * 1000:9.1f} ms")
+    return timings
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    warmup_only = '--warmup-only' in argv
+    if warmup_only:
+        argv.remove('--warmup-only')
+
+    warm_up()
+    if warmup_only:
+        return
+
+    from streamlit.web import cli
+
+    sys.argv = ['streamlit', 'run', str(APP_PATH), *argv]
+    sys.exit(cli.main())
+
+
+if __name__ == '__main__':
+    main()